@@ -0,0 +1,27 @@
+"""
+Calculations for brewing beer.
+
+The submodules are imported on first attribute access, so `import beerpy`
+is cheap and e.g. `beerpy.receipe.malt_composition` works without an
+explicit import of `beerpy.receipe`.
+
+"""
+
+import importlib
+
+
+_submodules = ("accessor", "alcohol", "batch", "brewhouse", "carbonate",
+               "cli", "diskcache", "fermentation", "instrument",
+               "interpolation", "lut", "optimize", "receipe", "service",
+               "simulation", "sweep", "units", "utilities")
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -0,0 +1,222 @@
+"""
+pandas accessors for brewing calculations.
+
+Importing this module registers the `beer` accessor on `pandas.Series` and
+`pandas.DataFrame`. The calculations run on whole columns by the vectorized
+functions of beerpy, the results keep the index of the data. Example::
+
+    >>> import pandas as pd
+    >>> import beerpy.accessor
+    >>> log = pd.DataFrame({"og": [1.048, 1.056], "fg": [1.012, 1.014],
+    ...                     "temperature": [12.0, 18.0]}, index=["A", "B"])
+    >>> log.beer.abv("og", "fg", unit="kg/m³").round(2)
+    A    4.50
+    B    5.13
+    Name: abv, dtype: float64
+    >>> log["og"].beer.sg_to_plato().round(1)
+    A    12.0
+    B    13.8
+    Name: og, dtype: float64
+
+pandas is an optional dependency and only needed for this module.
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import receipe
+from .alcohol import alcohols
+from .carbonate import saturation
+from .units import registry
+from .units.gravity import PLATO, SPECIFIC_GRAVITY, plato_to_sg, sg_to_plato
+from .units.temperature import CELSIUS, _celsius_to_fahrenheit, \
+    _fahrenheit_to_celsius
+
+
+ACCESSOR = "beer"
+
+
+def _values(obj) -> np.ndarray:
+    return np.asarray(obj, dtype=float)
+
+
+def _convert(values, unit, target, fct):
+    return registry.converter(unit, target, vectorized=True)(
+        _values(values), fct)
+
+
+def _plato(values, unit, fct):
+    return _convert(values, unit, PLATO, fct)
+
+
+@pd.api.extensions.register_series_accessor(ACCESSOR)
+class BeerSeriesAccessor:
+    """
+    Brewing calculations on the values of a Series, available as
+    `series.beer`.
+
+    """
+
+    def __init__(self, obj: pd.Series):
+        self._obj = obj
+
+    def _series(self, values, name=None) -> pd.Series:
+        return pd.Series(values, index=self._obj.index,
+                         name=self._obj.name if name is None else name)
+
+    def _aligned(self, other):
+        if isinstance(other, pd.Series):
+            other = other.reindex(self._obj.index)
+        return _values(other)
+
+    def sg_to_plato(self, fct=None) -> pd.Series:
+        """
+        :param fct: conversion function, None for the default
+        :returns: the specific gravities converted to °Pl
+
+        """
+        return self._series(sg_to_plato(_values(self._obj), fct))
+
+    def plato_to_sg(self, fct=None) -> pd.Series:
+        """
+        :param fct: conversion function, None for the default
+        :returns: the gravities in °Pl converted to specific gravity
+
+        """
+        return self._series(plato_to_sg(_values(self._obj), fct))
+
+    def celsius_to_fahrenheit(self) -> pd.Series:
+        return self._series(_celsius_to_fahrenheit(_values(self._obj)))
+
+    def fahrenheit_to_celsius(self) -> pd.Series:
+        return self._series(_fahrenheit_to_celsius(_values(self._obj)))
+
+    def abv(self, fg=None) -> pd.Series:
+        """
+        Alcohol of the original gravities in °Pl.
+
+        :param fg: final gravities in °Pl, a Series is aligned on the index
+        :returns: alcohol in %
+
+        """
+        fg = None if fg is None else self._aligned(fg)
+        return self._series(alcohols(_values(self._obj), fg), "abv")
+
+    def saturation(self, unit=CELSIUS) -> pd.Series:
+        """
+        Carbonate saturation concentration of the temperatures.
+
+        :param unit: unit of the temperatures
+        :returns: carbonate saturation concentration in g/l
+
+        """
+        return self._series(saturation(_values(self._obj), unit),
+                            "saturation")
+
+
+@pd.api.extensions.register_dataframe_accessor(ACCESSOR)
+class BeerDataFrameAccessor:
+    """
+    Brewing calculations on the columns of a DataFrame, available as
+    `df.beer`. The columns are given by name, gravity columns are in `unit`
+    and converted by the conversion function `fct`.
+
+    """
+
+    def __init__(self, obj: pd.DataFrame):
+        self._obj = obj
+
+    def _series(self, values, name) -> pd.Series:
+        return pd.Series(values, index=self._obj.index, name=name)
+
+    def _column(self, name) -> np.ndarray:
+        return _values(self._obj[name])
+
+    def plato(self, gravity="gravity", unit=PLATO, fct=None) -> pd.Series:
+        """
+        :returns: the gravity column in °Pl
+
+        """
+        return self._series(_plato(self._obj[gravity], unit, fct), "plato")
+
+    def sg(self, gravity="gravity", unit=PLATO, fct=None) -> pd.Series:
+        """
+        :returns: the gravity column as specific gravity
+
+        """
+        return self._series(
+            _convert(self._obj[gravity], unit, SPECIFIC_GRAVITY, fct), "sg")
+
+    def abv(self, og="og", fg=None, unit=PLATO, fct=None) -> pd.Series:
+        """
+        Alcohol from the original and, if given, the final gravity column.
+
+        :returns: alcohol in %
+
+        """
+        og = _plato(self._obj[og], unit, fct)
+        if fg is not None:
+            fg = _plato(self._obj[fg], unit, fct)
+        return self._series(alcohols(og, fg), "abv")
+
+    def saturation(self, temperature="temperature",
+                   unit=CELSIUS) -> pd.Series:
+        """
+        :returns: carbonate saturation concentration in g/l of the
+            temperature column
+
+        """
+        return self._series(saturation(self._column(temperature), unit),
+                            "saturation")
+
+    def carbonation(self, carbonate="carbonate", temperature="temperature",
+                    unit=CELSIUS) -> pd.Series:
+        """
+        Necessary carbonation to achieve the aimed carbonate concentrations
+        of the carbonate column at the fermentation temperatures.
+
+        :returns: carbonation in g/l
+
+        """
+        sat = saturation(self._column(temperature), unit)
+        return self._series(self._column(carbonate) - sat, "carbonation")
+
+    def hops(self, ibu="ibu", alpha="alpha", volume="volume",
+             cooktime="cooktime", gravity="gravity", unit=PLATO,
+             fct=None) -> pd.Series:
+        """
+        Amount of hops to achieve the bitterness of the ibu column, see
+        `receipe.hop_quantity`.
+
+        :returns: amount of hops in grams
+
+        """
+        return self._series(receipe.hop_quantities(
+            self._column(ibu), self._column(alpha), self._column(volume),
+            self._column(cooktime), _plato(self._obj[gravity], unit, fct)),
+            "hops")
+
+    def malt(self, malts: '[(Malt, float),...]', volume="volume",
+             gravity="gravity", efficiency=0.75, unit=PLATO,
+             fct=None) -> pd.DataFrame:
+        """
+        Malt composition of each row, see `receipe.malt_composition`.
+
+        :param malts: list of tuples (Malt, share)
+        :param efficiency: efficiency as number or name of a column
+        :returns: DataFrame with the weight in kg of each malt and the
+            total weight in column "total"
+
+        """
+        if isinstance(efficiency, str):
+            efficiency = self._column(efficiency)
+        res = receipe.malt_compositions(
+            self._column(volume), _plato(self._obj[gravity], unit, fct),
+            [malt for malt, _ in malts], [share for _, share in malts],
+            efficiency
+        )
+        columns = {malt.name: res.weights[:, i]
+                   for i, (malt, _) in enumerate(malts)}
+        columns["total"] = res.total_weight
+        return pd.DataFrame(columns, index=self._obj.index)
@@ -7,7 +7,9 @@ licensed under the MIT license
 """
 
 
-from .units.gravity import Gravity
+import numpy as np
+
+from .units.gravity import Gravity, GravityArray
 
 
 class Alcohol:
@@ -34,3 +36,26 @@ def alcohol(og: Gravity, fg: Gravity=None) -> Alcohol:
         return Alcohol(og.plato * 0.75 / 2)
     else:
         return Alcohol((og.plato - fg.plato) / 2)
+
+
+def alcohols(og, fg=None) -> np.ndarray:
+    """
+    Calculate the alcohol for many gravities in one vectorized call. See
+    `alcohol` for a single gravity.
+
+    :param og: original gravities, a `GravityArray` or array-like of values
+        in °Pl
+    :param fg: final gravities, a `GravityArray` or array-like of values in
+        °Pl, or None
+    :return: NumPy array of the alcohol in %
+
+    """
+    og = og.plato if isinstance(og, GravityArray) else \
+        np.asarray(og, dtype=float)
+
+    if fg is None:
+        return og * 0.75 / 2
+    else:
+        fg = fg.plato if isinstance(fg, GravityArray) else \
+            np.asarray(fg, dtype=float)
+        return (og - fg) / 2
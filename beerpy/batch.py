@@ -0,0 +1,131 @@
+"""
+Batch calculations on rows of values, shared by `beerpy.cli` and
+`beerpy.service`.
+
+Each calculation gets a chunk of rows, dictionaries of the input columns
+listed in `COLUMNS`, and computes the results of the whole chunk in one
+vectorized call.
+
+"""
+
+import numpy as np
+
+from . import receipe
+from .alcohol import alcohols
+from .carbonate import saturation
+from .units import CELSIUS, FAHRENHEIT, PLATO, SPECIFIC_GRAVITY
+from .units.gravity import plato_to_sg, sg_to_plato
+
+
+GRAVITY_UNITS = {"plato": PLATO, "sg": SPECIFIC_GRAVITY}
+TEMPERATURE_UNITS = {"C": CELSIUS, "F": FAHRENHEIT}
+
+# all malts defined in the receipe module by lower case name
+MALTS = {name.lower(): malt for name, malt in vars(receipe).items()
+         if isinstance(malt, receipe.Malt)}
+
+# input columns of the batch calculations, optional ones in brackets
+COLUMNS = {
+    "gravity": ["gravity"],
+    "abv": ["og", "[fg]"],
+    "carbonation": ["carbonate", "temperature"],
+    "malt": ["volume", "gravity", "[efficiency]"],
+    "hops": ["ibu", "alpha", "volume", "cooktime", "gravity"],
+}
+
+
+def _column(rows, name, default=None):
+    if default is not None:
+        return np.array([float(row.get(name) or default) for row in rows])
+    return np.array([float(row[name]) for row in rows])
+
+
+def _optional_column(rows, name):
+    """
+    Column which may be missing or empty in some rows, NaN for those.
+
+    """
+    return np.array([np.nan if row.get(name) in (None, "") else
+                     float(row[name]) for row in rows])
+
+
+def _to_plato(values, unit, fct):
+    return values if unit == PLATO else sg_to_plato(values, fct)
+
+
+def _plato(rows, name, unit, fct):
+    return _to_plato(_column(rows, name), unit, fct)
+
+
+# batch calculations, each gets a chunk of rows and returns the new columns
+def _gravity_rows(rows, unit, fct, **_):
+    values = _column(rows, "gravity")
+    if unit == PLATO:
+        return {"plato": values, "sg": plato_to_sg(values, fct)}
+    return {"plato": sg_to_plato(values, fct), "sg": values}
+
+
+def _abv_rows(rows, unit, fct, **_):
+    og = _plato(rows, "og", unit, fct)
+    fg = _optional_column(rows, "fg")
+    missing = np.isnan(fg)
+    # the attenuation is always returned, so all chunks have the same
+    # columns, it is None for rows without fg
+    if not missing.all():
+        fg[~missing] = _to_plato(fg[~missing], unit, fct)
+    return {"abv": np.where(missing, alcohols(og), alcohols(og, fg)),
+            "attenuation": (og - fg) / og}
+
+
+def _carbonation_rows(rows, temperature_unit, **_):
+    temp = _column(rows, "temperature")
+    sat = saturation(temp, temperature_unit)
+    return {"saturation": sat,
+            "carbonation": _column(rows, "carbonate") - sat}
+
+
+def _malt_rows(rows, unit, fct, malts, efficiency, **_):
+    if not malts:
+        raise ValueError("the malt calculation needs at least one --malt.")
+    res = receipe.malt_compositions(
+        _column(rows, "volume"), _plato(rows, "gravity", unit, fct),
+        [malt for malt, _ in malts], [share for _, share in malts],
+        _column(rows, "efficiency", efficiency)
+    )
+    columns = {"total": res.total_weight}
+    for i, (malt, _) in enumerate(malts):
+        columns[malt.name] = res.weights[:, i]
+    return columns
+
+
+def _hops_rows(rows, unit, fct, **_):
+    return {"hops": receipe.hop_quantities(
+        _column(rows, "ibu"), _column(rows, "alpha"), _column(rows, "volume"),
+        _column(rows, "cooktime"), _plato(rows, "gravity", unit, fct))}
+
+
+CALCULATIONS = {
+    "gravity": _gravity_rows,
+    "abv": _abv_rows,
+    "carbonation": _carbonation_rows,
+    "malt": _malt_rows,
+    "hops": _hops_rows,
+}
+
+
+def process_chunk(calculation, options, rows):
+    """
+    Run a batch calculation on a chunk of rows.
+
+    :param calculation: name of the calculation, a key of CALCULATIONS
+    :param options: dictionary of the options of the calculation
+    :param rows: list of dictionaries with the input columns
+    :returns: the rows with the result columns added, None for results
+        which are NaN as their inputs are missing
+
+    """
+    columns = CALCULATIONS[calculation](rows, **options)
+    for name, values in columns.items():
+        for row, value in zip(rows, values.tolist()):
+            row[name] = None if value != value else value
+    return rows
@@ -0,0 +1,239 @@
+"""
+Water volumes and gravities of a brew day.
+
+`Brewhouse` chains the calculations from the malt bill to the strike and
+sparge water in a dependency graph. Each step is calculated on first access
+and cached. Changing an input marks the steps depending on it, a marked step
+is recalculated on its next access only if the values of its own inputs
+changed. Example::
+
+    >>> from beerpy.receipe import PILSENER_MALT, MUNICH_MALT
+    >>> bh = Brewhouse(volume=22, og=14,
+    ...                composition=[(PILSENER_MALT, 0.8), (MUNICH_MALT, 0.2)])
+    >>> bh.malt_weight
+    5.44
+    >>> round(bh.sparge_water, 2)
+    15.12
+    >>> bh.mash_thickness = 3.5  # malt bill and pre-boil gravity are kept
+    >>> round(bh.sparge_water, 2)
+    12.4
+
+"""
+
+from collections import namedtuple
+
+from .alcohol import alcohol
+from .receipe import hop_quantity, malt_composition
+from .units.gravity import Gravity, PLATO
+
+
+# inputs of the brewhouse with their default values, REQUIRED ones have to
+# be given
+REQUIRED = object()
+INPUTS = {
+    "volume": REQUIRED,         # post-boil volume of the wort in liters
+    "og": REQUIRED,             # post-boil gravity of the wort in `unit`
+    "composition": REQUIRED,    # malt composition, tuples (Malt, share)
+    "unit": PLATO,              # unit of `og` and `fg`
+    "fg": None,                 # final gravity after fermentation or None
+    "efficiency": 0.75,         # brewhouse efficiency
+    "hops": (),                 # hop additions, tuples (ibu, alpha, cooktime)
+    "boil_time": 60.0,          # boil time in minutes
+    "boil_off": 4.0,            # evaporation in liters per hour
+    "absorption": 1.0,          # water kept by the spent grain in l/kg
+    "mash_thickness": 3.0,      # strike water per malt in l/kg
+}
+
+# maximum difference in °Pl of the pre-boil gravity iteration
+_PRECISION = 1e-9
+
+
+# Definition of namedtuple Step, a calculation of the brewhouse and the
+# names of the inputs and steps it is calculated from
+Step = namedtuple("Step", ('fct', 'inputs'))
+
+
+def _pre_boil_gravity(volume, gravity: Gravity, pre_boil_volume) -> Gravity:
+    """
+    Gravity before the boil, with the same extract in the larger volume.
+
+    """
+    extract = volume * gravity.specific_gravity * gravity.plato
+    plato = gravity.plato
+    for _ in range(50):
+        sg = Gravity(plato, PLATO, gravity.fct).specific_gravity
+        last, plato = plato, extract / (pre_boil_volume * sg)
+        if abs(plato - last) < _PRECISION:
+            break
+    return Gravity(plato, PLATO, gravity.fct)
+
+
+STEPS = {
+    "post_boil_gravity": Step(lambda og, unit: Gravity(og, unit),
+                              ("og", "unit")),
+    "final_gravity": Step(
+        lambda fg, unit: None if fg is None else Gravity(fg, unit),
+        ("fg", "unit")),
+    "malt_bill": Step(
+        lambda volume, gravity, composition, efficiency: malt_composition(
+            volume, gravity, list(composition), efficiency),
+        ("volume", "post_boil_gravity", "composition", "efficiency")),
+    "malt_weight": Step(lambda bill: bill[0], ("malt_bill",)),
+    "pre_boil_volume": Step(
+        lambda volume, boil_time, boil_off: volume + boil_off * boil_time / 60,
+        ("volume", "boil_time", "boil_off")),
+    "pre_boil_gravity": Step(
+        _pre_boil_gravity,
+        ("volume", "post_boil_gravity", "pre_boil_volume")),
+    "strike_water": Step(lambda weight, thickness: weight * thickness,
+                         ("malt_weight", "mash_thickness")),
+    "grain_absorption": Step(lambda weight, absorption: weight * absorption,
+                             ("malt_weight", "absorption")),
+    "sparge_water": Step(
+        lambda volume, absorption, strike: max(0.0,
+                                               volume + absorption - strike),
+        ("pre_boil_volume", "grain_absorption", "strike_water")),
+    "total_water": Step(lambda strike, sparge: strike + sparge,
+                        ("strike_water", "sparge_water")),
+    "hop_amounts": Step(
+        lambda hops, volume, gravity: tuple(
+            hop_quantity(ibu, alpha, volume, cooktime, gravity)
+            for ibu, alpha, cooktime in hops),
+        ("hops", "volume", "post_boil_gravity")),
+    "abv": Step(alcohol, ("post_boil_gravity", "final_gravity")),
+}
+
+
+def _dependents():
+    """
+    :returns: dictionary with the names of the steps which directly depend
+        on each input and step
+
+    """
+    dependents = {name: [] for name in list(INPUTS) + list(STEPS)}
+    for name, step in STEPS.items():
+        for i in step.inputs:
+            dependents[i].append(name)
+    return dependents
+
+
+_DEPENDENTS = _dependents()
+
+
+def _frozen(name, value):
+    """
+    Convert the list inputs to tuples, so they can't be changed in place
+    and are comparable.
+
+    """
+    if name in ("composition", "hops"):
+        return tuple(tuple(item) for item in value)
+    return value
+
+
+class Brewhouse:
+    """
+    Dependency graph of the brew day calculations.
+
+    The inputs are given as keyword arguments, see `INPUTS`, and can be
+    changed by assignment or `update`. The steps, see `STEPS`, are read as
+    attributes, e.g. `bh.sparge_water`.
+
+    Steps:
+
+    * post_boil_gravity, final_gravity: `Gravity` of og and fg
+    * malt_bill: result of `receipe.malt_composition`
+    * malt_weight: overall malt weight in kg
+    * pre_boil_volume: volume before the boil in liters
+    * pre_boil_gravity: `Gravity` before the boil
+    * strike_water, sparge_water, total_water: water volumes in liters
+    * grain_absorption: water kept by the spent grain in liters
+    * hop_amounts: amount in grams of each hop addition by
+      `receipe.hop_quantity`
+    * abv: `Alcohol` by `alcohol.alcohol`
+
+    """
+
+    def __init__(self, **inputs):
+        unknown = set(inputs) - set(INPUTS)
+        if unknown:
+            raise ValueError("unknown inputs: {}".format(
+                ", ".join(sorted(unknown))))
+        missing = [name for name, default in INPUTS.items()
+                   if default is REQUIRED and name not in inputs]
+        if missing:
+            raise ValueError("missing inputs: {}".format(", ".join(missing)))
+
+        values = dict(INPUTS, **inputs)
+        object.__setattr__(self, "_inputs", {
+            name: _frozen(name, value) for name, value in values.items()})
+        # cached steps as tuples (input values, result)
+        object.__setattr__(self, "_cache", {})
+        object.__setattr__(self, "_dirty", set())
+
+    def __repr__(self):
+        return "Brewhouse: {volume}l {og}{unit}".format(**self._inputs)
+
+    def __getattr__(self, name):
+        if name in INPUTS:
+            return self._inputs[name]
+        if name in STEPS:
+            return self.value(name)
+        raise AttributeError("'Brewhouse' object has no attribute {!r}"
+                             .format(name))
+
+    def __setattr__(self, name, value):
+        if name not in INPUTS:
+            raise AttributeError("can't set attribute {!r}".format(name))
+        self.update(**{name: value})
+
+    def update(self, **inputs):
+        """
+        Change inputs. The steps depending on changed inputs are marked and
+        checked on their next access.
+
+        """
+        for name, value in inputs.items():
+            if name not in INPUTS:
+                raise ValueError("unknown input: {}".format(name))
+            value = _frozen(name, value)
+            if value == self._inputs[name]:
+                continue
+            self._inputs[name] = value
+            self._mark(name)
+
+    def _mark(self, name):
+        for dependent in _DEPENDENTS[name]:
+            if dependent not in self._dirty:
+                self._dirty.add(dependent)
+                self._mark(dependent)
+
+    def is_cached(self, name) -> bool:
+        """
+        :returns: True if the step is calculated and none of its inputs
+            changed since
+
+        """
+        return name in self._cache and name not in self._dirty
+
+    def value(self, name):
+        """
+        :param name: name of an input or step
+        :returns: the value, calculated if needed
+
+        """
+        if name in INPUTS:
+            return self._inputs[name]
+
+        cached = self._cache.get(name)
+        if cached is not None and name not in self._dirty:
+            return cached[1]
+
+        step = STEPS[name]
+        args = tuple(self.value(i) for i in step.inputs)
+        self._dirty.discard(name)
+        if cached is not None and cached[0] == args:
+            return cached[1]
+        result = step.fct(*args)
+        self._cache[name] = (args, result)
+        return result
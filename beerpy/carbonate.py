@@ -25,48 +25,114 @@ fruit lambic  6.0        9.0
 """
 
 import os
-import pandas as pd
-from scipy.interpolate import interp1d
+from functools import lru_cache
+
+import numpy as np
 
 from . import units
-from .utilities import datadir
+from .instrument import timed
+from .interpolation import LinearInterpolator
+from .units import registry
+from .units.temperature import TEMPERATURE
+from .utilities import datadir, load_table
+
+CARBONATE_TABLE = "carbonate.csv"
+CARBONATE_FILE = os.path.join(datadir(), CARBONATE_TABLE)
+
+
+class SaturationCurve:
+    """
+    Carbonate saturation concentration over the temperature.
 
-CARBONATE_FILE = os.path.join(datadir(), "carbonate.csv")
+    The curve interpolates linearly between the given points, which are
+    prepared once on creation.
 
+    :param celsius: temperatures in °C
+    :param carbonate: carbonate saturation concentrations in g/l
 
-_df = pd.read_csv(CARBONATE_FILE, sep=",", decimal=".")
-_celsius = list(_df.temperature)
-_carbonate = list(_df.carbonate)
+    """
+
+    def __init__(self, celsius, carbonate):
+        self._interpolator = LinearInterpolator(celsius, carbonate)
+
+    def __repr__(self):
+        return "SaturationCurve: {:.1f}..{:.1f}°C".format(self.tmin, self.tmax)
+
+    @property
+    def tmin(self):
+        return self._interpolator.xmin
+
+    @property
+    def tmax(self):
+        return self._interpolator.xmax
+
+    def __call__(self, temp, unit: str=units.CELSIUS):
+        """
+        Calculate the carbonate saturation concentration for the given
+        temperature or temperatures.
+
+        :param temp: a `Temperature` or an array-like of temperature values
+        :param unit: unit of the values if `temp` is not a `Temperature`
+        :returns: carbonate saturation concentration in g/l, a NumPy array
+            for array input
+
+        """
+        if isinstance(temp, units.Temperature):
+            celsius = temp.celsius
+        elif unit in registry.units(TEMPERATURE):
+            celsius = registry.converter(unit, units.CELSIUS, True)(
+                np.asarray(temp, dtype=float), None)
+        else:
+            raise ValueError("unit parameter not in {}".format(
+                registry.units(TEMPERATURE)))
+
+        try:
+            return self._interpolator.vector(celsius)
+        except ValueError as e:
+            raise ValueError(
+                "The value for temperature must be in range ({:.1f}..{:.1f}°C)"
+                .format(self.tmin, self.tmax)
+            ) from e
+
+
+@lru_cache(maxsize=None)
+def saturation_curve() -> SaturationCurve:
+    """
+    The carbonate saturation curve of the carbonate data table. It is built
+    on first use and shared afterwards.
+
+    """
+    table = load_table(CARBONATE_TABLE)
+    return SaturationCurve(table["temperature"], table["carbonate"])
 
 
-def saturation(temp: units.Temperature) -> float:
+@timed("carbonate.saturation")
+def saturation(temp: units.Temperature, unit: str=units.CELSIUS):
     """
     Calculate the carbonate saturiation concentration for the
     given temperature.
 
-    :param temp: temperature of the concentrate in °C
+    :param temp: temperature of the concentrate, a `Temperature` or an
+        array-like of values in `unit`
+    :param unit: unit of the values if `temp` is not a `Temperature`
     :returns: carbonate saturation concentration in g/l
 
     """
-    f = interp1d(_celsius, _carbonate)
-    try:
-        return f(temp.celsius)
-    except ValueError as e:
-        raise ValueError(
-            "The value for temperature must be in range ({:.1f}..{:.1f}°C)"
-            .format(min(_celsius), max(_celsius))
-        ) from e
+    return saturation_curve()(temp, unit)
 
 
-def carbonisation(conc: float, temp: units.Temperature) -> float:
+def carbonisation(conc: float, temp: units.Temperature,
+                  unit: str=units.CELSIUS):
     """
     Calculate the necessary carbonation to achieve the aimed carbonate
     concentration at the given fermentation temperature.
 
     :param conc: aimed carbonate concentration in g/l
-    :param temp: fermentation temperature
+    :param temp: fermentation temperature, a `Temperature` or an
+        array-like of values in `unit`
+    :param unit: unit of the values if `temp` is not a `Temperature`
     :returns: necessary carbonation in g/l
 
     """
-    sat = saturation(temp)
+    sat = saturation(temp, unit)
     return conc - sat
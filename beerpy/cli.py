@@ -0,0 +1,267 @@
+"""
+Command line interface of beerpy.
+
+Single calculations::
+
+    $ beerpy gravity 12
+    $ beerpy gravity 1.048 --unit sg
+    $ beerpy abv 12 3
+    $ beerpy carbonation 5.0 20
+    $ beerpy malt 22 14 pilsener_malt:0.8 munich_malt:0.2
+    $ beerpy hops 40 5.5 22 60 20
+
+Batch processing of csv or jsonl files, one calculation per row::
+
+    $ beerpy batch gravity -i readings.csv -o converted.csv --unit sg
+    $ beerpy batch malt -i receipes.jsonl --malt pilsener_malt:0.8 \\
+        --malt munich_malt:0.2 --jobs 4
+
+Service with JSON requests over TCP, see `beerpy.service`::
+
+    $ beerpy serve --port 8765
+
+The rows are read and processed in chunks, each chunk in one vectorized
+call of `beerpy.batch`, so files of any size run in constant memory. The
+columns used by each calculation are listed in `batch.COLUMNS`, the results
+are added as new columns. The columns of csv output are the ones of the
+first row.
+
+"""
+
+import argparse
+import csv
+import json
+import sys
+from functools import partial
+
+from . import receipe
+from .alcohol import alcohol
+from .batch import CALCULATIONS, COLUMNS, GRAVITY_UNITS, MALTS, \
+    TEMPERATURE_UNITS, process_chunk
+from .carbonate import carbonisation, saturation
+from .units import Gravity, Temperature
+from .units.gravity import _fcts
+from .utilities import chunked, ordered_map
+
+
+def _malt(spec):
+    """
+    Parse a malt argument of the form NAME:SHARE.
+
+    """
+    name, _, share = spec.rpartition(":")
+    if name.lower() not in MALTS:
+        raise argparse.ArgumentTypeError(
+            "unknown malt {!r}, choose from {}".format(
+                name, ", ".join(sorted(MALTS))))
+    return MALTS[name.lower()], float(share)
+
+
+def _read(f, fmt):
+    if fmt == "jsonl":
+        return (json.loads(line) for line in f if line.strip())
+    return csv.DictReader(f)
+
+
+def _write(f, fmt, rows):
+    if fmt == "jsonl":
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+        return
+
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(f, fieldnames=list(row),
+                                    lineterminator="\n")
+            writer.writeheader()
+        writer.writerow(row)
+
+
+def _format(filename, fmt):
+    if fmt:
+        return fmt
+    return "jsonl" if filename.endswith((".jsonl", ".json")) else "csv"
+
+
+def batch(args):
+    options = {
+        "unit": GRAVITY_UNITS[args.unit],
+        "fct": args.fct,
+        "temperature_unit": TEMPERATURE_UNITS[args.temperature_unit],
+        "malts": args.malt,
+        "efficiency": args.efficiency,
+    }
+    infile = sys.stdin if args.input == "-" else \
+        open(args.input, newline="")
+    outfile = sys.stdout if args.output == "-" else \
+        open(args.output, "w", newline="")
+
+    try:
+        chunks = chunked(_read(infile, _format(args.input, args.format)),
+                         args.chunksize)
+        results = ordered_map(partial(process_chunk, args.calculation,
+                                      options), chunks, args.jobs)
+        _write(outfile, _format(args.output, args.output_format),
+               (row for rows in results for row in rows))
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+def serve(args):
+    import asyncio
+    from .service import serve
+
+    try:
+        asyncio.run(serve(args.host, args.port,
+                          max_batch_size=args.max_batch_size,
+                          max_latency=args.max_latency))
+    except KeyboardInterrupt:
+        pass
+
+
+def gravity(args):
+    g = Gravity(args.value, GRAVITY_UNITS[args.unit], args.fct)
+    print("{:.2f}°P  {:.4f} SG".format(g.plato, g.specific_gravity))
+
+
+def abv(args):
+    unit = GRAVITY_UNITS[args.unit]
+    fg = None if args.fg is None else Gravity(args.fg, unit, args.fct)
+    print(alcohol(Gravity(args.og, unit, args.fct), fg))
+
+
+def carbonation(args):
+    temp = Temperature(args.temperature,
+                       TEMPERATURE_UNITS[args.temperature_unit])
+    print("saturation: {:.2f}g/l  carbonation: {:.2f}g/l".format(
+        float(saturation(temp)), float(carbonisation(args.carbonate, temp))))
+
+
+def malt(args):
+    total, weights = receipe.malt_composition(
+        args.volume, Gravity(args.gravity, GRAVITY_UNITS[args.unit], args.fct),
+        args.malts, args.efficiency
+    )
+    for name, weight in weights:
+        print("{:<20} {:6.2f} kg".format(name, weight))
+    print("{:<20} {:6.2f} kg".format("total", total))
+
+
+def hops(args):
+    amount = receipe.hop_quantity(
+        args.ibu, args.alpha, args.volume, args.cooktime,
+        Gravity(args.gravity, GRAVITY_UNITS[args.unit], args.fct)
+    )
+    print("{:.1f} g".format(amount))
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="beerpy", description="Brewing calculations.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    gravity_options = argparse.ArgumentParser(add_help=False)
+    gravity_options.add_argument(
+        "--unit", choices=sorted(GRAVITY_UNITS), default="plato",
+        help="unit of the gravities (default: %(default)s)")
+    gravity_options.add_argument(
+        "--fct", choices=_fcts, default=None,
+        help="gravity conversion function (default: data)")
+
+    temperature_options = argparse.ArgumentParser(add_help=False)
+    temperature_options.add_argument(
+        "--temperature-unit", choices=sorted(TEMPERATURE_UNITS), default="C",
+        help="unit of the temperatures (default: %(default)s)")
+
+    p = subparsers.add_parser("gravity", parents=[gravity_options],
+                              help="convert a gravity")
+    p.add_argument("value", type=float)
+    p.set_defaults(func=gravity)
+
+    p = subparsers.add_parser("abv", parents=[gravity_options],
+                              help="alcohol from original / final gravity")
+    p.add_argument("og", type=float)
+    p.add_argument("fg", type=float, nargs="?")
+    p.set_defaults(func=abv)
+
+    p = subparsers.add_parser("carbonation", parents=[temperature_options],
+                              help="carbonation for a carbonate content")
+    p.add_argument("carbonate", type=float, help="aimed carbonate in g/l")
+    p.add_argument("temperature", type=float)
+    p.set_defaults(func=carbonation)
+
+    p = subparsers.add_parser("malt", parents=[gravity_options],
+                              help="malt composition of a receipe")
+    p.add_argument("volume", type=float, help="volume in liters")
+    p.add_argument("gravity", type=float)
+    p.add_argument("malts", type=_malt, nargs="+", metavar="MALT:SHARE")
+    p.add_argument("--efficiency", type=float, default=0.75)
+    p.set_defaults(func=malt)
+
+    p = subparsers.add_parser("hops", parents=[gravity_options],
+                              help="hop quantity for a bitterness")
+    p.add_argument("ibu", type=float)
+    p.add_argument("alpha", type=float, help="alpha acid in %%")
+    p.add_argument("volume", type=float, help="volume in liters")
+    p.add_argument("cooktime", type=float, help="cooking time in minutes")
+    p.add_argument("gravity", type=float)
+    p.set_defaults(func=hops)
+
+    p = subparsers.add_parser(
+        "batch", parents=[gravity_options, temperature_options],
+        help="run a calculation on each row of a csv or jsonl file",
+        epilog="input columns: " + "; ".join(
+            "{}: {}".format(k, ", ".join(v)) for k, v in COLUMNS.items()))
+    p.add_argument("calculation", choices=sorted(CALCULATIONS))
+    p.add_argument("-i", "--input", default="-",
+                   help="input file (default: stdin)")
+    p.add_argument("-o", "--output", default="-",
+                   help="output file (default: stdout)")
+    p.add_argument("--format", choices=["csv", "jsonl"],
+                   help="input format (default: by file extension, csv)")
+    p.add_argument("--output-format", choices=["csv", "jsonl"],
+                   help="output format (default: by file extension, csv)")
+    p.add_argument("--chunksize", type=int, default=10000,
+                   help="rows per chunk (default: %(default)s)")
+    p.add_argument("-j", "--jobs", type=int, default=1,
+                   help="number of worker processes (default: %(default)s)")
+    p.add_argument("--malt", type=_malt, action="append", default=[],
+                   metavar="MALT:SHARE", help="malt of the malt calculation")
+    p.add_argument("--efficiency", type=float, default=0.75,
+                   help="efficiency if there is no efficiency column")
+    p.set_defaults(func=batch)
+
+    p = subparsers.add_parser(
+        "serve", help="serve the calculations as JSON lines over TCP")
+    p.add_argument("--host", default="127.0.0.1",
+                   help="address to listen on (default: %(default)s)")
+    p.add_argument("--port", type=int, default=8765,
+                   help="port to listen on (default: %(default)s)")
+    p.add_argument("--max-batch-size", type=int, default=256,
+                   help="maximum requests per calculation "
+                        "(default: %(default)s)")
+    p.add_argument("--max-latency", type=float, default=0.002,
+                   help="maximum seconds a request waits for others "
+                        "(default: %(default)s)")
+    p.set_defaults(func=serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    try:
+        args.func(args)
+    except (ValueError, KeyError) as e:
+        print("beerpy: error: {}".format(e), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+Persistent cache of calculation results in a SQLite file.
+
+Results are stored under a hash of the function name, the arguments and
+the checksum of the data tables in `beerpy/data`. So cached results are
+never used after a data table changed, the outdated ones are dropped when
+the cache is opened. The size of the file is limited, the least recently
+used results are evicted first. The database runs in WAL mode, so several
+processes can share one cache file. Example::
+
+    from beerpy import receipe
+    from beerpy.diskcache import DiskCache
+
+    cache = DiskCache("results.sqlite")
+    malt_composition = cache.cached(receipe.malt_composition)
+    hop_quantity = cache.cached(receipe.hop_quantity)
+
+    malt_composition(22, Gravity(14), [(PILSENER_MALT, 0.8),
+                                       (MUNICH_MALT, 0.2)])
+
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import weakref
+from functools import wraps
+
+import numpy as np
+
+from .units.gravity import Gravity, get_default_fct
+from .utilities import data_checksum
+
+
+# maximum size of the cached results in bytes
+MAX_SIZE = 64 * 2 ** 20
+
+# seconds to wait for a lock held by another process
+TIMEOUT = 30.0
+
+# open caches, their connections are closed before a fork
+_caches = weakref.WeakSet()
+
+
+def default_filename() -> str:
+    """
+    :returns: the cache file in the user cache directory, e.g.
+        ~/.cache/beerpy/results.sqlite
+
+    """
+    directory = os.environ.get("XDG_CACHE_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(directory, "beerpy", "results.sqlite")
+
+
+def _canonical(obj):
+    """
+    Convert arguments to a JSON serializable form, which is the same for
+    equal values, e.g. 22 and 22.0.
+
+    """
+    if obj is None or isinstance(obj, (bool, str)):
+        return obj
+    if isinstance(obj, (int, float, np.number)):
+        return float(obj)
+    if isinstance(obj, Gravity):
+        return ["Gravity", float(obj.value), obj.unit,
+                obj.fct or get_default_fct()]
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return [type(obj).__name__] + [_canonical(v) for v in obj]
+    if isinstance(obj, (list, tuple, np.ndarray)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items())}
+    raise TypeError("can't cache arguments of type {}".format(
+        type(obj).__name__))
+
+
+class DiskCache:
+    """
+    Persistent cache of calculation results.
+
+    :param filename: path of the SQLite file, by default `default_filename`
+    :param max_size: maximum size of the cached results in bytes
+
+    """
+
+    def __init__(self, filename=None, max_size=MAX_SIZE):
+        self.filename = filename or default_filename()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._checksum = data_checksum()
+        # connections by process and thread, closed with the cache as the
+        # garbage collector may keep them open for a while
+        self._connections = {}
+        weakref.finalize(self, _close, self._connections)
+        _caches.add(self)
+
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT "
+                       "PRIMARY KEY, value BLOB, size INTEGER, "
+                       "accessed REAL)")
+            db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON "
+                       "results (accessed)")
+            db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY "
+                       "KEY, value TEXT)")
+            # running total of the sizes, kept by triggers so it's never
+            # summed up on a write
+            db.execute("CREATE TABLE IF NOT EXISTS usage (id INTEGER "
+                       "PRIMARY KEY CHECK (id = 0), total INTEGER)")
+            db.execute("CREATE TRIGGER IF NOT EXISTS results_insert AFTER "
+                       "INSERT ON results BEGIN UPDATE usage SET total = "
+                       "total + NEW.size; END")
+            db.execute("CREATE TRIGGER IF NOT EXISTS results_update AFTER "
+                       "UPDATE OF size ON results BEGIN UPDATE usage SET "
+                       "total = total + NEW.size - OLD.size; END")
+            db.execute("CREATE TRIGGER IF NOT EXISTS results_delete AFTER "
+                       "DELETE ON results BEGIN UPDATE usage SET total = "
+                       "total - OLD.size; END")
+            # one row only, even if several processes open a new file
+            db.execute("INSERT OR IGNORE INTO usage SELECT 0, "
+                       "COALESCE(SUM(size), 0) FROM results")
+            row = db.execute("SELECT value FROM meta WHERE name = "
+                             "'checksum'").fetchone()
+            if row is None or row[0] != self._checksum:
+                db.execute("DELETE FROM results")
+                db.execute("INSERT OR REPLACE INTO meta VALUES "
+                           "('checksum', ?)", (self._checksum,))
+
+    def __repr__(self):
+        return "DiskCache: {}".format(self.filename)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Connection of the current thread and process. Connections can't be
+        shared across threads or forked processes, SQLite even fails in a
+        forked process if the parent had the file open at the fork, so all
+        connections are closed before a fork.
+
+        """
+        key = os.getpid(), threading.get_ident()
+        db = self._connections.get(key)
+        if db is None:
+            db = sqlite3.connect(self.filename, timeout=TIMEOUT,
+                                 check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._connections[key] = db
+        return db
+
+    def key(self, name, *args, **kwargs) -> str:
+        """
+        :param name: name of the calculation
+        :returns: the key of the result of the calculation with the given
+            arguments
+
+        """
+        data = json.dumps([name, _canonical(args), _canonical(kwargs),
+                           self._checksum], sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key, default=None):
+        """
+        :returns: the cached result for the key or `default`
+
+        """
+        with self._connection() as db:
+            row = db.execute("SELECT value FROM results WHERE key = ?",
+                             (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            db.execute("UPDATE results SET accessed = ? WHERE key = ?",
+                       (time.time(), key))
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        """
+        Store a result and evict the least recently used results if the
+        cache exceeds its size.
+
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connection() as db:
+            # an upsert, as REPLACE doesn't run the delete trigger
+            db.execute("INSERT INTO results VALUES (?, ?, ?, ?) ON CONFLICT "
+                       "(key) DO UPDATE SET value = excluded.value, size = "
+                       "excluded.size, accessed = excluded.accessed",
+                       (key, data, len(data), time.time()))
+            excess = db.execute("SELECT total FROM usage").fetchone()[0] - \
+                self.max_size
+            if excess <= 0:
+                return
+
+            # oldest results first by the index on accessed
+            keys = []
+            for old, size in db.execute("SELECT key, size FROM results "
+                                        "ORDER BY accessed"):
+                keys.append((old,))
+                excess -= size
+                if excess <= 0:
+                    break
+            db.executemany("DELETE FROM results WHERE key = ?", keys)
+
+    def cached(self, fct):
+        """
+        Decorator caching the results of a function.
+
+        :param fct: function whose arguments are numbers, strings,
+            `Gravity` objects or tuples and lists of them, e.g.
+            `receipe.malt_composition` or `receipe.hop_quantity`
+
+        """
+        name = "{}.{}".format(fct.__module__, fct.__qualname__)
+
+        @wraps(fct)
+        def wrapper(*args, **kwargs):
+            key = self.key(name, *args, **kwargs)
+            missing = object()
+            result = self.get(key, missing)
+            if result is missing:
+                result = fct(*args, **kwargs)
+                self.set(key, result)
+            return result
+
+        return wrapper
+
+    def __len__(self):
+        with self._connection() as db:
+            return db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def size(self) -> int:
+        """
+        :returns: size of the cached results in bytes
+
+        """
+        with self._connection() as db:
+            return db.execute("SELECT total FROM usage").fetchone()[0]
+
+    def clear(self):
+        """
+        Drop all cached results.
+
+        """
+        with self._connection() as db:
+            db.execute("DELETE FROM results")
+
+    def close(self):
+        """
+        Close the connections of the cache, they are reopened on demand.
+
+        """
+        _close(self._connections)
+
+
+def _close(connections):
+    while connections:
+        _, db = connections.popitem()
+        db.close()
+
+
+def _close_all():
+    """
+    Close the connections of all caches before a fork.
+
+    """
+    for cache in list(_caches):
+        cache.close()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_close_all)
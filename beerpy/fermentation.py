@@ -0,0 +1,214 @@
+"""
+Monitoring of fermentations from a stream of gravity readings, e.g. the
+csv or jsonl exports of floating hydrometers.
+
+The readings are consumed one after another by generators. For each tank
+only the original gravity and a rolling window of the latest readings are
+kept, so the memory does not grow with the length of the stream.
+
+Example::
+
+    readings = read_csv("tilt.csv", unit=SPECIFIC_GRAVITY)
+    for status in monitor(readings):
+        print(status.tank, status.attenuation, status.alcohol)
+
+"""
+
+import csv
+import json
+from collections import deque, namedtuple
+from datetime import datetime
+
+from .alcohol import alcohol
+from .units.gravity import Gravity, PLATO, SPECIFIC_GRAVITY
+
+
+# Definition of namedtuple Reading, a single gravity reading of a tank
+Reading = namedtuple("Reading", ('tank', 'time', 'gravity'))
+
+# Definition of namedtuple Status, result of monitor
+Status = namedtuple("Status", ('tank', 'time', 'gravity', 'attenuation',
+                               'alcohol', 'rate'))
+
+SECONDS_PER_DAY = 86400.0
+
+
+def _timestamp(time) -> float:
+    """
+    Convert a time to seconds. Accepts numbers (seconds), `datetime`
+    objects and ISO 8601 strings.
+
+    """
+    if isinstance(time, datetime):
+        return time.timestamp()
+    try:
+        return float(time)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(time).timestamp()
+
+
+def _open(source):
+    # file name or an iterable of lines (e.g. an open file)
+    if isinstance(source, str):
+        with open(source, newline='') as f:
+            yield from f
+    else:
+        yield from source
+
+
+def read_csv(source, tank='tank', time='time', gravity='gravity',
+             unit=SPECIFIC_GRAVITY):
+    """
+    Read gravity readings from a csv file with a header line.
+
+    :param source: file name or iterable of lines
+    :param tank: name of the tank column
+    :param time: name of the time column (seconds or ISO 8601)
+    :param gravity: name of the gravity column
+    :param unit: unit of the gravity values
+    :return: generator of `Reading`
+
+    """
+    for row in csv.DictReader(_open(source)):
+        yield Reading(row[tank], row[time],
+                      Gravity(float(row[gravity]), unit=unit))
+
+
+def read_jsonl(source, tank='tank', time='time', gravity='gravity',
+               unit=SPECIFIC_GRAVITY):
+    """
+    Read gravity readings from a file with one json object per line.
+
+    :param source: file name or iterable of lines
+    :param tank: key of the tank
+    :param time: key of the time (seconds or ISO 8601)
+    :param gravity: key of the gravity
+    :param unit: unit of the gravity values
+    :return: generator of `Reading`
+
+    """
+    for line in _open(source):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        yield Reading(row[tank], row[time],
+                      Gravity(float(row[gravity]), unit=unit))
+
+
+class Fermenter:
+    """
+    Fermentation state of a single tank.
+
+    :param og: original gravity of the wort. If None the highest gravity
+        read so far is used.
+    :param window: number of readings used for the fermentation rate
+
+    """
+
+    def __init__(self, og: Gravity=None, window=12):
+        self._og = None if og is None else og.plato
+        # the original gravity follows the readings only if not given
+        self._track_og = og is None
+        self._readings = deque(maxlen=window)
+
+    def __repr__(self):
+        return "Fermenter: OG {}°P, {} readings".format(
+            self._og, len(self._readings))
+
+    @property
+    def og(self) -> Gravity:
+        """
+        original gravity
+
+        """
+        return None if self._og is None else Gravity(self._og, unit=PLATO)
+
+    @property
+    def gravity(self) -> Gravity:
+        """
+        latest gravity
+
+        """
+        if not self._readings:
+            return None
+        return Gravity(self._readings[-1][1], unit=PLATO)
+
+    def update(self, time, gravity: Gravity):
+        """
+        Add a reading.
+
+        :param time: time of the reading (seconds, `datetime` or ISO 8601)
+        :param gravity: gravity of the reading
+
+        """
+        plato = gravity.plato
+        if self._track_og and (self._og is None or plato > self._og):
+            self._og = plato
+        self._readings.append((_timestamp(time), plato))
+
+    @property
+    def attenuation(self) -> float:
+        """
+        apparent attenuation, ratio of the extract fermented so far, 0.0
+        before the first reading
+
+        """
+        if not self._og or not self._readings:
+            return 0.0
+        return (self._og - self._readings[-1][1]) / self._og
+
+    @property
+    def alcohol(self) -> float:
+        """
+        alcohol content in %, 0.0 before the first reading
+
+        """
+        if not self._readings:
+            return 0.0
+        return alcohol(self.og, self.gravity).value
+
+    @property
+    def rate(self) -> float:
+        """
+        decline of the gravity in °Pl per day, calculated by linear
+        regression over the readings in the window
+
+        """
+        n = len(self._readings)
+        if n < 2:
+            return 0.0
+
+        t0 = self._readings[0][0]
+        t_mean = sum(t - t0 for t, _ in self._readings) / n
+        p_mean = sum(p for _, p in self._readings) / n
+        cov = sum((t - t0 - t_mean) * (p - p_mean) for t, p in self._readings)
+        var = sum((t - t0 - t_mean) ** 2 for t, _ in self._readings)
+        if var == 0:
+            return 0.0
+        return -cov / var * SECONDS_PER_DAY
+
+
+def monitor(readings, og: dict=None, window=12):
+    """
+    Calculate the state of the fermentation for each reading.
+
+    :param readings: iterable of `Reading`, e.g. from `read_csv` or
+        `read_jsonl`, ordered by time per tank
+    :param og: dictionary of the original gravity per tank. Tanks not in
+        the dictionary use the highest gravity read so far.
+    :param window: number of readings used for the fermentation rate
+    :return: generator of `Status` with the gravity, the apparent
+        attenuation, the alcohol in % and the decline of the gravity in
+        °Pl per day
+
+    """
+    og = og or {}
+    fermenters = {}
+
+    for tank, time, gravity in readings:
+        fermenter = fermenters.get(tank)
+        if fermenter is None:
+            fermenter = fermenters[tank] = Fermenter(og.get(tank), window)
+        fermenter.update(time, gravity)
+        yield Status(tank, time, gravity, fermenter.attenuation,
+                     fermenter.alcohol, fermenter.rate)
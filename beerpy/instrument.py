@@ -0,0 +1,188 @@
+"""
+Opt-in instrumentation of the calculation hot paths.
+
+The number of calls and the cumulative time of interpolator builds, table
+loads, gravity conversions per conversion function, carbonate saturation
+and the receipe calculations are recorded while the instrumentation is
+enabled. Example::
+
+    >>> from beerpy import instrument
+    >>> from beerpy.units import Gravity
+    >>> with instrument.profiling():
+    ...     Gravity(1.048, "kg/m³").plato
+    12.0
+    >>> instrument.snapshot()["gravity.data.sg_to_pl"].calls
+    1
+
+Disabled, which is the default, the instrumentation costs nothing: the
+instrumented functions are only registered by `timed`. `enable` replaces
+them by timing wrappers in the namespaces of all loaded beerpy modules and
+classes, `disable` puts the originals back. References to instrumented
+functions held elsewhere, e.g. by `from beerpy.receipe import
+hop_quantity` in an application module, keep calling the original.
+
+The times of nested calls are inclusive, e.g. the time of the first
+conversion contains the time of loading the table and building the
+interpolator.
+
+"""
+
+import sys
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+
+# Definition of namedtuple Stat, the number of calls and the cumulative
+# time in seconds of an instrumented function
+Stat = namedtuple("Stat", ('calls', 'seconds'))
+
+_enabled = False
+_lock = threading.Lock()
+_calls = {}
+_seconds = {}
+
+# instrumented functions with their names and, while enabled, wrappers
+_functions = []
+_wrappers = []
+
+
+def _record(name, seconds):
+    with _lock:
+        _calls[name] = _calls.get(name, 0) + 1
+        _seconds[name] = _seconds.get(name, 0.0) + seconds
+
+
+def _wrap(fct, name):
+    @wraps(fct)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return fct(*args, **kwargs)
+        finally:
+            _record(name, perf_counter() - start)
+    return wrapper
+
+
+def timed(name):
+    """
+    Decorator registering a function to record its calls and time under
+    `name` while the instrumentation is enabled. Functions sharing a name
+    are recorded together. While disabled the function itself is returned.
+
+    Only module level functions and methods, which are looked up by name
+    on each call, can be instrumented.
+
+    """
+    def decorator(fct):
+        with _lock:
+            _functions.append((fct, name))
+            if not _enabled:
+                return fct
+            wrapper = _wrap(fct, name)
+            _wrappers.append(wrapper)
+            return wrapper
+    return decorator
+
+
+def _namespaces():
+    """
+    Modules and classes of beerpy with a copy of their attributes.
+
+    """
+    for module in list(sys.modules.values()):
+        name = getattr(module, "__name__", None)
+        if name != "beerpy" and not str(name).startswith("beerpy."):
+            continue
+        yield module, dict(vars(module))
+        for obj in list(vars(module).values()):
+            if isinstance(obj, type) and obj.__module__ == name:
+                yield obj, dict(vars(obj))
+
+
+def _swap(pairs):
+    """
+    Replace functions in all namespaces of beerpy.
+
+    :param pairs: list of tuples (function, replacement)
+
+    """
+    replacements = {id(fct): (fct, replacement) for fct, replacement in pairs}
+    for owner, namespace in _namespaces():
+        for key, value in namespace.items():
+            fct, replacement = replacements.get(id(value), (None, None))
+            if fct is value:
+                setattr(owner, key, replacement)
+
+
+def enable():
+    """
+    Enable the instrumentation.
+
+    """
+    global _enabled
+    with _lock:
+        if _enabled:
+            return
+        _wrappers[:] = [_wrap(fct, name) for fct, name in _functions]
+        _enabled = True
+        _swap([(w.__wrapped__, w) for w in _wrappers])
+
+
+def disable():
+    """
+    Disable the instrumentation, the recorded values are kept.
+
+    """
+    global _enabled
+    with _lock:
+        if not _enabled:
+            return
+        _enabled = False
+        _swap([(w, w.__wrapped__) for w in _wrappers])
+        _wrappers.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """
+    Drop all recorded values.
+
+    """
+    with _lock:
+        _calls.clear()
+        _seconds.clear()
+
+
+def snapshot() -> dict:
+    """
+    :returns: dictionary of the recorded `Stat` by name
+
+    """
+    with _lock:
+        return {name: Stat(_calls[name], _seconds[name])
+                for name in sorted(_calls)}
+
+
+@contextmanager
+def profiling(reset_values=True):
+    """
+    Context manager enabling the instrumentation within its block.
+
+    :param reset_values: drop the values recorded before
+
+    """
+    previous = _enabled
+    if reset_values:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not previous:
+            disable()
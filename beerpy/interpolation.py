@@ -0,0 +1,177 @@
+"""
+Interpolation on the data tables shipped with beerpy.
+
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+from .instrument import timed
+
+
+class LinearInterpolator:
+    """
+    Piecewise linear interpolation on a fixed set of points.
+
+    The points are sorted by their x value once on creation. Each lookup
+    finds the enclosing segment by binary search, so no work is repeated
+    for subsequent calls.
+
+    :param xdata: x values of the points
+    :param ydata: y values of the points
+
+    """
+
+    @timed("interpolation.linear.build")
+    def __init__(self, xdata, ydata):
+        points = sorted(zip(xdata, ydata))
+        if len(points) < 2:
+            raise ValueError("at least two points are needed for interpolation")
+        self.x = [float(x) for x, _ in points]
+        self.y = [float(y) for _, y in points]
+
+    def __repr__(self):
+        return "LinearInterpolator: {:g}..{:g}".format(self.x[0], self.x[-1])
+
+    @property
+    def xmin(self):
+        return self.x[0]
+
+    @property
+    def xmax(self):
+        return self.x[-1]
+
+    def _range_error(self, xval):
+        return ValueError(
+            "A value ({}) in x_new is out of the interpolation range "
+            "({}..{}).".format(xval, self.x[0], self.x[-1])
+        )
+
+    def __call__(self, xval: float) -> float:
+        """
+        Interpolate the y value for the given x value.
+
+        :param xval: x value, must be in the range of the x data
+        :returns: interpolated y value
+
+        """
+        x = self.x
+        xval = float(xval)
+        if not x[0] <= xval <= x[-1]:
+            raise self._range_error(xval)
+
+        i = bisect_right(x, xval) - 1
+        if i == len(x) - 1:
+            return self.y[-1]
+
+        x0, x1 = x[i], x[i + 1]
+        y0, y1 = self.y[i], self.y[i + 1]
+        return y0 + (y1 - y0) * (xval - x0) / (x1 - x0)
+
+    def vector(self, xvals) -> np.ndarray:
+        """
+        Interpolate the y values for a whole array of x values at once.
+
+        :param xvals: array-like of x values, all must be in the range of
+            the x data
+        :returns: NumPy array of interpolated y values
+
+        """
+        xvals = np.asarray(xvals, dtype=float)
+        outside = ~((xvals >= self.x[0]) & (xvals <= self.x[-1]))
+        if outside.any():
+            raise self._range_error(xvals[outside].flat[0])
+        return np.interp(xvals, self.x, self.y)
+
+
+def _segment(points, value):
+    # index of the segment enclosing value and the relative position in it,
+    # values outside the points are clamped to the nearest point
+    if value <= points[0]:
+        return 0, 0.0
+    if value >= points[-1]:
+        return len(points) - 2, 1.0
+    i = bisect_right(points, value) - 1
+    return i, (value - points[i]) / (points[i + 1] - points[i])
+
+
+def _segments(points, values):
+    # vectorized version of _segment
+    values = np.clip(values, points[0], points[-1])
+    i = np.clip(np.searchsorted(points, values, side='right') - 1,
+                0, len(points) - 2)
+    return i, (values - points[i]) / (points[i + 1] - points[i])
+
+
+class BilinearInterpolator:
+    """
+    Bilinear interpolation on a fixed rectangular grid.
+
+    The grid is copied into immutable tuples and read-only arrays on
+    creation. Values outside the grid are taken from the nearest grid
+    point, like `scipy.interpolate.interp2d` did without `fill_value`.
+
+    :param xdata: ascending x values of the grid
+    :param ydata: ascending y values of the grid
+    :param zdata: grid values, `zdata[i][j]` belongs to `xdata[i]` and
+        `ydata[j]`
+
+    """
+
+    @timed("interpolation.bilinear.build")
+    def __init__(self, xdata, ydata, zdata):
+        self.x = tuple(float(x) for x in xdata)
+        self.y = tuple(float(y) for y in ydata)
+        self.z = tuple(tuple(float(z) for z in row) for row in zdata)
+
+        if len(self.x) < 2 or len(self.y) < 2:
+            raise ValueError("at least two points per axis are needed for "
+                             "interpolation")
+        if len(self.z) != len(self.x) or \
+                any(len(row) != len(self.y) for row in self.z):
+            raise ValueError("shape of zdata does not match xdata and ydata.")
+
+        self._xa = np.array(self.x)
+        self._ya = np.array(self.y)
+        self._za = np.array(self.z)
+        for a in (self._xa, self._ya, self._za):
+            a.flags.writeable = False
+
+    def __repr__(self):
+        return "BilinearInterpolator: {:g}..{:g}, {:g}..{:g}".format(
+            self.x[0], self.x[-1], self.y[0], self.y[-1]
+        )
+
+    def __call__(self, xval: float, yval: float) -> float:
+        """
+        Interpolate the z value for the given x and y value.
+
+        :param xval: x value
+        :param yval: y value
+        :returns: interpolated z value
+
+        """
+        i, tx = _segment(self.x, float(xval))
+        j, ty = _segment(self.y, float(yval))
+        z0, z1 = self.z[i], self.z[i + 1]
+        return ((1 - tx) * ((1 - ty) * z0[j] + ty * z0[j + 1]) +
+                tx * ((1 - ty) * z1[j] + ty * z1[j + 1]))
+
+    def vector(self, xvals, yvals) -> np.ndarray:
+        """
+        Interpolate the z values for arrays of x and y values at once. The
+        arrays are broadcast against each other.
+
+        :param xvals: array-like of x values
+        :param yvals: array-like of y values
+        :returns: NumPy array of interpolated z values
+
+        """
+        xvals, yvals = np.broadcast_arrays(np.asarray(xvals, dtype=float),
+                                           np.asarray(yvals, dtype=float))
+        i, tx = _segments(self._xa, xvals)
+        j, ty = _segments(self._ya, yvals)
+        z = self._za
+        return ((1 - tx) * ((1 - ty) * z[i, j] + ty * z[i, j + 1]) +
+                tx * ((1 - ty) * z[i + 1, j] + ty * z[i + 1, j + 1]))
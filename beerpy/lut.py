@@ -0,0 +1,224 @@
+"""
+Precomputed lookup tables (LUT) for quantized conversions.
+
+Hydrometer and thermometer readings are quantized, e.g. to 0.0001 SG or
+0.1°C. For these values the conversions are looked up directly by index in
+dense tables, which are generated from the data tables in `beerpy/data`
+and shipped as .npy files next to them. Values between the grid points or
+outside of the grid fall back to the interpolation on the data tables.
+
+The lookup pays off for arrays, single values are converted about as fast
+by the interpolation itself.
+
+The .npy files are regenerated by::
+
+    python -m beerpy.lut
+
+which records the data table of each lookup table in the manifest of the
+data directory. If a data table changed since, the lookup table is
+generated in memory with a warning.
+
+"""
+
+import os
+import warnings
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .carbonate import saturation_curve
+from .units.gravity import FCT_DATA, _pl_to_sg, _sg_to_pl, \
+    plato_to_sg as _plato_to_sg, sg_to_plato as _sg_to_plato
+from .utilities import datadir, is_binary_current, record_binary
+
+
+# Definition of namedtuple LUTSpec, the grid of a lookup table, the
+# functions for single values and arrays it is generated with and the data
+# table they are based on
+LUTSpec = namedtuple("LUTSpec", ('start', 'step', 'size', 'fct',
+                                 'vector_fct', 'source'))
+
+SG_TO_PLATO = "sg_to_plato"
+PLATO_TO_SG = "plato_to_sg"
+SATURATION = "saturation"
+
+LUTS = {
+    # 1.002..1.179 SG, 0.0001 SG resolution
+    SG_TO_PLATO: LUTSpec(1.002, 0.0001, 1771,
+                         lambda x: _sg_to_pl(x, FCT_DATA),
+                         lambda x: _sg_to_plato(x, FCT_DATA), "gravity.csv"),
+    # 0.5..40°P, 0.01°P resolution
+    PLATO_TO_SG: LUTSpec(0.5, 0.01, 3951,
+                         lambda x: _pl_to_sg(x, FCT_DATA),
+                         lambda x: _plato_to_sg(x, FCT_DATA), "gravity.csv"),
+    # 0..22°C, 0.1°C resolution
+    SATURATION: LUTSpec(0.0, 0.1, 221,
+                        lambda x: float(saturation_curve()(x)),
+                        lambda x: saturation_curve()(x), "carbonate.csv"),
+}
+
+# maximum distance from a grid point in steps for a value to be on the grid
+_TOLERANCE = 1e-6
+
+
+def _basename(name):
+    return "lut_{}.npy".format(name)
+
+
+def _filename(name, directory=None):
+    return os.path.join(directory or datadir(), _basename(name))
+
+
+def grid(name) -> np.ndarray:
+    """
+    :param name: name of the lookup table, e.g. SG_TO_PLATO
+    :returns: the grid points of the lookup table
+
+    """
+    spec = LUTS[name]
+    return spec.start + spec.step * np.arange(spec.size)
+
+
+def generate(name) -> np.ndarray:
+    """
+    Calculate the values of a lookup table.
+
+    :param name: name of the lookup table, e.g. SG_TO_PLATO
+    :returns: the values at the grid points
+
+    """
+    return np.asarray(LUTS[name].vector_fct(grid(name)), dtype=float)
+
+
+def build(directory=None):
+    """
+    Generate all lookup tables, save them as .npy files and record them in
+    the manifest.
+
+    :param directory: target directory, by default the data directory
+
+    """
+    for name, spec in LUTS.items():
+        np.save(_filename(name, directory), generate(name))
+        record_binary(_basename(name), spec.source, directory)
+
+
+class LookupTable:
+    """
+    Lookup table on an equidistant grid.
+
+    :param spec: `LUTSpec` with the grid and the functions used for values
+        which are not on the grid
+    :param values: values at the grid points
+
+    """
+
+    def __init__(self, spec: LUTSpec, values):
+        if len(values) != spec.size:
+            raise ValueError("size of values does not match the grid.")
+        self.spec = spec
+        # plain ndarray view, indexing a memmap directly is slow
+        self.values = np.asarray(values)
+
+    def __repr__(self):
+        return "LookupTable: {:g}..{:g} step {:g}".format(
+            self.spec.start, self.spec.start + (self.spec.size - 1) *
+            self.spec.step, self.spec.step)
+
+    def __call__(self, x: float) -> float:
+        """
+        Look up a single value.
+
+        """
+        spec = self.spec
+        pos = (x - spec.start) / spec.step
+        i = int(round(pos))
+        if 0 <= i < spec.size and abs(pos - i) <= _TOLERANCE:
+            return float(self.values[i])
+        return spec.fct(x)
+
+    def vector(self, x) -> np.ndarray:
+        """
+        Look up an array of values at once.
+
+        """
+        spec = self.spec
+        x = np.asarray(x, dtype=float)
+        pos = (x - spec.start) / spec.step
+        i = np.rint(pos)
+        on_grid = (i >= 0) & (i < spec.size) & \
+            (np.abs(pos - i) <= _TOLERANCE)
+        if on_grid.all():
+            return self.values[i.astype(np.intp)]
+
+        res = np.empty_like(x)
+        res[on_grid] = self.values[i[on_grid].astype(np.intp)]
+        res[~on_grid] = spec.vector_fct(x[~on_grid])
+        return res
+
+
+@lru_cache(maxsize=None)
+def load(name) -> LookupTable:
+    """
+    Load a lookup table. The .npy file is memory-mapped read-only, if it is
+    missing or its data table changed the table is generated in memory.
+
+    :param name: name of the lookup table, e.g. SG_TO_PLATO
+    :returns: the lookup table
+
+    """
+    filename = _filename(name)
+    if is_binary_current(_basename(name)):
+        values = np.load(filename, mmap_mode='r')
+    else:
+        if os.path.exists(filename):
+            warnings.warn("The lookup table {} is outdated, run "
+                          "'python -m beerpy.lut' to update it."
+                          .format(name))
+        values = generate(name)
+    return LookupTable(LUTS[name], values)
+
+
+def sg_to_plato(sg):
+    """
+    Calculate °Pl from specific gravity by the lookup table.
+
+    :param sg: specific gravity, a float or array-like
+    :returns: gravity in °Pl, a NumPy array for array input
+
+    """
+    if isinstance(sg, (int, float)):
+        return load(SG_TO_PLATO)(sg)
+    return load(SG_TO_PLATO).vector(sg)
+
+
+def plato_to_sg(pl):
+    """
+    Calculate specific gravity from °Pl by the lookup table.
+
+    :param pl: gravity in °Pl, a float or array-like
+    :returns: specific gravity, a NumPy array for array input
+
+    """
+    if isinstance(pl, (int, float)):
+        return load(PLATO_TO_SG)(pl)
+    return load(PLATO_TO_SG).vector(pl)
+
+
+def saturation(celsius):
+    """
+    Calculate the carbonate saturation concentration by the lookup table.
+
+    :param celsius: temperature in °C, a float or array-like
+    :returns: carbonate saturation concentration in g/l, a NumPy array for
+        array input
+
+    """
+    if isinstance(celsius, (int, float)):
+        return load(SATURATION)(celsius)
+    return load(SATURATION).vector(celsius)
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,174 @@
+"""
+Routines for planning receipes with the malt in stock. These are the
+inverse of `receipe.malt_composition`: given the amount of each malt sort
+on hand they calculate the achievable gravity or volume of the wort and
+the composition that allows brewing the most batches.
+
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .instrument import timed
+from .interpolation import LinearInterpolator
+from .receipe import Malt
+from .units.gravity import Gravity, GravityArray, GRAVITY_TABLE, PLATO
+from .utilities import load_table
+
+
+# Definition of namedtuple BatchPlan, result of max_batches
+BatchPlan = namedtuple("BatchPlan", ('batches', 'composition', 'weights'))
+
+
+@lru_cache(maxsize=None)
+def _extract_interpolator():
+    """
+    Interpolator from the extract per liter of wort (°Pl * SG * 10 in g/l)
+    to the gravity in °Pl, built from the gravity table on first use.
+
+    """
+    table = load_table(GRAVITY_TABLE)
+    extract = [pl * sg * 10.0 for pl, sg in zip(table["Plato"], table["SG"])]
+    return LinearInterpolator(extract, table["Plato"])
+
+
+def _wort_extract(volume, gravity):
+    # extract in g needed for a wort with the given volume and gravity
+    plato = np.asarray(gravity.plato, dtype=float)
+    sg = np.asarray(gravity.specific_gravity, dtype=float)
+    return np.asarray(volume, dtype=float) * sg * plato * 10.0
+
+
+def extract(inventory: '[(Malt, float),...]', efficiency=0.75) -> float:
+    """
+    Calculate the practical extract of the given malt.
+
+    :param inventory: list of tuples of the `Malt` and its amount in kg
+    :param efficiency: brewhouse efficiency
+    :return: extract in g
+
+    """
+    return sum(malt.extract_ratio * amount
+               for malt, amount in inventory) * efficiency
+
+
+def achievable_gravity(inventory: '[(Malt, float),...]', volume,
+                       efficiency=0.75):
+    """
+    Calculate the gravity of the wort which can be achieved with the given
+    malt for the given volume.
+
+    :param inventory: list of tuples of the `Malt` and its amount in kg
+    :param volume: volume of the wort in liters, a scalar or array-like
+    :param efficiency: brewhouse efficiency
+    :return: the gravity, a `Gravity` for a scalar volume or a
+        `GravityArray` for an array of volumes
+
+    """
+    extract_per_liter = extract(inventory, efficiency) / np.asarray(
+        volume, dtype=float)
+    plato = _extract_interpolator().vector(extract_per_liter)
+    if plato.ndim == 0:
+        return Gravity(float(plato), unit=PLATO)
+    return GravityArray(plato, unit=PLATO)
+
+
+def achievable_volume(inventory: '[(Malt, float),...]', gravity,
+                      efficiency=0.75):
+    """
+    Calculate the volume of wort with the given gravity which can be
+    brewed with the given malt.
+
+    :param inventory: list of tuples of the `Malt` and its amount in kg
+    :param gravity: gravity of the wort, a `Gravity` or a `GravityArray`
+    :param efficiency: brewhouse efficiency
+    :return: volume of the wort in liters, a NumPy array for a
+        `GravityArray`
+
+    """
+    return extract(inventory, efficiency) / _wort_extract(1.0, gravity)
+
+
+@timed("optimize.max_batches")
+def max_batches(inventory: '[(Malt, float),...]', volume: float,
+                gravity: Gravity, efficiency=0.75,
+                bounds: '[(float, float),...]'=None) -> BatchPlan:
+    """
+    Find the malt composition which allows brewing the most batches of wort
+    with the given volume and gravity from the malt in stock.
+
+    The problem is solved as a linear program on the overall amount of each
+    malt sort used and the number of batches.
+
+    :param inventory: list of tuples of the `Malt` and its amount in kg
+    :param volume: volume of the wort of one batch in liters
+    :param gravity: gravity of the wort
+    :param efficiency: brewhouse efficiency
+    :param bounds: list of tuples with the minimum and maximum share of each
+        malt sort on the overall malt, in the order of `inventory`. By
+        default each share may be anything between 0 and 1.
+    :return: `BatchPlan` with the number of batches (not rounded, use
+        `int()` for the number of complete batches), the composition as a
+        list of tuples of the `Malt` and its share and the weight of each
+        malt sort per batch in kg
+
+    :Example:
+
+        >>> inventory = [(Malt("Pilsener Malz", 800), 20),
+        ...              (Malt("Münchener Malz", 790), 10)]
+        >>> plan = max_batches(inventory, 20, Gravity(12),
+        ...                    bounds=[(0.5, 1), (0.2, 0.4)])
+        >>> int(plan.batches)
+        7
+
+    """
+    from scipy.optimize import linprog
+
+    malts = [malt for malt, _ in inventory]
+    stock = np.array([amount for _, amount in inventory], dtype=float)
+    extract_ratio = np.array([malt.extract_ratio for malt in malts],
+                             dtype=float)
+    m = len(malts)
+
+    if bounds is None:
+        bounds = [(0.0, 1.0)] * m
+    lower, upper = np.array(bounds, dtype=float).reshape(m, 2).T
+    if lower.sum() > 1.0 or upper.sum() < 1.0:
+        raise ValueError("the shares in bounds can not add up to one.")
+
+    # variables: overall weight of each malt sort in kg, number of batches
+    c = np.zeros(m + 1)
+    c[-1] = -1.0
+
+    # the malt needs to yield the extract of all batches
+    a_eq = np.append(extract_ratio * efficiency,
+                     -float(_wort_extract(volume, gravity)))[np.newaxis]
+    b_eq = [0.0]
+
+    # lower[i] * sum(weights) <= weights[i] <= upper[i] * sum(weights)
+    share = np.eye(m) - upper[:, np.newaxis]
+    a_ub = np.vstack([
+        np.hstack([share, np.zeros((m, 1))]),
+        np.hstack([lower[:, np.newaxis] - np.eye(m), np.zeros((m, 1))]),
+    ])
+    b_ub = np.zeros(2 * m)
+
+    res = linprog(c, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=b_eq,
+                  bounds=[(0.0, s) for s in stock] + [(0.0, None)],
+                  method="highs")
+    if res.status != 0:
+        raise ValueError("no malt composition found: {}".format(res.message))
+
+    used, batches = res.x[:-1], res.x[-1]
+    if batches <= 0:
+        return BatchPlan(0.0, [(malt, 0.0) for malt in malts],
+                         [(malt, 0.0) for malt in malts])
+
+    composition = used / used.sum()
+    return BatchPlan(
+        float(batches),
+        [(malt, float(s)) for malt, s in zip(malts, composition)],
+        [(malt, float(w)) for malt, w in zip(malts, used / batches)],
+    )
@@ -4,22 +4,26 @@ http://www.mathe-fuer-hobbybrauer.de/bierrezepte/index.html
 
 """
 
-import os
 from collections import namedtuple
+from functools import lru_cache
 
-import pandas as pd
-from scipy.interpolate import interp2d
+import numpy as np
 
-from .units.gravity import Gravity
-from .utilities import datadir
+from .instrument import timed
+from .interpolation import BilinearInterpolator
+from .units.gravity import Gravity, GravityArray, plato_to_sg
+from .utilities import load_table
 
 
 # datafile for hop saturation
-_f_hop_saturation = os.path.join(datadir(), "hop_saturation.csv")
+HOP_SATURATION_TABLE = "hop_saturation.csv"
 
 # Definition of namedtuple Malt
 Malt = namedtuple("Malt", ('name', 'extract_ratio'))
 
+# Definition of namedtuple MaltCompositions, result of malt_compositions
+MaltCompositions = namedtuple("MaltCompositions", ('total_weight', 'weights'))
+
 # Different Malts
 PILSENER_MALT = Malt("Pilsener Malz", 800)
 WIENER_MALT = Malt("Wiener Malz", 800)
@@ -41,15 +45,39 @@ def _round(x):
     return round(x, 2)
 
 
+@lru_cache(maxsize=None)
+def _hop_saturation_interpolator():
+    """
+    Interpolator on the hop saturation table by cooktime and °Pl. The table
+    is loaded and the interpolator built on first use only.
+
+    """
+    table = load_table(HOP_SATURATION_TABLE)
+    plato = [float(s.replace(',', '.')) for s in table.header[1:]]
+    return BilinearInterpolator(table.columns[0], plato,
+                                zip(*table.columns[1:]))
+
+
 def _hop_saturation(cooktime, pl):
-    df = pd.read_csv(_f_hop_saturation, sep=',', decimal='.', index_col=0)
-    x = [float(s.replace(',', '.')) for s in list(df.columns)]
-    y = list(df.index)
-    z = list([list(l) for l in df.to_records(index=False)])
-    f = interp2d(x, y, z)
-    return f(pl, cooktime)
+    return _hop_saturation_interpolator()(cooktime, pl)
 
 
+def hop_saturation(cooktime, plato) -> np.ndarray:
+    """
+    Look up the hop saturation for many pairs of cooktime and gravity at
+    once. Values outside of the hop saturation table are taken from the
+    nearest table entry.
+
+    :param cooktime: cooking times in minutes, array-like
+    :param plato: gravities of the wort in °Pl, array-like, broadcast
+        against `cooktime`
+    :return: NumPy array of hop saturations in %
+
+    """
+    return _hop_saturation_interpolator().vector(cooktime, plato)
+
+
+@timed("receipe.malt_composition")
 def malt_composition(volume: float, gravity: Gravity,
                      composition: '[(Malt, float),...]', efficiency=0.75):
     """
@@ -92,6 +120,64 @@ def malt_composition(volume: float, gravity: Gravity,
                                   for malt, ratio in composition]
 
 
+@timed("receipe.malt_compositions")
+def malt_compositions(volume, gravity, malts: '[Malt,...]', shares,
+                      efficiency=0.75, decimals=2) -> MaltCompositions:
+    """
+    Calculate the amount of malt for many receipes, batch sizes and
+    efficiencies in one vectorized call. See `malt_composition` for a single
+    receipe.
+
+    All parameters but `malts` are broadcast against each other, so e.g. a
+    single composition can be solved for a vector of volumes.
+
+    :param volume: volumes of the wort in liters, array-like of shape (n,)
+    :param gravity: gravities of the wort, a `Gravity`, a `GravityArray` or
+        an array-like of gravities in °Pl of shape (n,)
+    :param malts: the m malt sorts of the compositions
+    :param shares: share of each malt sort on the overall malt, array-like of
+        shape (n, m) or (m,) for the same composition in all receipes
+    :param efficiency: brewhouse efficiency, scalar or array-like of shape (n,)
+    :param decimals: number of decimals to round the weights to, None for
+        no rounding
+    :return: `MaltCompositions` with the overall malt weights in kg of shape
+        (n,) and the weights of each malt sort in kg of shape (n, m)
+
+    :Example:
+
+        >>> res = malt_compositions([20, 22], [12, 14],
+        ...                         [PILSENER_MALT, MUNICH_MALT], [0.8, 0.2])
+        >>> res.total_weight
+        array([4.2 , 5.44])
+        >>> res.weights
+        array([[3.36, 0.84],
+               [4.35, 1.09]])
+
+    """
+    if isinstance(gravity, (Gravity, GravityArray)):
+        plato = np.asarray(gravity.plato, dtype=float)
+        sg = np.asarray(gravity.specific_gravity, dtype=float)
+    else:
+        plato = np.asarray(gravity, dtype=float)
+        sg = plato_to_sg(plato)
+
+    extract_ratio = np.array([malt.extract_ratio for malt in malts],
+                             dtype=float)
+    shares = np.asarray(shares, dtype=float)
+
+    wort_weight = np.asarray(volume, dtype=float) * sg
+    theoretical_extract = wort_weight * plato * 10.0
+    practical_extract = (shares @ extract_ratio) * efficiency
+    total_weight = theoretical_extract / practical_extract
+    weights = total_weight[..., np.newaxis] * shares
+
+    if decimals is not None:
+        total_weight = np.round(total_weight, decimals)
+        weights = np.round(weights, decimals)
+    return MaltCompositions(total_weight, weights)
+
+
+@timed("receipe.hop_quantity")
 def hop_quantity(ibu, alpha, wort_volume, cooktime, gravity: Gravity):
     """
     Calculate the amount of hop with a specific `alpha` needed to achieve a
@@ -105,5 +191,62 @@ def hop_quantity(ibu, alpha, wort_volume, cooktime, gravity: Gravity):
     :return: amount of hops in grams
 
     """
-    saturation = _hop_saturation(cooktime, gravity.plato)[0]
+    saturation = _hop_saturation(cooktime, gravity.plato)
+    return ibu * wort_volume * 10 / (alpha * saturation)
+
+
+@timed("receipe.hop_quantities")
+def hop_quantities(ibu, alpha, wort_volume, cooktime,
+                   gravity) -> np.ndarray:
+    """
+    Calculate the amounts of hop for all additions of a hop schedule in one
+    vectorized call. See `hop_quantity` for a single addition.
+
+    All parameters are broadcast against each other, so e.g. the additions
+    of shape (m,) can be calculated for n worts with volumes and gravities
+    of shape (n, 1).
+
+    :param ibu: bitterness level of each addition in IBU, array-like
+    :param alpha: amount of alpha acid of each addition in %, array-like
+    :param wort_volume: quantity of wort in liters, scalar or array-like
+    :param cooktime: cooking time of each addition in minutes, array-like
+    :param gravity: gravity of the wort, a `Gravity`, a `GravityArray` or
+        an array-like of gravities in °Pl
+    :return: NumPy array with the amount of hops in grams per addition
+
+    :Example:
+
+        >>> hop_quantities([30, 10], [5.5, 4.0], 22, [60, 10],
+        ...                Gravity(12)).round(2)
+        array([54.22, 96.49])
+
+    """
+    if isinstance(gravity, (Gravity, GravityArray)):
+        plato = np.asarray(gravity.plato, dtype=float)
+    else:
+        plato = np.asarray(gravity, dtype=float)
+    saturation = hop_saturation(cooktime, plato)
+    ibu = np.asarray(ibu, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    wort_volume = np.asarray(wort_volume, dtype=float)
     return ibu * wort_volume * 10 / (alpha * saturation)
+
+
+@timed("receipe.bitterness")
+def bitterness(amount, alpha, wort_volume, cooktime, gravity: Gravity) -> float:
+    """
+    Calculate the overall bitterness of a hop schedule from the given hop
+    amounts. This is the reverse of `hop_quantities`.
+
+    :param amount: amount of hops of each addition in grams, array-like
+    :param alpha: amount of alpha acid of each addition in %, array-like
+    :param wort_volume: quantity of wort in liters
+    :param cooktime: cooking time of each addition in minutes, array-like
+    :param gravity: gravity of the wort
+    :return: bitterness level in IBU
+
+    """
+    saturation = hop_saturation(cooktime, gravity.plato)
+    amount = np.asarray(amount, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    return float(np.sum(amount * alpha * saturation) / (wort_volume * 10))
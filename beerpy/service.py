@@ -0,0 +1,242 @@
+"""
+Asyncio service for brewing calculations.
+
+`Service` handles requests for the calculations of the batch command line
+tool, each request is a dictionary with the name of the calculation, its
+input columns and options::
+
+    {"calculation": "gravity", "gravity": 1.048, "unit": "sg"}
+    {"calculation": "abv", "og": 12, "fg": 3}
+    {"calculation": "carbonation", "carbonate": 5, "temperature": 20}
+    {"calculation": "malt", "volume": 22, "gravity": 12,
+     "malts": [["pilsener_malt", 0.8], ["munich_malt", 0.2]]}
+    {"calculation": "hops", "ibu": 40, "alpha": 5.5, "volume": 22,
+     "cooktime": 60, "gravity": 12}
+
+The response is the request with the result columns added, or a
+dictionary with an "error" and the "id" of the request.
+
+Concurrent requests with the same calculation and options, which arrive
+within `max_latency` seconds, are collected by a `Batcher` and calculated
+in one vectorized call in a worker thread, so the event loop never blocks
+on a calculation.
+
+`serve` runs the service over TCP with one JSON request per line and the
+responses in the order of the requests::
+
+    $ beerpy serve --port 8765
+    $ echo '{"calculation": "gravity", "gravity": 12}' | nc localhost 8765
+    {"calculation": "gravity", "gravity": 12, "plato": 12.0, "sg": 1.048}
+
+"""
+
+import asyncio
+import json
+
+from .batch import CALCULATIONS, COLUMNS, GRAVITY_UNITS, MALTS, \
+    TEMPERATURE_UNITS, process_chunk
+from .units.gravity import _fcts
+
+
+class Batcher:
+    """
+    Collect concurrent calls into batches.
+
+    The first call starts a batch which is processed after `max_latency`
+    seconds or as soon as it holds `max_batch_size` items. If processing a
+    batch fails, its items are processed one by one, so an invalid item
+    only fails its own call.
+
+    :param fct: function of a list of items which returns a list with the
+        result of each item
+    :param max_batch_size: maximum number of items in a batch
+    :param max_latency: maximum time in seconds an item waits for its batch
+    :param executor: executor `fct` runs in, by default the thread pool of
+        the event loop
+
+    """
+
+    def __init__(self, fct, max_batch_size=256, max_latency=0.002,
+                 executor=None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.fct = fct
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.executor = executor
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def __call__(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, self.fct, [item for item, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                await asyncio.gather(*(self._run([b]) for b in batch))
+            elif not batch[0][1].done():
+                batch[0][1].set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def _options(request):
+    """
+    Options of the calculation of a request as hashable tuple.
+
+    """
+    fct = request.get("fct")
+    if fct is not None and fct not in _fcts:
+        raise ValueError("unknown fct {!r}, choose from {}".format(
+            fct, ", ".join(_fcts)))
+    malts = tuple((MALTS[name.lower()], float(share))
+                  for name, share in request.get("malts", []))
+    return (
+        ("unit", GRAVITY_UNITS[request.get("unit", "plato")]),
+        ("fct", fct),
+        ("temperature_unit",
+         TEMPERATURE_UNITS[request.get("temperature_unit", "C")]),
+        ("malts", malts),
+        ("efficiency", 0.75),
+    )
+
+
+class Service:
+    """
+    Request handler for the brewing calculations.
+
+    :param max_batch_size: maximum number of requests calculated at once
+    :param max_latency: maximum time in seconds a request waits for other
+        requests to be calculated with
+    :param executor: executor the calculations run in, by default the
+        thread pool of the event loop
+
+    """
+
+    def __init__(self, max_batch_size=256, max_latency=0.002, executor=None):
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.executor = executor
+        self._batchers = {}
+
+    def _batcher(self, calculation, options, columns):
+        key = calculation, options, columns
+        if key not in self._batchers:
+            fct = lambda rows: process_chunk(calculation, dict(options), rows)
+            self._batchers[key] = Batcher(fct, self.max_batch_size,
+                                          self.max_latency, self.executor)
+        return self._batchers[key]
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Calculate a request.
+
+        :param request: dictionary with the calculation, its input columns
+            and options
+        :returns: the request with the result columns added, or a
+            dictionary with the error
+
+        """
+        try:
+            calculation = request["calculation"]
+            if calculation not in CALCULATIONS:
+                raise ValueError("unknown calculation {!r}".format(
+                    calculation))
+            # requests with different optional columns are not batched
+            # together
+            columns = tuple(c.strip("[]") in request
+                            for c in COLUMNS[calculation])
+            batcher = self._batcher(calculation, _options(request), columns)
+            return await batcher(dict(request))
+        except (ValueError, KeyError, TypeError) as e:
+            return {"id": request.get("id"), "error": str(e)}
+
+    async def handle_line(self, line) -> str:
+        """
+        Calculate a request given as JSON line.
+
+        :returns: the response as JSON line
+
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request is not an object")
+        except ValueError as e:
+            response = {"id": None, "error": "invalid request: {}".format(e)}
+        else:
+            response = await self.handle(request)
+        return json.dumps(response) + "\n"
+
+    async def connection(self, reader, writer, pipeline=1024):
+        """
+        Handle a connection with one JSON request per line. Requests are
+        calculated concurrently, the responses are written in the order of
+        the requests.
+
+        :param reader: `asyncio.StreamReader` of the connection
+        :param writer: `asyncio.StreamWriter` of the connection
+        :param pipeline: maximum number of requests in progress
+
+        """
+        responses = asyncio.Queue(pipeline)
+
+        async def write():
+            while True:
+                task = await responses.get()
+                if task is None:
+                    return
+                writer.write((await task).encode())
+                await writer.drain()
+
+        writing = asyncio.ensure_future(write())
+        try:
+            async for line in reader:
+                if line.strip():
+                    await responses.put(
+                        asyncio.ensure_future(self.handle_line(line)))
+            await responses.put(None)
+            await writing
+        finally:
+            writing.cancel()
+            writer.close()
+
+
+async def serve(host="127.0.0.1", port=8765, **kwargs):
+    """
+    Run the service over TCP until cancelled.
+
+    :param host: address to listen on
+    :param port: port to listen on
+    :param kwargs: arguments of `Service`
+
+    """
+    service = Service(**kwargs)
+    server = await asyncio.start_server(service.connection, host, port)
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,193 @@
+"""
+Simulation of fermentations with temperature control.
+
+Many tanks are simulated at once, the state of all tanks is held in NumPy
+arrays and advanced in fixed time steps. The model is deliberately simple,
+it is meant for planning the glycol capacity of a cellar, not for
+predicting a single fermentation:
+
+* The apparent attenuation x follows a logistic curve from `LAG` to 1,
+  dx/dt = k(T) x (1 - x), the gravity declines from the original to the
+  final gravity accordingly. The rate k doubles with every 10°C above
+  `REFERENCE_TEMPERATURE` (Q10 = 2).
+* The fermented extract releases `FERMENTATION_HEAT` J/kg. Heat is
+  exchanged with the cellar through the jacket (ua in W/K) and removed by
+  the glycol cooling while it is on.
+* The cooling is switched on above setpoint + hysteresis and off below
+  setpoint - hysteresis, the switch state is kept for the whole step.
+* The fermented extract releases `CO2_YIELD` g CO2 per g. It is dissolved
+  up to the saturation concentration of the carbonate curve at the
+  temperature of the tank, clipped to the range of the curve, the rest
+  escapes through the blow-off.
+
+Example::
+
+    result = simulate(og=np.full(100, 12.0), fg=2.5, volume=2000,
+                      setpoint=12.0, days=14, dt=60.0, cooling=2000.0)
+    peak = result.cooling.sum(axis=1).max()  # W for the whole cellar
+
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .carbonate import saturation_curve
+from .units.gravity import Gravity, GravityArray, PLATO, SPECIFIC_GRAVITY, \
+    _interpolator, plato_to_sg
+
+
+SECONDS_PER_DAY = 86400.0
+
+# attenuation at the start of the fermentation
+LAG = 0.01
+# temperature in °C at which the fermentation runs at `rate`
+REFERENCE_TEMPERATURE = 20.0
+# factor of the fermentation rate per 10°C
+Q10 = 2.0
+# heat released by the fermentation in J per kg of extract
+FERMENTATION_HEAT = 586e3
+# specific heat capacity of wort and beer in J/(kg K)
+HEAT_CAPACITY = 4000.0
+# CO2 released by the fermentation in g per g of extract
+CO2_YIELD = 0.46
+
+
+# Definition of namedtuple SimulationResult, the recorded states with one
+# row per record and one column per tank. time in seconds, gravities in °Pl
+# and specific gravity, temperature in °C, dissolved CO2 in g/l and the
+# cooling power in W
+SimulationResult = namedtuple("SimulationResult", (
+    'time', 'plato', 'specific_gravity', 'temperature', 'co2', 'cooling'))
+
+
+def _euler(f, y, dt):
+    return y + dt * f(y)
+
+
+def _rk4(f, y, dt):
+    k1 = f(y)
+    k2 = f(y + dt / 2 * k1)
+    k3 = f(y + dt / 2 * k2)
+    k4 = f(y + dt * k3)
+    return y + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+# solvers, each advances the state y by one step dt of dy/dt = f(y)
+SOLVERS = {"euler": _euler, "rk4": _rk4}
+
+
+def _plato(gravity):
+    if isinstance(gravity, (Gravity, GravityArray)):
+        return np.asarray(gravity.plato, dtype=float)
+    return np.asarray(gravity, dtype=float)
+
+
+def simulate(og, fg, volume, setpoint, days, dt=60.0, solver="rk4",
+             rate=1.2, temperature=None, ambient=20.0, ua=10.0,
+             cooling=1000.0, hysteresis=0.5, record_every=1
+             ) -> SimulationResult:
+    """
+    Simulate the fermentation of many tanks.
+
+    All parameters but `days`, `dt`, `solver` and `record_every` may be
+    scalars or arrays with one value per tank, a single tank is simulated
+    as array of one tank.
+
+    :param og: original gravity, a `Gravity`, `GravityArray` or values in
+        °Pl
+    :param fg: final gravity the fermentation approaches, like `og`
+    :param volume: volume of the wort in liters
+    :param setpoint: aimed temperature in °C
+    :param days: duration of the simulation in days
+    :param dt: time step in seconds
+    :param solver: name of the solver, a key of SOLVERS
+    :param rate: fermentation rate in 1/day at REFERENCE_TEMPERATURE
+    :param temperature: temperature in °C at the start, by default the
+        setpoint
+    :param ambient: temperature of the cellar in °C
+    :param ua: heat transfer between the tank and the cellar in W/K
+    :param cooling: cooling power of the glycol in W
+    :param hysteresis: switching hysteresis of the cooling in K
+    :param record_every: number of steps between two records
+    :return: `SimulationResult`
+
+    """
+    if solver not in SOLVERS:
+        raise ValueError("solver not in {}".format(tuple(SOLVERS)))
+    if dt <= 0:
+        raise ValueError("the time step must be positive.")
+    step = SOLVERS[solver]
+
+    og, fg = _plato(og), _plato(fg)
+    if temperature is None:
+        temperature = setpoint
+    og, fg, volume, setpoint, rate, temperature, ambient, ua, cooling = \
+        np.broadcast_arrays(*(np.atleast_1d(np.asarray(a, dtype=float))
+                              for a in (og, fg, volume, setpoint, rate,
+                                        temperature, ambient, ua, cooling)))
+    if np.any(fg >= og):
+        raise ValueError("the final gravity must be below the original "
+                         "gravity.")
+    table = _interpolator(PLATO, SPECIFIC_GRAVITY)
+    if np.any(fg < table.xmin) or np.any(og > table.xmax):
+        raise ValueError("the gravities must be in range ({:.1f}..{:.1f}°P)"
+                         .format(table.xmin, table.xmax))
+
+    # wort mass in kg and fermentable extract in kg and g/l
+    mass = volume * plato_to_sg(og)
+    extract = mass * (og - fg) / 100.0
+    co2_per_x = CO2_YIELD * extract * 1000.0 / volume
+    capacity = mass * HEAT_CAPACITY
+    # rate in 1/s as k_ref * exp(q * t), q from Q10
+    q = np.log(Q10) / 10.0
+    k_ref = rate / SECONDS_PER_DAY * np.exp(-q * REFERENCE_TEMPERATURE)
+
+    curve = saturation_curve()
+
+    def co2_saturation(celsius):
+        return curve(np.clip(celsius, curve.tmin, curve.tmax))
+
+    def derivative(y):
+        x, t = y
+        dx = k_ref * np.exp(q * t) * x * (1.0 - x)
+        heat = FERMENTATION_HEAT * extract * dx + ua * (ambient - t) - power
+        return np.stack((dx, heat / capacity))
+
+    y = np.stack((np.full_like(og, LAG), temperature.copy()))
+    co2 = np.zeros_like(og)
+    on = y[1] > setpoint + hysteresis
+    power = np.where(on, cooling, 0.0)
+
+    steps = int(round(days * SECONDS_PER_DAY / dt))
+    n = steps // record_every + 1
+    shape = (n,) + og.shape
+    records = {name: np.empty(shape) for name in
+               ("x", "temperature", "co2", "cooling")}
+
+    def save(i):
+        records["x"][i] = y[0]
+        records["temperature"][i] = y[1]
+        records["co2"][i] = co2
+        records["cooling"][i] = power
+
+    save(0)
+    for i in range(1, steps + 1):
+        t = y[1]
+        on = (t > setpoint + hysteresis) | (on & (t >= setpoint - hysteresis))
+        power = np.where(on, cooling, 0.0)
+
+        y_next = step(derivative, y, dt)
+        np.clip(y_next[0], 0.0, 1.0, out=y_next[0])
+        co2 = np.minimum(co2 + (y_next[0] - y[0]) * co2_per_x,
+                         co2_saturation(y_next[1]))
+        y = y_next
+
+        if i % record_every == 0:
+            save(i // record_every)
+
+    plato = og - records["x"] * (og - fg)
+    sg = plato_to_sg(plato.ravel()).reshape(plato.shape)
+    return SimulationResult(np.arange(n) * record_every * dt, plato, sg,
+                            records["temperature"], records["co2"],
+                            records["cooling"])
@@ -0,0 +1,143 @@
+"""
+Parallel evaluation of receipe scenarios.
+
+A sweep varies volume, gravity, efficiency and hop cooktimes of a receipe
+over a grid and calculates the malt and hop amounts of each scenario. The
+scenarios are split into chunks, each chunk is evaluated in one vectorized
+call and the chunks are distributed over a pool of worker processes. The
+results are returned in the order of the scenarios.
+
+Example::
+
+    receipe = Receipe([(PILSENER_MALT, 0.8), (MUNICH_MALT, 0.2)],
+                      [(30, 5.5, 60), (10, 4.0, 10)])
+    result = sweep(receipe, grid(volume=[20, 500, 1000],
+                                 gravity=np.arange(10, 20, 0.5),
+                                 efficiency=[0.65, 0.7, 0.75]))
+
+"""
+
+import itertools
+import os
+from collections import namedtuple
+from functools import partial
+
+import numpy as np
+
+from . import receipe as _receipe
+from .units.gravity import _interpolator, PLATO, SPECIFIC_GRAVITY
+from .utilities import chunked, ordered_map
+
+
+# Definition of namedtuple Receipe, the malt composition as list of tuples
+# (Malt, share) and the hop additions as list of tuples
+# (ibu, alpha, cooktime)
+Receipe = namedtuple("Receipe", ('composition', 'hops'))
+
+# Definition of namedtuple Scenario, one point of the grid. cooktime is a
+# tuple with the cooktime of each hop addition or None for the cooktimes
+# of the receipe
+Scenario = namedtuple("Scenario", ('volume', 'gravity', 'efficiency',
+                                   'cooktime'))
+
+# Definition of namedtuple SweepResult, result of sweep with one row per
+# scenario
+SweepResult = namedtuple("SweepResult", ('scenarios', 'total_weight',
+                                         'malt_weights', 'hop_amounts'))
+
+
+def grid(volume, gravity, efficiency=(0.75,), cooktime=(None,)) -> list:
+    """
+    Create all combinations of the given parameters.
+
+    :param volume: volumes of the wort in liters
+    :param gravity: gravities of the wort in °Pl
+    :param efficiency: brewhouse efficiencies
+    :param cooktime: tuples with the cooktime of each hop addition in
+        minutes, None for the cooktimes of the receipe
+    :return: list of `Scenario`
+
+    """
+    return [Scenario(*p) for p in itertools.product(
+        volume, gravity, efficiency, cooktime)]
+
+
+def _preload():
+    """
+    Load the data tables and build the interpolators, so forked worker
+    processes share them with the parent.
+
+    """
+    _interpolator(PLATO, SPECIFIC_GRAVITY)
+    _receipe._hop_saturation_interpolator()
+
+
+def evaluate(receipe: Receipe, scenarios) -> SweepResult:
+    """
+    Evaluate scenarios of a receipe in one vectorized call.
+
+    :param receipe: the receipe
+    :param scenarios: list of `Scenario`
+    :return: `SweepResult`
+
+    """
+    malts = [malt for malt, _ in receipe.composition]
+    shares = [share for _, share in receipe.composition]
+    ibu, alpha, cooktime = (np.array(c, dtype=float).reshape(-1)
+                            for c in zip(*receipe.hops)) \
+        if receipe.hops else (np.empty(0),) * 3
+
+    volume = np.array([s.volume for s in scenarios], dtype=float)
+    plato = np.array([s.gravity for s in scenarios], dtype=float)
+    efficiency = np.array([s.efficiency for s in scenarios], dtype=float)
+    cooktimes = np.array([cooktime if s.cooktime is None else s.cooktime
+                          for s in scenarios], dtype=float).reshape(
+        len(scenarios), len(cooktime))
+
+    malt = _receipe.malt_compositions(volume, plato, malts, shares,
+                                      efficiency)
+    hops = _receipe.hop_quantities(ibu, alpha, volume[:, np.newaxis],
+                                   cooktimes, plato[:, np.newaxis])
+
+    return SweepResult(list(scenarios), malt.total_weight, malt.weights, hops)
+
+
+def sweep(receipe: Receipe, scenarios, jobs=None, chunksize=1000,
+          progress=None) -> SweepResult:
+    """
+    Evaluate scenarios of a receipe in parallel.
+
+    :param receipe: the receipe
+    :param scenarios: sequence of `Scenario`, e.g. created by `grid`
+    :param jobs: number of worker processes, by default the number of CPUs.
+        With 1 everything runs in the calling process.
+    :param chunksize: number of scenarios evaluated in one call and sent to
+        a worker at once
+    :param progress: function called after each chunk with the number of
+        scenarios done and the total number of scenarios
+    :return: `SweepResult` with one row per scenario, in the order of
+        `scenarios`
+
+    """
+    scenarios = list(scenarios)
+    jobs = jobs or os.cpu_count() or 1
+    _preload()
+
+    parts = []
+    done = 0
+    for part in ordered_map(partial(evaluate, receipe),
+                            chunked(scenarios, chunksize), jobs,
+                            initializer=_preload):
+        parts.append(part)
+        done += len(part.scenarios)
+        if progress is not None:
+            progress(done, len(scenarios))
+
+    if not parts:
+        m, k = len(receipe.composition), len(receipe.hops)
+        return SweepResult([], np.empty(0), np.empty((0, m)),
+                           np.empty((0, k)))
+    return SweepResult(scenarios,
+                       np.concatenate([p.total_weight for p in parts]),
+                       np.concatenate([p.malt_weights for p in parts]),
+                       np.concatenate([p.hop_amounts for p in parts]))
@@ -1,3 +1,42 @@
-from .gravity import Gravity, PLATO, SPECIFIC_GRAVITY
-from .temperature import Temperature, CELSIUS, FAHRENHEIT
-from .concentration import Concentration, GRAMS_PER_LITER
\ No newline at end of file
+"""
+Units of brewing quantities.
+
+The submodules are imported on first access of one of their names, e.g.
+`Temperature` and `Concentration` are available without importing NumPy
+and the gravity data table.
+
+"""
+
+import importlib
+
+
+# exported names by submodule
+_submodules = {
+    "gravity": ("Gravity", "GravityArray", "PLATO", "SPECIFIC_GRAVITY",
+                "BRIX", "GRAVITY_POINTS", "plato_to_sg", "sg_to_plato"),
+    "temperature": ("Temperature", "CELSIUS", "FAHRENHEIT", "KELVIN"),
+    "concentration": ("Concentration", "GRAMS_PER_LITER",
+                      "MILLIGRAMS_PER_LITER"),
+    "cache": ("enable_cache", "disable_cache", "cache_info", "cache_clear"),
+    "registry": (),
+}
+_exports = {name: module for module, names in _submodules.items()
+            for name in names}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name):
+    if name in _exports:
+        module = importlib.import_module("." + _exports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | set(_submodules))
@@ -0,0 +1,93 @@
+"""
+Opt-in memoization of unit conversions.
+
+Readings of hydrometers and thermometers are quantized, so the same values
+are converted over and over. With the cache enabled the conversions of
+`Gravity` and `Temperature` are looked up in a bounded LRU cache keyed on
+(value, unit, target unit, conversion function). Example::
+
+    >>> from beerpy import units
+    >>> units.enable_cache(maxsize=1024)
+    >>> units.Gravity(1.048, units.SPECIFIC_GRAVITY).plato
+    12.0
+    >>> units.cache_info()
+    CacheInfo(hits=0, misses=1, maxsize=1024, currsize=1)
+    >>> units.disable_cache()
+
+"""
+
+from functools import lru_cache
+
+from . import registry
+from .registry import register  # noqa: F401, moved to the registry
+
+
+_compiled = registry._compiled
+_cached_convert = None
+
+
+def _convert(value, unit, target, backend):
+    return (_compiled.get((unit, target, False)) or
+            registry.converter(unit, target))(value, backend)
+
+
+def convert(value, unit: str, target: str, backend=None):
+    """
+    Convert a value between two units by the compiled conversion of the
+    `registry`, memoized if the cache is enabled.
+
+    :param value: the value
+    :param unit: unit of the value
+    :param target: unit the value is converted to
+    :param backend: conversion function, e.g. FCT_DATA for gravities. It is
+        part of the cache key so it must not be None for conversions that
+        depend on it.
+    :returns: the converted value
+
+    """
+    if _cached_convert is None:
+        return (_compiled.get((unit, target, False)) or
+                registry.converter(unit, target))(value, backend)
+    return _cached_convert(value, unit, target, backend)
+
+
+def enable_cache(maxsize: int=4096):
+    """
+    Enable the conversion cache. An already enabled cache is replaced by an
+    empty one.
+
+    :param maxsize: maximum number of cached conversions, the least recently
+        used ones are evicted first. None for an unbounded cache.
+
+    """
+    global _cached_convert
+    _cached_convert = lru_cache(maxsize=maxsize)(_convert)
+
+
+def disable_cache():
+    """
+    Disable the conversion cache and drop all cached conversions.
+
+    """
+    global _cached_convert
+    _cached_convert = None
+
+
+def cache_info():
+    """
+    :returns: the hits, misses, maxsize and current size of the cache as
+        `functools` CacheInfo, None if the cache is disabled
+
+    """
+    if _cached_convert is None:
+        return None
+    return _cached_convert.cache_info()
+
+
+def cache_clear():
+    """
+    Drop all cached conversions and reset the statistics.
+
+    """
+    if _cached_convert is not None:
+        _cached_convert.cache_clear()
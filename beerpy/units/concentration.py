@@ -3,19 +3,59 @@ Concentration unit
 
 """
 
+from . import cache, registry
+from .registry import _dimensions
+
+
+CONCENTRATION = "concentration"
+
 GRAMS_PER_LITER = "g/l"
-_units = (GRAMS_PER_LITER)
+MILLIGRAMS_PER_LITER = "mg/l"
+
+for _unit in (GRAMS_PER_LITER, MILLIGRAMS_PER_LITER):
+    registry.define(_unit, CONCENTRATION)
+registry.register_linear(GRAMS_PER_LITER, MILLIGRAMS_PER_LITER, 1000.0)
 
 
 class Concentration:
+    """
+    Concentration value with its unit. Concentration objects are immutable
+    and hashable.
+
+    """
+
+    __slots__ = ('_value', '_unit')
+
+    def __init__(self, value: float, unit: str=GRAMS_PER_LITER):
+        assert _dimensions.get(unit) == CONCENTRATION, \
+            "unit parameter not in {}".format(registry.units(CONCENTRATION))
 
-    def __init__(self, value: float):
-        self.value = value
-        self._unit = GRAMS_PER_LITER
+        self._value = value
+        self._unit = unit
 
     def __repr__(self):
         return "Concentration: {}{}".format(self.value, self.unit)
 
+    def __eq__(self, other):
+        if not isinstance(other, Concentration):
+            return NotImplemented
+        return (self._value, self._unit) == (other._value, other._unit)
+
+    def __hash__(self):
+        return hash((self._value, self._unit))
+
+    @property
+    def value(self):
+        return self._value
+
     @property
     def unit(self):
         return self._unit
+
+    def to(self, unit: str):
+        """
+        :param unit: a concentration unit of the `registry`
+        :returns: value of the concentration in the unit
+
+        """
+        return cache.convert(self._value, self._unit, unit)
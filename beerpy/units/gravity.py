@@ -2,31 +2,99 @@
 Functions for converting gravity units. Source:
 http://www.brewersfriend.com/plato-to-sg-conversion-chart
 
+There are three conversion functions, selected by the `fct` parameter of
+the conversions and of `Gravity` or globally by `set_default_fct`:
+
+FCT_DATA
+    linear interpolation on the data table (default)
+FCT_POLY
+    the polynomials of the source, the fastest choice for hot loops
+FCT_CHEB
+    Chebyshev polynomials of degree CHEB_DEGREE fitted to the data table on
+    first use, so they follow the table if it is changed
+
+The maximum deviation from the data table on its points is listed below and
+in `MAX_ERROR`. It is dominated by the table's resolution of 0.001 SG, so
+FCT_CHEB is not more accurate than FCT_POLY and a higher degree doesn't
+lower the deviation (degree 4 to 16 all deviate by 0.11..0.12°P).
+FCT_POLY and FCT_CHEB are only checked in the range of the table
+(0.5..40°P) and do not raise for values outside of it.
+
+======== ========= ======
+fct      SG        °P
+======== ========= ======
+FCT_DATA 0         0
+FCT_POLY 0.0005    0.14
+FCT_CHEB 0.0005    0.12
+======== ========= ======
+
 """
 
-import os
+from functools import lru_cache
 
-import pandas as pd
-from scipy.interpolate import interp1d
-from ..utilities import datadir
+import numpy as np
+from . import cache, registry
+from .registry import _dimensions
+from ..instrument import timed
+from ..interpolation import LinearInterpolator
+from ..utilities import load_table
 
 
 FCT_DATA = "data"
 FCT_POLY = "poly"
+FCT_CHEB = "cheb"
+_fcts = (FCT_DATA, FCT_POLY, FCT_CHEB)
+
+# maximum deviation (SG, °P) from the data table for each function
+MAX_ERROR = {
+    FCT_DATA: (0.0, 0.0),
+    FCT_POLY: (0.0005, 0.14),
+    FCT_CHEB: (0.0005, 0.12),
+}
+
+# degree of the Chebyshev polynomials of FCT_CHEB, the lowest one at the
+# resolution limit of the table
+CHEB_DEGREE = 6
+
+_default_fct = FCT_DATA
 
 
+GRAVITY = "gravity"
+
 PLATO = "°P"
 SPECIFIC_GRAVITY = "kg/m³"
-_units = (PLATO, SPECIFIC_GRAVITY)
+# the Brix scale differs from the Plato scale by less than 0.01°, both are
+# converted 1:1
+BRIX = "°Bx"
+# gravity points, (SG - 1) * 1000
+GRAVITY_POINTS = "GU"
+
+GRAVITY_TABLE = "gravity.csv"
+
+
+def set_default_fct(fct):
+    """
+    Set the conversion function used when no `fct` is given.
+
+    :param fct: FCT_DATA, FCT_POLY or FCT_CHEB
+
+    """
+    global _default_fct
+    if fct not in _fcts:
+        raise ValueError("value for parameter fct is not valid.")
+    _default_fct = fct
+
 
-_f_gravity = os.path.join(datadir(), "gravity.csv")
-_df_gravity = pd.read_csv(_f_gravity, sep=',', decimal='.')
+def get_default_fct():
+    """
+    :returns: the conversion function used when no `fct` is given
 
-_plato = list(_df_gravity.Plato)
-_sg = list(_df_gravity.SG)
+    """
+    return _default_fct
 
 
 # polynomical functions
+@timed("gravity.poly.pl_to_sg")
 def _poly_pl_to_sg(pl):
     """
     Polynom for calculating sg from pl.
@@ -35,6 +103,7 @@ def _poly_pl_to_sg(pl):
     return 1.0 + (pl / (258.6 - ((pl / 258.2) * 227.1)))
 
 
+@timed("gravity.poly.sg_to_pl")
 def _poly_sg_to_pl(sg):
     """
     Polynom for calculating pl from sg.
@@ -43,114 +112,349 @@ def _poly_sg_to_pl(sg):
     return -616.868 + 1111.14 * sg - 630.272 * sg**2 + 135.997 * sg ** 3
 
 
+@lru_cache(maxsize=None)
+def _interpolator(source, target):
+    """
+    Interpolator for converting `source` to `target` units by the data
+    table. It is built on first use and reused by all later conversions.
+
+    """
+    table = load_table(GRAVITY_TABLE)
+    columns = {PLATO: table["Plato"], SPECIFIC_GRAVITY: table["SG"]}
+    return LinearInterpolator(columns[source], columns[target])
+
+
+@timed("gravity.data.pl_to_sg")
 def _data_pl_to_sg(pl):
     """
     Use data table and linear interpolation for calculating sg from pl.
 
     """
-    f = interp1d(_plato, _sg)
-    return float(f(pl))
+    return _interpolator(PLATO, SPECIFIC_GRAVITY)(pl)
 
 
+@timed("gravity.data.sg_to_pl")
 def _data_sg_to_pl(sg):
     """
     Use data table and linear interpolation for calculating pl from sg.
 
     """
-    f = interp1d(_sg, _plato)
-    return float(f(sg))
+    return _interpolator(SPECIFIC_GRAVITY, PLATO)(sg)
 
 
-def _interpolate(xdata, ydata, xval):
+@lru_cache(maxsize=None)
+def _chebyshev(source, target):
     """
-    Interpolate between given points.
+    Chebyshev polynomial fitted to the data table for converting `source`
+    to `target` units. It is fitted on first use and evaluated by Horner's
+    scheme, which works for floats and arrays alike.
 
     """
-    f = interp1d(xdata, ydata)
-    return f(xval)
+    from numpy.polynomial import Chebyshev, Polynomial
+
+    table = load_table(GRAVITY_TABLE)
+    columns = {PLATO: table["Plato"], SPECIFIC_GRAVITY: table["SG"]}
+    cheb = Chebyshev.fit(columns[source], columns[target], CHEB_DEGREE)
+
+    # power series in the scaled variable u = offset + scale * x
+    offset, scale = (float(c) for c in cheb.mapparms())
+    coef = [float(c) for c in reversed(
+        Chebyshev(cheb.coef).convert(kind=Polynomial).coef)]
+
+    def f(x):
+        u = offset + scale * x
+        y = 0.0
+        for c in coef:
+            y = y * u + c
+        return y
 
+    return f
+
+
+@timed("gravity.cheb.pl_to_sg")
+def _cheb_pl_to_sg(pl):
+    """
+    Use fitted Chebyshev polynomial for calculating sg from pl.
 
-def _pl_to_sg(pl, fct=FCT_DATA):
+    """
+    return _chebyshev(PLATO, SPECIFIC_GRAVITY)(pl)
+
+
+@timed("gravity.cheb.sg_to_pl")
+def _cheb_sg_to_pl(sg):
+    """
+    Use fitted Chebyshev polynomial for calculating pl from sg.
+
+    """
+    return _chebyshev(SPECIFIC_GRAVITY, PLATO)(sg)
+
+
+@timed("gravity.data.pl_to_sg")
+def _data_plato_to_sg(pl):
+    """
+    Use data table and linear interpolation for calculating sg from pl for
+    an array.
+
+    """
+    return _interpolator(PLATO, SPECIFIC_GRAVITY).vector(pl)
+
+
+@timed("gravity.data.sg_to_pl")
+def _data_sg_to_plato(sg):
+    """
+    Use data table and linear interpolation for calculating pl from sg for
+    an array.
+
+    """
+    return _interpolator(SPECIFIC_GRAVITY, PLATO).vector(sg)
+
+
+def _pl_to_sg(pl, fct=None):
     """
     Calculate specific gravity from °Pl.
 
     :param pl: gravity in °Pl
+    :param fct: conversion function, None for the default
     :returns: specific gravity (SPECIFIC_GRAVITY)
 
     """
+    fct = fct or _default_fct
     if fct == FCT_DATA:
         return _data_pl_to_sg(pl)
     elif fct == FCT_POLY:
         return _poly_pl_to_sg(pl)
+    elif fct == FCT_CHEB:
+        return _cheb_pl_to_sg(pl)
     else:
         raise ValueError("value for parameter fct is not valid.")
 
 
-def _sg_to_pl(sg, fct=FCT_DATA):
+def _sg_to_pl(sg, fct=None):
     """
     Calculate °Pl from specific gravity.
 
     :param sg: specific gravity (SPECIFIC_GRAVITY)
+    :param fct: conversion function, None for the default
     :returns: gravity in °Pl
 
     """
+    fct = fct or _default_fct
     if fct == FCT_DATA:
         return _data_sg_to_pl(sg)
     elif fct == FCT_POLY:
         return _poly_sg_to_pl(sg)
+    elif fct == FCT_CHEB:
+        return _cheb_sg_to_pl(sg)
+    else:
+        raise ValueError("value for parameter fct is not valid.")
+
+
+def plato_to_sg(pl, fct=None) -> np.ndarray:
+    """
+    Calculate specific gravity from °Pl for many values in one call.
+
+    :param pl: gravities in °Pl as a NumPy array, pandas Series or any other
+        array-like
+    :param fct: conversion function FCT_DATA, FCT_POLY or FCT_CHEB, None for
+        the default
+    :returns: NumPy array of specific gravities (SPECIFIC_GRAVITY)
+
+    """
+    pl = np.asarray(pl, dtype=float)
+    fct = fct or _default_fct
+    if fct == FCT_DATA:
+        return _data_plato_to_sg(pl)
+    elif fct == FCT_POLY:
+        return _poly_pl_to_sg(pl)
+    elif fct == FCT_CHEB:
+        return _cheb_pl_to_sg(pl)
+    else:
+        raise ValueError("value for parameter fct is not valid.")
+
+
+def sg_to_plato(sg, fct=None) -> np.ndarray:
+    """
+    Calculate °Pl from specific gravity for many values in one call.
+
+    :param sg: specific gravities (SPECIFIC_GRAVITY) as a NumPy array,
+        pandas Series or any other array-like
+    :param fct: conversion function FCT_DATA, FCT_POLY or FCT_CHEB, None for
+        the default
+    :returns: NumPy array of gravities in °Pl
+
+    """
+    sg = np.asarray(sg, dtype=float)
+    fct = fct or _default_fct
+    if fct == FCT_DATA:
+        return _data_sg_to_plato(sg)
+    elif fct == FCT_POLY:
+        return _poly_sg_to_pl(sg)
+    elif fct == FCT_CHEB:
+        return _cheb_sg_to_pl(sg)
     else:
         raise ValueError("value for parameter fct is not valid.")
 
 
+for _unit in (PLATO, SPECIFIC_GRAVITY, BRIX, GRAVITY_POINTS):
+    registry.define(_unit, GRAVITY)
+registry.register(PLATO, SPECIFIC_GRAVITY, _pl_to_sg, plato_to_sg)
+registry.register(SPECIFIC_GRAVITY, PLATO, _sg_to_pl, sg_to_plato)
+registry.register_linear(PLATO, BRIX, 1.0)
+registry.register_linear(SPECIFIC_GRAVITY, GRAVITY_POINTS, 1000.0, -1000.0)
+
+
 class Gravity:
+    """
+    Gravity value with its unit.
 
-    def __init__(self, value, unit=PLATO):
-        self.value = value
-        self._unit = unit
+    Gravity objects are immutable and hashable. Besides the value in its
+    own unit the gravity is kept in °P and specific gravity, which are
+    converted once on first access. Other units are converted by `to`.
+
+    :param value: value of the gravity
+    :param unit: unit of the value
+    :param fct: conversion function FCT_DATA, FCT_POLY or FCT_CHEB, None for
+        the default at the time of the conversion
+
+    """
+
+    __slots__ = ('_value', '_unit', '_fct', '_plato', '_sg')
 
-        assert unit in _units, "unit parameter not in {}".format(_units)
+    def __init__(self, value, unit=PLATO, fct=None):
+        assert _dimensions.get(unit) == GRAVITY, \
+            "unit parameter not in {}".format(registry.units(GRAVITY))
+        assert fct is None or fct in _fcts, \
+            "fct parameter not in {}".format(_fcts)
+
+        self._value = value
+        self._unit = unit
+        self._fct = fct
+        self._plato = value if unit == PLATO else None
+        self._sg = value if unit == SPECIFIC_GRAVITY else None
 
     def __repr__(self):
         return "Gravity: {}{}".format(self.value, self.unit)
 
+    def __eq__(self, other):
+        if not isinstance(other, Gravity):
+            return NotImplemented
+        return (self._value, self._unit) == (other._value, other._unit)
+
+    def __hash__(self):
+        return hash((self._value, self._unit))
+
+    @property
+    def value(self):
+        return self._value
+
     @property
     def unit(self):
         return self._unit
 
-    # pl property
+    @property
+    def fct(self):
+        return self._fct
+
     @property
     def plato(self):
         """
-        get / set value of the gravity in °Pl
+        value of the gravity in °Pl
 
         """
-        if self.unit == PLATO:
-            return self.value
-        elif self.unit == SPECIFIC_GRAVITY:
-            return _sg_to_pl(self.value)
-
-    @plato.setter
-    def plato(self, value):
-        if self.unit == PLATO:
-            self.value = value
-        elif self.unit == SPECIFIC_GRAVITY:
-            self.value = _pl_to_sg(value)
-
-    # sg property
+        if self._plato is None:
+            self._plato = cache.convert(self._value, self._unit, PLATO,
+                                        self._fct or _default_fct)
+        return self._plato
+
     @property
     def specific_gravity(self):
         """
-        get / set value of the gravity in kg/m³
+        value of the gravity in kg/m³
+
+        """
+        if self._sg is None:
+            self._sg = cache.convert(self._value, self._unit,
+                                     SPECIFIC_GRAVITY,
+                                     self._fct or _default_fct)
+        return self._sg
+
+    def to(self, unit: str):
+        """
+        :param unit: a gravity unit of the `registry`
+        :returns: value of the gravity in the unit
+
+        """
+        return cache.convert(self._value, self._unit, unit,
+                             self._fct or _default_fct)
+
+
+class GravityArray:
+    """
+    Array of gravity values sharing one unit.
+
+    The conversions are computed for all values at once. Indexing with an
+    integer returns a single `Gravity`, slicing returns a new `GravityArray`.
+
+    :param values: array-like of gravity values
+    :param unit: unit of the values
+    :param fct: conversion function FCT_DATA, FCT_POLY or FCT_CHEB, None for
+        the default
+
+    """
+
+    def __init__(self, values, unit=PLATO, fct=None):
+        self.values = np.asarray(values, dtype=float)
+        self._unit = unit
+        self._fct = fct
+
+        assert _dimensions.get(unit) == GRAVITY, \
+            "unit parameter not in {}".format(registry.units(GRAVITY))
+        assert fct is None or fct in _fcts, \
+            "fct parameter not in {}".format(_fcts)
+
+    def __repr__(self):
+        return "GravityArray: {}{}".format(self.values, self.unit)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        value = self.values[index]
+        if np.ndim(value) == 0:
+            return Gravity(float(value), unit=self.unit, fct=self.fct)
+        return GravityArray(value, unit=self.unit, fct=self.fct)
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def fct(self):
+        return self._fct
+
+    @property
+    def plato(self) -> np.ndarray:
+        """
+        values of the gravities in °Pl
+
+        """
+        return self.to(PLATO)
+
+    @property
+    def specific_gravity(self) -> np.ndarray:
+        """
+        values of the gravities in kg/m³
+
+        """
+        return self.to(SPECIFIC_GRAVITY)
+
+    def to(self, unit: str) -> np.ndarray:
+        """
+        :param unit: a gravity unit of the `registry`
+        :returns: values of the gravities in the unit
 
         """
-        if self.unit == PLATO:
-            return _pl_to_sg(self.value)
-        elif self.unit == SPECIFIC_GRAVITY:
-            return self.value
-
-    @specific_gravity.setter
-    def specific_gravity(self, value):
-        if self.unit == PLATO:
-            self.value = _sg_to_pl(value)
-        elif self.unit == SPECIFIC_GRAVITY:
-            self.value = value
+        if unit == self.unit:
+            return self.values
+        return registry.converter(self.unit, unit, vectorized=True)(
+            self.values, self.fct)
@@ -0,0 +1,215 @@
+"""
+Registry of the units and of the conversions between them.
+
+Each unit belongs to a dimension, e.g. gravity or temperature, and the
+conversions are registered as edges between two units of the same
+dimension. A conversion between any two units of a dimension is resolved
+once by the shortest path of edges and compiled into a single function,
+which is cached. Consecutive linear edges are folded into one
+multiply-add, e.g. °F to K is a single step although it is registered as
+°F to °C and °C to K. Example::
+
+    >>> from beerpy.units.temperature import FAHRENHEIT, KELVIN
+    >>> path(FAHRENHEIT, KELVIN)
+    ('°F', '°C', 'K')
+    >>> round(convert(68.0, FAHRENHEIT, KELVIN), 2)
+    293.15
+
+The conversion functions are called with the value and the conversion
+function (backend) of the dimension, e.g. FCT_DATA for gravities, which
+is ignored by conversions that don't depend on it. This module doesn't
+import NumPy, the vectorized conversions default to the scalar ones which
+work on arrays as long as they only use arithmetic.
+
+"""
+
+from collections import deque, namedtuple
+
+
+# Definition of namedtuple Edge, the scalar and vectorized conversion
+# function between two units and for linear conversions the tuple
+# (factor, offset), else None
+Edge = namedtuple("Edge", ('fct', 'vector_fct', 'linear'))
+
+# dimension by unit
+_dimensions = {}
+# edges by unit and target unit
+_edges = {}
+# compiled conversions by (unit, target, vectorized)
+_compiled = {}
+
+
+def define(unit: str, dimension: str):
+    """
+    Define a unit.
+
+    :param unit: symbol of the unit, e.g. "°C"
+    :param dimension: name of the dimension, e.g. "temperature"
+
+    """
+    if _dimensions.get(unit, dimension) != dimension:
+        raise ValueError("unit {} is already defined for {}.".format(
+            unit, _dimensions[unit]))
+    _dimensions[unit] = dimension
+    _edges.setdefault(unit, {})
+
+
+def register(unit: str, target: str, fct, vector_fct=None, linear=None):
+    """
+    Register the conversion function between two units. Conversions
+    compiled before are dropped.
+
+    :param unit: unit of the values
+    :param target: unit the values are converted to
+    :param fct: function called with the value and the conversion function
+        (backend) which returns the converted value
+    :param vector_fct: function like `fct` for arrays of values, by default
+        `fct`
+    :param linear: tuple (factor, offset) if the conversion is
+        factor * value + offset
+
+    """
+    for u in (unit, target):
+        if u not in _dimensions:
+            raise ValueError("unit {} is not defined.".format(u))
+    if _dimensions[unit] != _dimensions[target]:
+        raise ValueError("can't convert {} to {}.".format(unit, target))
+    _edges[unit][target] = Edge(fct, vector_fct or fct, linear)
+    _compiled.clear()
+
+
+def register_linear(unit: str, target: str, factor: float,
+                    offset: float=0.0):
+    """
+    Register a linear conversion target = factor * unit + offset and its
+    inverse.
+
+    """
+    register(unit, target,
+             lambda value, backend: value * factor + offset,
+             linear=(factor, offset))
+    register(target, unit,
+             lambda value, backend: (value - offset) / factor,
+             linear=(1.0 / factor, -offset / factor))
+
+
+def dimension(unit: str) -> str:
+    """
+    :returns: the dimension of the unit
+
+    """
+    try:
+        return _dimensions[unit]
+    except KeyError:
+        raise ValueError("unit {} is not defined.".format(unit)) from None
+
+
+def units(dimension: str=None) -> tuple:
+    """
+    :param dimension: name of the dimension, None for all units
+    :returns: the defined units of the dimension
+
+    """
+    return tuple(u for u, d in _dimensions.items()
+                 if dimension is None or d == dimension)
+
+
+def path(unit: str, target: str) -> tuple:
+    """
+    :returns: the units on the shortest path of conversions from `unit` to
+        `target`, including both
+
+    """
+    dimension(unit)
+    dimension(target)
+    previous = {unit: None}
+    queue = deque([unit])
+    while queue:
+        u = queue.popleft()
+        if u == target:
+            break
+        for v in _edges[u]:
+            if v not in previous:
+                previous[v] = u
+                queue.append(v)
+    else:
+        raise ValueError("no conversion from {} to {}.".format(unit, target))
+
+    steps = [target]
+    while steps[-1] != unit:
+        steps.append(previous[steps[-1]])
+    return tuple(reversed(steps))
+
+
+def _linear(factor, offset):
+    if offset == 0.0:
+        return lambda value, backend=None: value * factor
+    return lambda value, backend=None: value * factor + offset
+
+
+def _chain(first, second):
+    return lambda value, backend=None: second(first(value, backend), backend)
+
+
+def _compile(unit, target, vectorized):
+    steps = path(unit, target)
+    if len(steps) == 1:
+        return lambda value, backend=None: value
+
+    # consecutive linear edges are folded to one (factor, offset), single
+    # edges keep their function which may round differently
+    fcts = []
+    run = []
+    for u, v in list(zip(steps, steps[1:])) + [(None, None)]:
+        edge = _edges[u][v] if u is not None else None
+        if edge is not None and edge.linear is not None:
+            run.append(edge)
+            continue
+        if len(run) == 1:
+            fcts.append(run[0].vector_fct if vectorized else run[0].fct)
+        elif run:
+            factor, offset = 1.0, 0.0
+            for e in run:
+                factor, offset = (factor * e.linear[0],
+                                  offset * e.linear[0] + e.linear[1])
+            fcts.append(_linear(factor, offset))
+        run = []
+        if edge is not None:
+            fcts.append(edge.vector_fct if vectorized else edge.fct)
+
+    fct = fcts[0]
+    for f in fcts[1:]:
+        fct = _chain(fct, f)
+    return fct
+
+
+def converter(unit: str, target: str, vectorized: bool=False):
+    """
+    :param unit: unit of the values
+    :param target: unit the values are converted to
+    :param vectorized: True for a conversion of arrays
+    :returns: the compiled conversion, a function called with the value and
+        the backend
+
+    """
+    key = unit, target, vectorized
+    fct = _compiled.get(key)
+    if fct is None:
+        fct = _compiled[key] = _compile(unit, target, vectorized)
+    return fct
+
+
+def convert(value, unit: str, target: str, backend=None):
+    """
+    Convert a value between two units of the same dimension.
+
+    :param value: the value
+    :param unit: unit of the value
+    :param target: unit the value is converted to
+    :param backend: conversion function of the dimension, e.g. FCT_DATA for
+        gravities
+    :returns: the converted value
+
+    """
+    return (_compiled.get((unit, target, False)) or
+            converter(unit, target))(value, backend)
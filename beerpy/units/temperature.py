@@ -3,10 +3,15 @@ Temperature unit
 
 """
 
+from . import cache, registry
+from .registry import _dimensions
+
+
+TEMPERATURE = "temperature"
 
 CELSIUS = "°C"
 FAHRENHEIT = "°F"
-_units = (CELSIUS, FAHRENHEIT)
+KELVIN = "K"
 
 
 def _fahrenheit_to_celsius(fahrenheit: float):
@@ -17,47 +22,73 @@ def _celsius_to_fahrenheit(celsius: float):
     return celsius * 1.8 + 32.0
 
 
+for _unit in (CELSIUS, FAHRENHEIT, KELVIN):
+    registry.define(_unit, TEMPERATURE)
+registry.register_linear(CELSIUS, FAHRENHEIT, 1.8, 32.0)
+registry.register_linear(CELSIUS, KELVIN, 1.0, 273.15)
+
+
 class Temperature:
+    """
+    Temperature value with its unit.
+
+    Temperature objects are immutable and hashable. Besides the value in
+    its own unit the temperature is kept in °C and °F, which are converted
+    once on first access. Other units are converted by `to`.
+
+    """
+
+    __slots__ = ('_value', '_unit', '_celsius', '_fahrenheit')
 
     def __init__(self, value: float, unit: str=CELSIUS):
-        # unit string
-        self.value = value
-        self._unit = unit
+        assert _dimensions.get(unit) == TEMPERATURE, \
+            "unit parameter not in {}".format(registry.units(TEMPERATURE))
 
-        # safe value in celsius
-        assert unit in _units, "unit parameter not in {}".format(_units)
+        self._value = value
+        self._unit = unit
+        self._celsius = value if unit == CELSIUS else None
+        self._fahrenheit = value if unit == FAHRENHEIT else None
 
     def __repr__(self):
         return "Temperature: {}{}".format(self.value, self.unit)
 
+    def __eq__(self, other):
+        if not isinstance(other, Temperature):
+            return NotImplemented
+        return (self._value, self._unit) == (other._value, other._unit)
+
+    def __hash__(self):
+        return hash((self._value, self._unit))
+
+    @property
+    def value(self):
+        return self._value
+
     @property
     def unit(self):
         return self._unit
 
     @property
     def celsius(self):
-        if self.unit == CELSIUS:
-            return self.value
-        elif self.unit == FAHRENHEIT:
-            return _fahrenheit_to_celsius(self.value)
-
-    @celsius.setter
-    def celsius(self, value):
-        if self.unit == CELSIUS:
-            self.value = value
-        elif self.unit == FAHRENHEIT:
-            self.value = _celsius_to_fahrenheit(value)
+        if self._celsius is None:
+            self._celsius = cache.convert(self._value, self._unit, CELSIUS)
+        return self._celsius
 
     @property
     def fahrenheit(self):
-        if self.unit == CELSIUS:
-            return _celsius_to_fahrenheit(self.value)
-        elif self.unit == FAHRENHEIT:
-            return self.value
-
-    @fahrenheit.setter
-    def fahrenheit(self, value):
-        if self.unit == CELSIUS:
-            self.value = _fahrenheit_to_celsius(value)
-        elif self.unit == FAHRENHEIT:
-            self.value = value
+        if self._fahrenheit is None:
+            self._fahrenheit = cache.convert(self._value, self._unit,
+                                             FAHRENHEIT)
+        return self._fahrenheit
+
+    @property
+    def kelvin(self):
+        return cache.convert(self._value, self._unit, KELVIN)
+
+    def to(self, unit: str):
+        """
+        :param unit: a temperature unit of the `registry`
+        :returns: value of the temperature in the unit
+
+        """
+        return cache.convert(self._value, self._unit, unit)
@@ -1,10 +1,299 @@
+import csv
+import glob
+import hashlib
+import itertools
+import json
 import os
+import time
+import warnings
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+from .instrument import timed
 
 
 DATA_DIR = "data"
 
+# coarsest resolution of file modification times in ns (FAT)
+MTIME_RESOLUTION = 2 * 10 ** 9
+
+# manifest of the compiled tables with the header, checksum, size and
+# modification time of the csv source of each table, and of the binaries
+# derived from a table with the name of the table and the same values
+MANIFEST_FILE = "tables.json"
+
 
 def datadir():
     import beerpy
     pkg_dir = os.path.dirname(beerpy.__file__)
     return os.path.join(pkg_dir, DATA_DIR)
+
+
+class Table:
+    """
+    Numeric data table with named columns.
+
+    The values are stored in one read-only float array, each column is a
+    view on it. Tables returned by `load_table` are shared between all
+    users and, if compiled, memory-mapped from the data directory.
+
+    :param header: names of the columns
+    :param rows: rows of numeric values, a sequence of sequences or a
+        two-dimensional array
+
+    """
+
+    def __init__(self, header, rows):
+        self.header = tuple(header)
+        self.data = np.asarray(rows, dtype=float)
+        if self.data.ndim != 2 or self.data.shape[1] != len(self.header):
+            raise ValueError("number of columns does not match the header.")
+        if self.data.flags.writeable:
+            self.data.flags.writeable = False
+        self.columns = tuple(self.data[:, i] for i in range(len(header)))
+
+    def __repr__(self):
+        return "Table: {} rows, columns {}".format(len(self), self.header)
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __getitem__(self, name) -> np.ndarray:
+        return self.columns[self.header.index(name)]
+
+
+@timed("utilities.read_table")
+def read_table(filename) -> Table:
+    """
+    Read a numeric csv file with one header line.
+
+    :param filename: path of the csv file
+    :returns: the table
+
+    """
+    with open(filename, newline='') as f:
+        reader = csv.reader(f)
+        header = [s.strip() for s in next(reader)]
+        rows = [[float(s) for s in row] for row in reader if row]
+    return Table(header, rows)
+
+
+def checksum(filename) -> str:
+    """
+    :returns: the sha256 checksum of the file as hex string
+
+    """
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _binary_name(name):
+    return os.path.splitext(name)[0] + ".npy"
+
+
+def compile_tables(directory=None):
+    """
+    Compile all csv tables of the data directory to binary .npy files,
+    which are memory-mapped by `load_table`. The checksums, sizes and
+    modification times of the csv sources are stored in the manifest so
+    outdated binaries are detected without reading the sources.
+
+    Run this after changing a csv table::
+
+        python -m beerpy.utilities
+
+    :param directory: the data directory, by default the one of beerpy
+
+    """
+    directory = directory or datadir()
+    # entries of binaries derived from the tables, e.g. the lookup tables,
+    # are kept
+    manifest = {name: entry for name, entry in
+                _read_manifest(directory).items() if "source" in entry}
+    for filename in sorted(glob.glob(os.path.join(directory, "*.csv"))):
+        name = os.path.basename(filename)
+        table = read_table(filename)
+        np.save(os.path.join(directory, _binary_name(name)), table.data)
+        manifest[name] = dict(_source_entry(filename), header=table.header)
+    _write_manifest(directory, manifest)
+
+
+def record_binary(name, source, directory=None):
+    """
+    Record a binary file derived from a csv table in the manifest, so
+    `is_binary_current` detects when the table changes.
+
+    :param name: file name of the binary, e.g. "lut_saturation.npy"
+    :param source: file name of the csv table, e.g. "carbonate.csv"
+    :param directory: the data directory, by default the one of beerpy
+
+    """
+    directory = directory or datadir()
+    manifest = _read_manifest(directory)
+    manifest[name] = dict(_source_entry(os.path.join(directory, source)),
+                          source=source)
+    _write_manifest(directory, manifest)
+
+
+def is_binary_current(name) -> bool:
+    """
+    :param name: file name of a binary recorded by `record_binary`
+    :returns: True if the binary exists and its csv table didn't change
+        since
+
+    """
+    entry = _manifest().get(name)
+    if entry is None or "source" not in entry or \
+            not os.path.exists(os.path.join(datadir(), name)):
+        return False
+    return _is_current(os.path.join(datadir(), entry["source"]), entry)
+
+
+def _source_entry(filename) -> dict:
+    stat = os.stat(filename)
+    return {"sha256": checksum(filename), "size": stat.st_size,
+            "mtime": stat.st_mtime_ns, "recorded": time.time_ns()}
+
+
+def _read_manifest(directory) -> dict:
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_manifest(directory, manifest):
+    with open(os.path.join(directory, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    _manifest.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _manifest() -> dict:
+    return _read_manifest(datadir())
+
+
+@lru_cache(maxsize=None)
+def load_table(name) -> Table:
+    """
+    Load a table from the data directory. Each table is loaded only once
+    and shared afterwards.
+
+    The compiled binary of the table is memory-mapped read-only, so the
+    pages are shared by all processes. If there is no binary or it is
+    outdated compared to the csv source, the csv file is parsed instead.
+    The binary is up to date if the size and modification time of the csv
+    source match the manifest, only if the modification time changed,
+    e.g. in a fresh checkout, or is close to the time the table was
+    compiled the checksum of the source is compared.
+
+    :param name: file name of the table, e.g. "gravity.csv"
+    :returns: the table
+
+    """
+    return _load_table(name)
+
+
+def _is_current(filename, entry) -> bool:
+    """
+    :returns: True if the csv source matches its entry in the manifest
+
+    The size and modification time are trusted only if the source was
+    modified well before it was recorded. Else an edit of the same size in
+    the same tick of the modification time could go unnoticed, so the
+    checksum is compared. Edits which keep the size and restore the
+    modification time are not detected.
+
+    """
+    stat = os.stat(filename)
+    if stat.st_size != entry.get("size", stat.st_size):
+        return False
+    if stat.st_mtime_ns == entry.get("mtime") and \
+            stat.st_mtime_ns < entry.get("recorded", 0) - MTIME_RESOLUTION:
+        return True
+    return entry["sha256"] == checksum(filename)
+
+
+@timed("utilities.load_table")
+def _load_table(name) -> Table:
+    filename = os.path.join(datadir(), name)
+    binary = os.path.join(datadir(), _binary_name(name))
+    entry = _manifest().get(name)
+
+    if entry is not None and os.path.exists(binary):
+        if _is_current(filename, entry):
+            return Table(entry["header"], np.load(binary, mmap_mode='r'))
+        warnings.warn("The compiled table of {} is outdated, run "
+                      "'python -m beerpy.utilities' to update it."
+                      .format(name))
+    return read_table(filename)
+
+
+def data_checksum() -> str:
+    """
+    :returns: a checksum over all csv tables of the data directory, which
+        changes whenever one of the tables changes
+
+    """
+    h = hashlib.sha256()
+    for filename in sorted(glob.glob(os.path.join(datadir(), "*.csv"))):
+        h.update(os.path.basename(filename).encode())
+        h.update(checksum(filename).encode())
+    return h.hexdigest()
+
+
+def chunked(iterable, size):
+    """
+    Split an iterable into lists of `size` items, the last one may be
+    shorter. The iterable is consumed lazily.
+
+    """
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_map(fct, iterable, jobs=1, prefetch=2, initializer=None):
+    """
+    Apply `fct` to each item in a pool of worker processes and yield the
+    results in the order of the items.
+
+    Unlike `multiprocessing.Pool.imap` the items are taken from the
+    iterable only as the results are consumed, at most `jobs * prefetch`
+    items are pending at a time. This keeps the memory constant for
+    arbitrarily long iterables.
+
+    :param fct: picklable function of one item
+    :param iterable: the items
+    :param jobs: number of worker processes, with 1 everything runs in
+        the calling process
+    :param prefetch: number of pending items per worker process
+    :param initializer: function called once in each worker process before
+        the first item, e.g. to load the data tables
+
+    """
+    if jobs == 1:
+        yield from map(fct, iterable)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs, initializer=initializer) as executor:
+        pending = deque()
+        for item in iterable:
+            pending.append(executor.submit(fct, item))
+            if len(pending) >= jobs * prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+if __name__ == "__main__":
+    compile_tables()
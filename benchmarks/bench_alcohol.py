@@ -0,0 +1,17 @@
+"""
+Benchmarks of the alcohol calculation.
+
+"""
+
+from beerpy.alcohol import alcohol
+from beerpy.units.gravity import Gravity, SPECIFIC_GRAVITY
+
+
+def bench_alcohol_og():
+    og = Gravity(12.0)
+    return lambda: alcohol(og)
+
+
+def bench_alcohol_og_fg():
+    return lambda: alcohol(Gravity(1.048, SPECIFIC_GRAVITY),
+                           Gravity(1.012, SPECIFIC_GRAVITY))
@@ -0,0 +1,31 @@
+"""
+Benchmarks of the carbonate calculations.
+
+"""
+
+import numpy as np
+
+from beerpy.carbonate import carbonisation, saturation
+from beerpy.units import Temperature
+
+
+N = 10000
+CELSIUS = np.linspace(0.0, 22.0, N)
+
+
+def bench_saturation():
+    t = Temperature(12.5)
+    return lambda: saturation(t)
+
+
+def bench_carbonisation():
+    t = Temperature(12.5)
+    return lambda: carbonisation(5.0, t)
+
+
+def bench_saturation_bulk():
+    return lambda: saturation(CELSIUS)
+
+
+def bench_carbonisation_bulk():
+    return lambda: carbonisation(5.0, CELSIUS)
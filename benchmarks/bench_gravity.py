@@ -0,0 +1,83 @@
+"""
+Benchmarks of the gravity conversions.
+
+"""
+
+import numpy as np
+
+from beerpy import lut
+from beerpy.units.gravity import _pl_to_sg, _sg_to_pl, FCT_DATA, FCT_POLY, \
+    FCT_CHEB, \
+    Gravity, GravityArray, SPECIFIC_GRAVITY, plato_to_sg, sg_to_plato
+
+
+N = 10000
+PLATO = np.linspace(1.0, 30.0, N)
+SG = plato_to_sg(PLATO)
+# unordered hydrometer readings with a resolution of 0.0001 SG
+READINGS = np.round(np.random.RandomState(0).permutation(SG), 4)
+
+
+def bench_pl_to_sg_data():
+    return lambda: _pl_to_sg(12.3, fct=FCT_DATA)
+
+
+def bench_pl_to_sg_poly():
+    return lambda: _pl_to_sg(12.3, fct=FCT_POLY)
+
+
+def bench_sg_to_pl_data():
+    return lambda: _sg_to_pl(1.0493, fct=FCT_DATA)
+
+
+def bench_sg_to_pl_poly():
+    return lambda: _sg_to_pl(1.0493, fct=FCT_POLY)
+
+
+def bench_gravity_new_plato():
+    return lambda: Gravity(1.0493, SPECIFIC_GRAVITY).plato
+
+
+def bench_plato_to_sg_bulk_data():
+    return lambda: plato_to_sg(PLATO, fct=FCT_DATA)
+
+
+def bench_plato_to_sg_bulk_poly():
+    return lambda: plato_to_sg(PLATO, fct=FCT_POLY)
+
+
+def bench_sg_to_plato_bulk_data():
+    return lambda: sg_to_plato(SG, fct=FCT_DATA)
+
+
+def bench_sg_to_plato_bulk_poly():
+    return lambda: sg_to_plato(SG, fct=FCT_POLY)
+
+
+def bench_gravity_array_plato_bulk():
+    return lambda: GravityArray(SG, SPECIFIC_GRAVITY).plato
+
+
+def bench_pl_to_sg_cheb():
+    return lambda: _pl_to_sg(12.3, fct=FCT_CHEB)
+
+
+def bench_sg_to_pl_cheb():
+    return lambda: _sg_to_pl(1.0493, fct=FCT_CHEB)
+
+
+def bench_plato_to_sg_bulk_cheb():
+    return lambda: plato_to_sg(PLATO, fct=FCT_CHEB)
+
+
+def bench_sg_to_plato_bulk_cheb():
+    return lambda: sg_to_plato(SG, fct=FCT_CHEB)
+
+
+def bench_sg_to_plato_readings_data():
+    return lambda: sg_to_plato(READINGS, fct=FCT_DATA)
+
+
+def bench_sg_to_plato_readings_lut():
+    lut.load(lut.SG_TO_PLATO)
+    return lambda: lut.sg_to_plato(READINGS)
@@ -0,0 +1,104 @@
+"""
+Benchmarks of the import time of the beerpy modules.
+
+Each module is imported in a fresh interpreter and the time is taken with
+``python -X importtime``. The interpreter startup itself is not included.
+Subprocess timings are noisy, so the best of `REPEAT` imports is taken.
+Besides ``python -m benchmarks.run`` the import times can be printed with::
+
+    python -m benchmarks.bench_import [-n REPEAT] [module ...]
+
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+MODULES = (
+    "beerpy.units",
+    "beerpy.units.temperature",
+    "beerpy.units.gravity",
+    "beerpy.alcohol",
+    "beerpy.carbonate",
+    "beerpy.receipe",
+    "beerpy.optimize",
+)
+
+# number of imports of which the best time is taken
+REPEAT = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str) -> float:
+    """
+    Import `module` in a new interpreter.
+
+    :returns: cumulative import time in milliseconds
+
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True
+    )
+    for line in reversed(proc.stderr.splitlines()):
+        # import time: self [us] | cumulative | imported package
+        fields = [s.strip() for s in line.split("|")]
+        if fields[-1] == module:
+            return int(fields[1]) / 1000.0
+    raise RuntimeError("no import time found for {}".format(module))
+
+
+def best_import_time(module: str, repeat: int=REPEAT) -> float:
+    """
+    :returns: best cumulative import time in milliseconds of `repeat`
+        imports in new interpreters
+
+    """
+    return min(import_time(module) for _ in range(repeat))
+
+
+def bench_import_units():
+    return best_import_time("beerpy.units") / 1000.0
+
+
+def bench_import_temperature():
+    return best_import_time("beerpy.units.temperature") / 1000.0
+
+
+def bench_import_gravity():
+    return best_import_time("beerpy.units.gravity") / 1000.0
+
+
+def bench_import_alcohol():
+    return best_import_time("beerpy.alcohol") / 1000.0
+
+
+def bench_import_carbonate():
+    return best_import_time("beerpy.carbonate") / 1000.0
+
+
+def bench_import_receipe():
+    return best_import_time("beerpy.receipe") / 1000.0
+
+
+def bench_import_optimize():
+    return best_import_time("beerpy.optimize") / 1000.0
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("-n", "--repeat", type=int, default=REPEAT)
+    args = parser.parse_args(args)
+
+    for module in args.modules:
+        print("{:<24} {:8.1f} ms".format(
+            module, best_import_time(module, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
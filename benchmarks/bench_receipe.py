@@ -0,0 +1,48 @@
+"""
+Benchmarks of the receipe calculations.
+
+"""
+
+import numpy as np
+
+from beerpy.receipe import hop_quantities, hop_quantity, malt_composition, \
+    malt_compositions, PILSENER_MALT, MUNICH_MALT, CARAMALT
+from beerpy.sweep import Receipe, grid, sweep
+from beerpy.units.gravity import Gravity
+
+
+N = 10000
+COMPOSITION = [(PILSENER_MALT, 0.7), (MUNICH_MALT, 0.2), (CARAMALT, 0.1)]
+
+
+def bench_malt_composition():
+    gravity = Gravity(12.0)
+    return lambda: malt_composition(22, gravity, COMPOSITION)
+
+
+def bench_malt_compositions_bulk():
+    malts = [malt for malt, _ in COMPOSITION]
+    shares = np.tile([share for _, share in COMPOSITION], (N, 1))
+    volume = np.linspace(10.0, 1000.0, N)
+    plato = np.linspace(8.0, 20.0, N)
+    return lambda: malt_compositions(volume, plato, malts, shares)
+
+
+def bench_hop_quantity():
+    gravity = Gravity(12.0)
+    return lambda: hop_quantity(40, 5.5, 22, 60, gravity)
+
+
+def bench_hop_quantities_bulk():
+    gravity = Gravity(12.0)
+    ibu = np.full(N, 20.0)
+    alpha = np.linspace(3.0, 15.0, N)
+    cooktime = np.linspace(5.0, 90.0, N)
+    return lambda: hop_quantities(ibu, alpha, 22, cooktime, gravity)
+
+
+def bench_sweep():
+    receipe = Receipe(COMPOSITION, [(30, 5.5, 60), (10, 4.0, 10)])
+    scenarios = grid(np.linspace(10.0, 1000.0, 100), np.linspace(8, 20, 25),
+                     [0.65, 0.7, 0.75, 0.8])
+    return lambda: sweep(receipe, scenarios, jobs=1)
@@ -0,0 +1,30 @@
+"""
+Benchmarks of the fermentation simulation.
+
+"""
+
+import time
+
+import numpy as np
+
+from beerpy.simulation import simulate
+
+
+TANKS = 100
+DAYS = 14
+
+
+def _cellar(solver):
+    start = time.perf_counter()
+    simulate(og=np.linspace(11.0, 16.0, TANKS), fg=2.5, volume=2000,
+             setpoint=12.0, days=DAYS, dt=60.0, solver=solver, cooling=2000.0)
+    return time.perf_counter() - start
+
+
+def bench_simulate_cellar_euler():
+    # a single run of several seconds, timed once
+    return _cellar("euler")
+
+
+def bench_simulate_cellar_rk4():
+    return _cellar("rk4")
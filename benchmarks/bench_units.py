@@ -0,0 +1,76 @@
+"""
+Benchmarks of the unit types.
+
+The property access times are run by ``python -m benchmarks.run``. The
+memory per object is printed by::
+
+    python -m benchmarks.bench_units [-n NUMBER]
+
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from beerpy.units import Concentration, Gravity, Temperature, \
+    SPECIFIC_GRAVITY, FAHRENHEIT, KELVIN
+
+
+OBJECTS = (
+    ("Gravity", lambda: Gravity(12.0)),
+    ("Temperature", lambda: Temperature(20.0)),
+    ("Concentration", lambda: Concentration(5.0)),
+)
+
+
+def memory_per_object(factory, n=100000) -> float:
+    """
+    :returns: memory allocated per object in bytes
+
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(objects)) / n
+
+
+def bench_gravity_plato_access():
+    g = Gravity(1.048, SPECIFIC_GRAVITY)
+    return lambda: g.plato
+
+
+def bench_gravity_specific_gravity_access():
+    g = Gravity(12.0)
+    return lambda: g.specific_gravity
+
+
+def bench_temperature_celsius_access():
+    t = Temperature(68.0, FAHRENHEIT)
+    return lambda: t.celsius
+
+
+def bench_temperature_fahrenheit_access():
+    t = Temperature(20.0)
+    return lambda: t.fahrenheit
+
+
+def bench_temperature_fahrenheit_to_kelvin():
+    t = Temperature(68.0, FAHRENHEIT)
+    return lambda: t.to(KELVIN)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Print the memory per "
+                                                 "object of the unit types.")
+    parser.add_argument("-n", "--number", type=int, default=100000)
+    args = parser.parse_args(args)
+
+    for name, factory in OBJECTS:
+        print("{:<30} {:8.1f} bytes".format(
+            name, memory_per_object(factory, args.number)))
+
+
+if __name__ == "__main__":
+    main()
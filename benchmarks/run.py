@@ -0,0 +1,136 @@
+"""
+Run the beerpy benchmarks and compare them with a stored baseline.
+
+A benchmark is a function named ``bench_*`` in one of the ``bench_*``
+modules of this package. It does its setup and returns either a callable,
+which is timed, or the measured time in seconds.
+
+Usage::
+
+    python -m benchmarks.run                # run, compare with the baseline
+    python -m benchmarks.run --save         # run, store as the new baseline
+    python -m benchmarks.run -k bulk        # only benchmarks matching "bulk"
+
+The exit code is 1 if a benchmark is slower than the baseline by more than
+the threshold factor.
+
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import timeit
+
+
+MODULES = (
+    "bench_import",
+    "bench_units",
+    "bench_gravity",
+    "bench_alcohol",
+    "bench_carbonate",
+    "bench_receipe",
+    "bench_simulation",
+)
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "baseline.json")
+
+
+def collect(pattern=None):
+    """
+    Collect the benchmarks.
+
+    :param pattern: only collect benchmarks containing this string
+    :returns: list of tuples of the benchmark name and function
+
+    """
+    benchmarks = []
+    for name in MODULES:
+        module = importlib.import_module("benchmarks." + name)
+        for attr in sorted(vars(module)):
+            if not attr.startswith("bench_"):
+                continue
+            bench_name = "{}.{}".format(name[len("bench_"):],
+                                        attr[len("bench_"):])
+            if pattern is None or pattern in bench_name:
+                benchmarks.append((bench_name, getattr(module, attr)))
+    return benchmarks
+
+
+def measure(bench, repeat=5) -> float:
+    """
+    Run a benchmark.
+
+    :returns: best time of one call in seconds
+
+    """
+    fn = bench()
+    if not callable(fn):
+        return float(fn)
+
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def _format_time(seconds):
+    for unit, factor in (("s", 1.0), ("ms", 1e3), ("us", 1e6)):
+        if seconds >= 1.0 / factor:
+            return "{:8.2f} {}".format(seconds * factor, unit)
+    return "{:8.1f} ns".format(seconds * 1e9)
+
+
+def load_baseline(filename=BASELINE_FILE) -> dict:
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        return json.load(f)
+
+
+def save_baseline(results: dict, filename=BASELINE_FILE):
+    baseline = load_baseline(filename)
+    baseline.update(results)
+    with open(filename, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Run the beerpy benchmarks.")
+    parser.add_argument("-k", dest="pattern",
+                        help="only run benchmarks containing PATTERN")
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the new baseline")
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+                        help="baseline file (default: %(default)s)")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown factor reported as regression "
+                             "(default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(args)
+
+    baseline = {} if args.save else load_baseline(args.baseline)
+    results = {}
+    regressions = []
+
+    for name, bench in collect(args.pattern):
+        results[name] = t = measure(bench, args.repeat)
+        line = "{:<45} {}".format(name, _format_time(t))
+        if name in baseline:
+            ratio = t / baseline[name]
+            line += "  {:6.2f}x".format(ratio)
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print("baseline saved to {}".format(args.baseline))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,16 @@ from setuptools import setup
 setup(
     name="beerpy",
     version="0.1.0",
-    packages=["beerpy"],
+    packages=["beerpy", "beerpy.units"],
+    package_data={"beerpy": ["data/*.csv", "data/*.npy", "data/*.json"]},
     scripts=[],
+    entry_points={"console_scripts": ["beerpy = beerpy.cli:main"]},
     url="",
     license="MIT",
     author="Stefan Lehmann",
     author_email="Stefan.St.Lehmann@gmail.com",
     description="",
-    install_requires=["pandas", "scipy"],
+    install_requires=["numpy", "scipy"],
+    extras_require={"pandas": ["pandas"]},
     maintainer="Stefan Lehmann",
 )
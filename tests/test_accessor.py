@@ -0,0 +1,64 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import beerpy.accessor  # noqa: F401
+from beerpy import receipe
+from beerpy.carbonate import saturation
+from beerpy.receipe import PILSENER_MALT, MUNICH_MALT
+from beerpy.units import Gravity, SPECIFIC_GRAVITY, FAHRENHEIT
+
+
+@pytest.fixture
+def log():
+    return pd.DataFrame({
+        "og": [1.048, 1.056, 1.044],
+        "fg": [1.012, 1.014, 1.010],
+        "temperature": [12.0, 18.0, 4.0],
+        "carbonate": [5.0, 5.5, 6.0],
+    }, index=[10, 20, 30])
+
+
+def test_series(log):
+    plato = log["og"].beer.sg_to_plato()
+    assert list(plato.index) == [10, 20, 30]
+    assert plato[10] == pytest.approx(12.0)
+    assert plato.beer.plato_to_sg().values == pytest.approx(log["og"].values)
+    assert log["temperature"].beer.celsius_to_fahrenheit()[20] == \
+        pytest.approx(64.4)
+
+
+def test_series_abv_alignment():
+    og = pd.Series([12.0, 14.0], index=["a", "b"])
+    fg = pd.Series([4.0, 3.0], index=["b", "a"])
+    assert list(og.beer.abv(fg)) == [4.5, 5.0]
+
+
+def test_dataframe(log):
+    abv = log.beer.abv("og", "fg", unit=SPECIFIC_GRAVITY)
+    assert abv.name == "abv" and list(abv.index) == [10, 20, 30]
+    assert abv[10] == pytest.approx(4.5, abs=0.01)
+
+    carbonation = log.beer.carbonation()
+    assert carbonation.values == pytest.approx(
+        log["carbonate"].values - saturation(log["temperature"].values))
+
+    fahrenheit = pd.DataFrame({"temperature": [53.6]})
+    assert fahrenheit.beer.saturation(unit=FAHRENHEIT)[0] == \
+        pytest.approx(float(saturation(12.0)))
+
+
+def test_dataframe_receipe():
+    df = pd.DataFrame({"volume": [22.0, 50.0], "gravity": [14.0, 12.0],
+                       "ibu": [40.0, 30.0], "alpha": [5.5, 4.0],
+                       "cooktime": [60.0, 70.0]}, index=["x", "y"])
+    malts = [(PILSENER_MALT, 0.8), (MUNICH_MALT, 0.2)]
+    res = df.beer.malt(malts)
+    assert list(res.columns) == [PILSENER_MALT.name, MUNICH_MALT.name,
+                                 "total"]
+    total, _ = receipe.malt_composition(22, Gravity(14), malts)
+    assert res.loc["x", "total"] == pytest.approx(total, abs=0.01)
+
+    hops = df.beer.hops()
+    assert hops["y"] == pytest.approx(
+        receipe.hop_quantity(30, 4.0, 50, 70, Gravity(12)))
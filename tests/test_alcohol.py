@@ -0,0 +1,15 @@
+import pytest
+
+from beerpy.alcohol import alcohol, alcohols
+from beerpy.units.gravity import Gravity, GravityArray, SPECIFIC_GRAVITY
+
+
+def test_alcohol():
+    assert alcohol(Gravity(12)).value == 4.5
+    assert alcohol(Gravity(12), Gravity(6)).value == 3
+
+
+def test_alcohols():
+    assert list(alcohols([12, 16])) == [4.5, 6]
+    og = GravityArray([1.048, 1.050], SPECIFIC_GRAVITY)
+    assert list(alcohols(og, [6, 8])) == pytest.approx([3, 2.25])
@@ -0,0 +1,23 @@
+import pytest
+
+from beerpy.batch import CALCULATIONS, COLUMNS, process_chunk
+from beerpy.units import PLATO, SPECIFIC_GRAVITY
+
+
+def test_columns():
+    assert set(COLUMNS) == set(CALCULATIONS)
+
+
+def test_process_chunk():
+    rows = [{"gravity": "1.048"}, {"gravity": "1.050"}]
+    rows = process_chunk("gravity", {"unit": SPECIFIC_GRAVITY, "fct": None},
+                         rows)
+    assert [row["plato"] for row in rows] == [12.0, 12.5]
+
+
+def test_abv_missing_fg():
+    rows = [{"og": 12, "fg": ""}, {"og": 14, "fg": 3}]
+    rows = process_chunk("abv", {"unit": PLATO, "fct": None}, rows)
+    assert rows[0]["abv"] == 4.5
+    assert rows[0]["attenuation"] is None
+    assert rows[1]["attenuation"] == pytest.approx(11 / 14)
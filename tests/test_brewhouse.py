@@ -0,0 +1,82 @@
+import pytest
+
+from beerpy import brewhouse
+from beerpy.brewhouse import Brewhouse
+from beerpy.receipe import PILSENER_MALT, MUNICH_MALT, malt_composition, \
+    hop_quantity
+from beerpy.units import Gravity
+
+
+COMPOSITION = [(PILSENER_MALT, 0.8), (MUNICH_MALT, 0.2)]
+
+
+@pytest.fixture
+def bh():
+    return Brewhouse(volume=22, og=14, composition=COMPOSITION, fg=3,
+                     hops=[(30, 5.5, 60), (10, 4.0, 10)])
+
+
+def test_values(bh):
+    assert bh.malt_bill == malt_composition(22, Gravity(14), COMPOSITION)
+    assert bh.pre_boil_volume == 26.0
+    # same extract before and after the boil
+    pre = bh.pre_boil_gravity
+    assert 26 * pre.specific_gravity * pre.plato == \
+        pytest.approx(22 * Gravity(14).specific_gravity * 14)
+    assert bh.strike_water == pytest.approx(3 * 5.44)
+    assert bh.sparge_water == pytest.approx(26 + 5.44 - 3 * 5.44)
+    assert bh.hop_amounts[0] == hop_quantity(30, 5.5, 22, 60, Gravity(14))
+    assert bh.abv.value == 5.5
+
+
+def test_incremental(bh, monkeypatch):
+    calls = []
+
+    def counting(*args):
+        calls.append(args)
+        return malt_composition(*args)
+
+    monkeypatch.setitem(brewhouse.STEPS, "malt_bill", brewhouse.Step(
+        lambda v, g, c, e: counting(v, g, list(c), e),
+        brewhouse.STEPS["malt_bill"].inputs))
+
+    bh.sparge_water
+    assert len(calls) == 1 and bh.is_cached("sparge_water")
+
+    # independent input, the malt bill is kept
+    bh.mash_thickness = 3.5
+    assert bh.is_cached("malt_bill") and not bh.is_cached("strike_water")
+    assert bh.sparge_water == pytest.approx(26 + 5.44 - 3.5 * 5.44)
+    assert len(calls) == 1
+
+    # same value, nothing is marked
+    bh.update(volume=22.0)
+    assert bh.is_cached("sparge_water")
+
+    bh.volume = 25
+    assert not bh.is_cached("malt_bill")
+    assert bh.malt_weight > 5.44
+    assert len(calls) == 2
+
+
+def test_unchanged_step(bh):
+    bh.sparge_water
+    # same pre-boil volume, the steps after it are checked but not
+    # recalculated
+    bh.update(boil_time=30, boil_off=8)
+    assert not bh.is_cached("sparge_water")
+    result = bh._cache["sparge_water"][1]
+    assert bh.sparge_water is result
+    assert bh.is_cached("sparge_water")
+
+
+def test_inputs():
+    with pytest.raises(ValueError):
+        Brewhouse(volume=22, og=14)
+    with pytest.raises(ValueError):
+        Brewhouse(volume=22, og=14, composition=COMPOSITION, color=5)
+    bh = Brewhouse(volume=22, og=1.057, unit="kg/m³",
+                   composition=COMPOSITION)
+    assert bh.post_boil_gravity.plato == pytest.approx(14, abs=0.05)
+    with pytest.raises(AttributeError):
+        bh.malt_weight = 5
@@ -0,0 +1,44 @@
+import pytest
+
+import beerpy.units as units
+from beerpy.units.gravity import FCT_POLY, _sg_to_pl
+
+
+@pytest.fixture
+def cache():
+    units.enable_cache(maxsize=2)
+    yield
+    units.disable_cache()
+
+
+def test_disabled():
+    assert units.cache_info() is None
+    assert units.Gravity(1.048, units.SPECIFIC_GRAVITY).plato == 12
+
+
+def test_hits_and_misses(cache):
+    for _ in range(3):
+        assert units.Gravity(1.048, units.SPECIFIC_GRAVITY).plato == 12
+    assert units.Temperature(68, units.FAHRENHEIT).celsius == 20
+    info = units.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    units.cache_clear()
+    info = units.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_backend_in_key(cache):
+    g1 = units.Gravity(1.049, units.SPECIFIC_GRAVITY)
+    g2 = units.Gravity(1.049, units.SPECIFIC_GRAVITY, fct=FCT_POLY)
+    assert g1.plato == pytest.approx(12.25)
+    assert g2.plato == _sg_to_pl(1.049, FCT_POLY)
+    assert units.cache_info().misses == 2
+
+
+def test_eviction(cache):
+    for value in (20, 21, 22):
+        units.Temperature(value).fahrenheit
+    units.Temperature(20).fahrenheit
+    info = units.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 4, 2)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import beerpy.units as units
@@ -11,3 +12,22 @@ def test_saturation():
 
 def test_carbonisation():
     assert carbonisation(5.0, units.Temperature(22)) == 3.4
+
+
+def test_saturation_array():
+    res = saturation(np.array([0, 1, 20]))
+    assert isinstance(res, np.ndarray)
+    assert list(res) == [3.2, 3.1, 1.65]
+    res = saturation([32, 68], unit=units.FAHRENHEIT)
+    assert list(res) == [3.2, 1.65]
+
+
+def test_saturation_range():
+    with pytest.raises(ValueError):
+        saturation(units.Temperature(25))
+    with pytest.raises(ValueError):
+        saturation([0, 25])
+
+
+def test_carbonisation_array():
+    assert list(carbonisation(5.0, [20, 22])) == pytest.approx([3.35, 3.4])
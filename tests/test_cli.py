@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from beerpy.cli import main
+
+
+def test_gravity(capsys):
+    assert main(["gravity", "1.048", "--unit", "sg"]) == 0
+    assert capsys.readouterr().out == "12.00°P  1.0480 SG\n"
+
+
+def test_abv(capsys):
+    assert main(["abv", "12", "6"]) == 0
+    assert capsys.readouterr().out == "Alcohol: 3.0%\n"
+
+
+def test_malt(capsys):
+    assert main(["malt", "22", "14", "pilsener_malt:0.8",
+                 "munich_malt:0.2"]) == 0
+    assert capsys.readouterr().out.splitlines()[-1].split() == \
+        ["total", "5.44", "kg"]
+
+
+def test_out_of_range(capsys):
+    assert main(["carbonation", "5", "30"]) == 1
+    assert "must be in range" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_batch_gravity(tmpdir, jobs):
+    infile = tmpdir.join("in.csv")
+    infile.write("tank,gravity\nA,1.048\nB,1.050\nC,1.012\n")
+    outfile = tmpdir.join("out.csv")
+    assert main(["batch", "gravity", "-i", str(infile), "-o", str(outfile),
+                 "--unit", "sg", "--chunksize", "2", "--jobs", jobs]) == 0
+    assert outfile.read().splitlines() == [
+        "tank,gravity,plato,sg",
+        "A,1.048,12.0,1.048",
+        "B,1.050,12.5,1.05",
+        "C,1.012,3.0,1.012",
+    ]
+
+
+def test_batch_malt(tmpdir):
+    infile = tmpdir.join("in.jsonl")
+    infile.write('{"volume": 22, "gravity": 14}\n'
+                 '{"volume": 20, "gravity": 12, "efficiency": 0.7}\n')
+    outfile = tmpdir.join("out.jsonl")
+    assert main(["batch", "malt", "-i", str(infile), "-o", str(outfile),
+                 "--malt", "pilsener_malt:0.8",
+                 "--malt", "munich_malt:0.2"]) == 0
+    rows = [json.loads(line) for line in outfile.readlines()]
+    assert rows[0]["total"] == 5.44
+    assert rows[0]["Pilsener Malz"] == 4.35
+    assert rows[1]["total"] == 4.5
+
+
+def test_batch_abv_mixed_fg(tmpdir):
+    infile = tmpdir.join("in.jsonl")
+    infile.write('{"og": 12}\n{"og": 14, "fg": 3}\n')
+    outfile = tmpdir.join("out.jsonl")
+    assert main(["batch", "abv", "-i", str(infile), "-o", str(outfile)]) == 0
+    rows = [json.loads(line) for line in outfile.readlines()]
+    assert rows[0]["abv"] == 4.5
+    assert rows[0]["attenuation"] is None
+    assert rows[1]["abv"] == 5.5
+
+
+def test_batch_abv_fg_missing_in_first_chunk(tmpdir):
+    infile = tmpdir.join("in.csv")
+    infile.write("og,fg\n12,\n12,3\n")
+    outfile = tmpdir.join("out.csv")
+    assert main(["batch", "abv", "-i", str(infile), "-o", str(outfile),
+                 "--chunksize", "1"]) == 0
+    assert outfile.read().splitlines() == [
+        "og,fg,abv,attenuation",
+        "12,,4.5,",
+        "12,3,4.5,0.75",
+    ]
+
+
+def test_batch_hops(tmpdir):
+    infile = tmpdir.join("in.csv")
+    infile.write("ibu,alpha,volume,cooktime,gravity\n40,5.5,22,60,20\n")
+    outfile = tmpdir.join("out.csv")
+    assert main(["batch", "hops", "-i", str(infile), "-o", str(outfile)]) == 0
+    row = outfile.readlines()[1].strip().split(",")
+    assert "{:.2f}".format(float(row[-1])) == "82.84"
@@ -12,3 +12,11 @@ def test_value_and_unit():
     c = Concentration(5)
     assert c.value == 5
     assert c.unit == "g/l"
+
+
+def test_immutable_and_hashable():
+    c = Concentration(5)
+    with pytest.raises(AttributeError):
+        c.value = 6
+    assert c == Concentration(5)
+    assert hash(c) == hash(Concentration(5))
@@ -0,0 +1,115 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from beerpy import diskcache, receipe
+from beerpy.diskcache import DiskCache
+from beerpy.receipe import PILSENER_MALT, MUNICH_MALT
+from beerpy.units import Gravity, SPECIFIC_GRAVITY
+
+
+COMPOSITION = [(PILSENER_MALT, 0.8), (MUNICH_MALT, 0.2)]
+
+
+def test_cached(tmpdir):
+    filename = str(tmpdir.join("cache.sqlite"))
+    cache = DiskCache(filename)
+    malt_composition = cache.cached(receipe.malt_composition)
+
+    res = malt_composition(22, Gravity(14), COMPOSITION)
+    assert res == receipe.malt_composition(22, Gravity(14), COMPOSITION)
+    assert malt_composition(22.0, Gravity(14.0), COMPOSITION) == res
+    assert (cache.hits, cache.misses) == (1, 1)
+    malt_composition(22, Gravity(1.057, SPECIFIC_GRAVITY), COMPOSITION)
+    assert cache.misses == 2
+
+    # the results are kept in the file
+    cache = DiskCache(filename)
+    assert len(cache) == 2
+    assert cache.cached(receipe.malt_composition)(
+        22, Gravity(14), COMPOSITION) == res
+    assert cache.hits == 1
+
+
+def test_keys(tmpdir):
+    cache = DiskCache(str(tmpdir.join("cache.sqlite")))
+    key = cache.key("hop_quantity", 40, 5.5, 22, 60, Gravity(12))
+    assert key == cache.key("hop_quantity", 40.0, 5.5, 22, 60, Gravity(12))
+    assert key != cache.key("hop_quantity", 40, 5.5, 22, 70, Gravity(12))
+    assert key != cache.key("malt_composition", 40, 5.5, 22, 60, Gravity(12))
+    with pytest.raises(TypeError):
+        cache.key("hop_quantity", object())
+
+
+def test_eviction(tmpdir):
+    cache = DiskCache(str(tmpdir.join("cache.sqlite")), max_size=1000)
+    for i in range(10):
+        cache.set(str(i), b"x" * 200)
+    assert cache.size() <= 1000
+    assert cache.get("9") is not None
+    assert cache.get("0") is None
+
+    # the running total follows updates and deletes
+    cache.set("9", b"x" * 10)
+    total = sum(len(pickle.dumps(cache.get(str(i)),
+                                 protocol=pickle.HIGHEST_PROTOCOL))
+                for i in range(10) if cache.get(str(i)) is not None)
+    assert cache.size() == total
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_data_changed(tmpdir, monkeypatch):
+    filename = str(tmpdir.join("cache.sqlite"))
+    cache = DiskCache(filename)
+    key = cache.key("hop_quantity", 40, 5.5, 22, 60, Gravity(12))
+    cache.set(key, 123.0)
+
+    monkeypatch.setattr(diskcache, "data_checksum", lambda: "changed")
+    cache = DiskCache(filename)
+    assert len(cache) == 0
+    assert cache.key("hop_quantity", 40, 5.5, 22, 60, Gravity(12)) != key
+
+
+def _hop_quantities(filename):
+    hop_quantity = DiskCache(filename).cached(receipe.hop_quantity)
+    return [hop_quantity(40, 5.5, 22, cooktime, Gravity(12))
+            for cooktime in range(10, 90, 5)]
+
+
+def test_processes(tmpdir):
+    filename = str(tmpdir.join("cache.sqlite"))
+    DiskCache(filename)
+    with ProcessPoolExecutor(4) as executor:
+        results = list(executor.map(_hop_quantities, [filename] * 8))
+    assert all(r == results[0] for r in results)
+    assert len(DiskCache(filename)) == 16
+
+
+def _open(filename):
+    DiskCache(filename).set(filename, 1.0)
+
+
+def test_concurrent_open(tmpdir):
+    filename = str(tmpdir.join("cache.sqlite"))
+    with ProcessPoolExecutor(4) as executor:
+        list(executor.map(_open, [filename] * 8))
+    cache = DiskCache(filename)
+    with cache._connection() as db:
+        assert db.execute("SELECT COUNT(*) FROM usage").fetchone()[0] == 1
+    assert cache.size() == len(pickle.dumps(
+        1.0, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def test_threads(tmpdir):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = DiskCache(str(tmpdir.join("cache.sqlite")))
+    hop_quantity = cache.cached(receipe.hop_quantity)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(
+            lambda c: hop_quantity(40, 5.5, 22, c, Gravity(12)),
+            list(range(10, 90, 5)) * 4))
+    assert results[:16] == results[16:32]
+    assert len(cache) == 16
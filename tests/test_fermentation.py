@@ -0,0 +1,65 @@
+import io
+
+import pytest
+
+from beerpy.fermentation import Fermenter, monitor, read_csv, read_jsonl, \
+    Reading
+from beerpy.units.gravity import Gravity, SPECIFIC_GRAVITY
+
+
+CSV = """tank,time,gravity
+1,2015-08-01T12:00:00,1.048
+2,2015-08-01T12:00:00,1.050
+1,2015-08-02T12:00:00,1.040
+1,2015-08-03T12:00:00,1.032
+"""
+
+
+def test_read_csv():
+    readings = list(read_csv(io.StringIO(CSV)))
+    assert len(readings) == 4
+    assert readings[0] == Reading("1", "2015-08-01T12:00:00",
+                                  Gravity(1.048, SPECIFIC_GRAVITY))
+
+
+def test_read_jsonl():
+    lines = ['{"tank": "A", "time": 0, "sg": 1.048}', '',
+             '{"tank": "A", "time": 3600, "sg": 1.047}']
+    readings = list(read_jsonl(lines, gravity="sg"))
+    assert [r.time for r in readings] == [0, 3600]
+    assert readings[1].gravity.plato == pytest.approx(11.75)
+
+
+def test_monitor():
+    status = list(monitor(read_csv(io.StringIO(CSV))))
+    assert [s.tank for s in status] == ["1", "2", "1", "1"]
+    assert status[0].attenuation == 0
+    assert status[0].rate == 0
+    last = status[-1]
+    assert last.attenuation == pytest.approx(4 / 12)
+    assert last.alcohol == pytest.approx(2)
+    assert last.rate == pytest.approx(2)
+
+
+def test_fermenter_window():
+    f = Fermenter(og=Gravity(12), window=2)
+    for day, plato in enumerate([12, 11, 8, 6]):
+        f.update(day * 86400, Gravity(plato))
+    assert f.og.plato == 12
+    assert f.gravity.plato == 6
+    assert f.rate == pytest.approx(2)
+    assert f.attenuation == pytest.approx(0.5)
+
+
+def test_fermenter_og():
+    f = Fermenter(og=Gravity(12))
+    # a tank with a known og before its first reading
+    assert f.gravity is None
+    assert (f.attenuation, f.alcohol, f.rate) == (0.0, 0.0, 0.0)
+    f.update(0, Gravity(13))
+    assert f.og.plato == 12
+
+    f = Fermenter()
+    for day, plato in enumerate([12, 13, 8]):
+        f.update(day * 86400, Gravity(plato))
+    assert f.og.plato == 13
@@ -1,6 +1,10 @@
+import numpy as np
 import pytest
 from beerpy.units.gravity import _pl_to_sg, _sg_to_pl, Gravity, PLATO, \
-    SPECIFIC_GRAVITY
+    SPECIFIC_GRAVITY, FCT_DATA, FCT_POLY, FCT_CHEB, GravityArray, \
+    MAX_ERROR, GRAVITY_TABLE, get_default_fct, plato_to_sg, \
+    set_default_fct, sg_to_plato
+from beerpy.utilities import load_table
 
 
 def test_pl_to_sg():
@@ -31,3 +35,87 @@ def test_specific_gravity():
     g = Gravity(1.083, unit=SPECIFIC_GRAVITY)
     assert g.plato == 20
     assert g.specific_gravity == 1.083
+
+
+def test_interpolation_between_points():
+    assert _pl_to_sg(12.25) == pytest.approx(1.049)
+    assert _sg_to_pl(1.049) == pytest.approx(12.25)
+
+
+def test_out_of_range():
+    with pytest.raises(ValueError):
+        _pl_to_sg(41)
+    with pytest.raises(ValueError):
+        _sg_to_pl(1.0)
+
+
+def test_plato_to_sg():
+    res = plato_to_sg(np.array([6, 12, 20]))
+    assert isinstance(res, np.ndarray)
+    assert list(res) == [1.024, 1.048, 1.083]
+
+
+def test_sg_to_plato():
+    res = sg_to_plato([1.024, 1.048, 1.083])
+    assert list(res) == [6., 12., 20.]
+    with pytest.raises(ValueError):
+        sg_to_plato([1.024, 1.0])
+
+
+def test_array_poly():
+    pl = np.array([6., 12., 20.])
+    res = plato_to_sg(pl, fct=FCT_POLY)
+    assert list(res) == [_pl_to_sg(x, fct=FCT_POLY) for x in pl]
+
+
+def test_gravity_array():
+    g = GravityArray([1.024, 1.048, 1.083], unit=SPECIFIC_GRAVITY)
+    assert len(g) == 3
+    assert list(g.plato) == [6., 12., 20.]
+    assert g[1].plato == 12.
+    assert list(g[1:].specific_gravity) == [1.048, 1.083]
+
+
+def test_immutable_and_hashable():
+    g = Gravity(12)
+    with pytest.raises(AttributeError):
+        g.plato = 14
+    with pytest.raises(AttributeError):
+        g.foo = 1
+    assert g == Gravity(12)
+    assert g != Gravity(12, unit=SPECIFIC_GRAVITY)
+    assert len({g, Gravity(12), Gravity(14)}) == 2
+
+
+@pytest.mark.parametrize("fct", [FCT_DATA, FCT_POLY, FCT_CHEB])
+def test_max_error(fct):
+    table = load_table(GRAVITY_TABLE)
+    plato, sg = np.array(table["Plato"]), np.array(table["SG"])
+    sg_error, plato_error = MAX_ERROR[fct]
+
+    assert np.abs(plato_to_sg(plato, fct) - sg).max() <= sg_error
+    assert np.abs(sg_to_plato(sg, fct) - plato).max() <= plato_error
+    for pl, x in zip(plato, sg):
+        assert abs(_pl_to_sg(pl, fct) - x) <= sg_error
+        assert abs(_sg_to_pl(x, fct) - pl) <= plato_error
+
+
+def test_gravity_fct():
+    g = Gravity(1.048, unit=SPECIFIC_GRAVITY, fct=FCT_POLY)
+    assert g.fct == FCT_POLY
+    assert g.plato == _sg_to_pl(1.048, fct=FCT_POLY)
+    g = GravityArray([12, 14], fct=FCT_CHEB)
+    assert list(g.specific_gravity) == \
+        [_pl_to_sg(12, FCT_CHEB), _pl_to_sg(14, FCT_CHEB)]
+
+
+def test_default_fct():
+    assert get_default_fct() == FCT_DATA
+    set_default_fct(FCT_POLY)
+    try:
+        assert _pl_to_sg(12.2) == _pl_to_sg(12.2, FCT_POLY)
+        assert Gravity(12.2).specific_gravity == _pl_to_sg(12.2, FCT_POLY)
+    finally:
+        set_default_fct(FCT_DATA)
+    with pytest.raises(ValueError):
+        set_default_fct("foo")
@@ -0,0 +1,51 @@
+import pytest
+
+from beerpy import instrument, receipe
+from beerpy.units import gravity
+from beerpy.units.gravity import Gravity, FCT_POLY
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled():
+    assert not instrument.is_enabled()
+    assert not hasattr(gravity._poly_pl_to_sg, "__wrapped__")
+    Gravity(12, fct=FCT_POLY).specific_gravity
+    assert instrument.snapshot() == {}
+
+
+def test_profiling():
+    original = receipe.hop_quantity
+    with instrument.profiling():
+        assert receipe.hop_quantity is not original
+        Gravity(12, fct=FCT_POLY).specific_gravity
+        gravity.plato_to_sg([10, 12], FCT_POLY)
+        receipe.hop_quantity(40, 5.5, 22, 60, Gravity(12))
+    assert receipe.hop_quantity is original
+
+    stats = instrument.snapshot()
+    assert stats["gravity.poly.pl_to_sg"].calls == 2
+    assert stats["receipe.hop_quantity"].calls == 1
+    assert stats["receipe.hop_quantity"].seconds > 0
+
+    # values are kept after the block and dropped by the next one
+    Gravity(12, fct=FCT_POLY).specific_gravity
+    assert instrument.snapshot() == stats
+    with instrument.profiling():
+        pass
+    assert instrument.snapshot() == {}
+
+
+def test_builds():
+    gravity._interpolator.cache_clear()
+    with instrument.profiling():
+        Gravity(1.048, gravity.SPECIFIC_GRAVITY, gravity.FCT_DATA).plato
+    stats = instrument.snapshot()
+    assert stats["interpolation.linear.build"].calls == 1
+    assert stats["gravity.data.sg_to_pl"].calls == 1
@@ -0,0 +1,37 @@
+import pytest
+
+from beerpy.interpolation import BilinearInterpolator, LinearInterpolator
+
+
+def test_linear_interpolator():
+    f = LinearInterpolator([2, 0, 1], [20, 0, 10])
+    assert f(0) == 0
+    assert f(1) == 10
+    assert f(2) == 20
+    assert f(0.5) == 5
+    assert f(1.25) == 12.5
+
+
+def test_linear_interpolator_range():
+    f = LinearInterpolator([0, 1], [0, 10])
+    with pytest.raises(ValueError):
+        f(-0.1)
+    with pytest.raises(ValueError):
+        f(1.1)
+
+
+def test_bilinear_interpolator():
+    f = BilinearInterpolator([0, 1], [0, 10, 20], [[0, 1, 2], [10, 11, 12]])
+    assert f(0, 0) == 0
+    assert f(1, 20) == 12
+    assert f(0.5, 5) == 5.5
+    assert f(0.5, 15) == 6.5
+    # nearest grid value outside the grid
+    assert f(-1, 30) == 2
+    assert f(2, -5) == 10
+
+
+def test_bilinear_interpolator_vector():
+    f = BilinearInterpolator([0, 1], [0, 10, 20], [[0, 1, 2], [10, 11, 12]])
+    res = f.vector([0, 0.5, 1, 2], 15)
+    assert list(res) == [f(x, 15) for x in (0, 0.5, 1, 2)]
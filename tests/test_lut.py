@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from beerpy import lut
+from beerpy.carbonate import saturation
+from beerpy.units.gravity import plato_to_sg, sg_to_plato
+
+
+def test_files_up_to_date():
+    for name in lut.LUTS:
+        assert np.array_equal(lut.load(name).values, lut.generate(name))
+
+
+def test_outdated(monkeypatch):
+    monkeypatch.setattr(lut, "is_binary_current", lambda name: False)
+    lut.load.cache_clear()
+    try:
+        with pytest.warns(UserWarning, match="outdated"):
+            table = lut.load(lut.SATURATION)
+        assert not isinstance(table.values.base, np.memmap)
+    finally:
+        lut.load.cache_clear()
+
+
+def test_sg_to_plato():
+    sg = np.round(np.linspace(1.002, 1.179, 500), 4)
+    assert np.allclose(lut.sg_to_plato(sg), sg_to_plato(sg), rtol=0,
+                       atol=1e-12)
+    assert lut.sg_to_plato(1.048) == pytest.approx(12)
+    # off-grid values are interpolated
+    assert lut.sg_to_plato(1.04805) == pytest.approx(12.0125)
+    assert lut.sg_to_plato([1.048, 1.04805])[1] == pytest.approx(12.0125)
+
+
+def test_plato_to_sg():
+    assert list(lut.plato_to_sg([6, 12, 20])) == pytest.approx(
+        [1.024, 1.048, 1.083])
+    assert lut.plato_to_sg(12.005) == pytest.approx(plato_to_sg(12.005))
+
+
+def test_saturation():
+    celsius = np.arange(0, 221) / 10
+    assert np.allclose(lut.saturation(celsius), saturation(celsius))
+    assert lut.saturation(20.0) == pytest.approx(1.65)
+
+
+def test_out_of_range():
+    with pytest.raises(ValueError):
+        lut.sg_to_plato(1.2)
+    with pytest.raises(ValueError):
+        lut.saturation([10.0, 30.0])
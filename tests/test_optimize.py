@@ -0,0 +1,48 @@
+import pytest
+
+from beerpy.optimize import achievable_gravity, achievable_volume, extract, \
+    max_batches
+from beerpy.receipe import malt_composition, PILSENER_MALT, MUNICH_MALT, \
+    CARAMALT
+from beerpy.units.gravity import Gravity
+
+
+def test_extract():
+    assert extract([(PILSENER_MALT, 2), (MUNICH_MALT, 1)], 0.5) == 1195
+
+
+def test_achievable_gravity():
+    total, _ = malt_composition(20, Gravity(12), [(PILSENER_MALT, 1.0)])
+    g = achievable_gravity([(PILSENER_MALT, total)], 20)
+    assert g.plato == pytest.approx(12, abs=0.01)
+    g = achievable_gravity([(PILSENER_MALT, total)], [20, 40])
+    assert g.plato[0] == pytest.approx(12, abs=0.01)
+    assert g.plato[1] < 6.5
+
+
+def test_achievable_volume():
+    total, _ = malt_composition(20, Gravity(12), [(PILSENER_MALT, 1.0)])
+    assert achievable_volume([(PILSENER_MALT, total)], Gravity(12)) == \
+        pytest.approx(20, abs=0.05)
+
+
+def test_max_batches():
+    inventory = [(PILSENER_MALT, 20), (MUNICH_MALT, 10), (CARAMALT, 1)]
+    bounds = [(0.5, 1), (0.2, 0.4), (0.05, 0.1)]
+    plan = max_batches(inventory, 20, Gravity(12), bounds=bounds)
+
+    # caramalt is the bottleneck
+    assert int(plan.batches) == 4
+    shares = [s for _, s in plan.composition]
+    assert sum(shares) == pytest.approx(1)
+    for share, (lo, hi) in zip(shares, bounds):
+        assert lo - 1e-9 <= share <= hi + 1e-9
+
+    total, weights = malt_composition(20, Gravity(12), plan.composition)
+    assert total == round(sum(w for _, w in plan.weights), 2)
+
+
+def test_max_batches_infeasible():
+    with pytest.raises(ValueError):
+        max_batches([(PILSENER_MALT, 20)], 20, Gravity(12),
+                    bounds=[(0, 0.5)])
@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 
-from beerpy.receipe import hop_quantity, malt_composition, PILSENER_MALT, \
-    MUNICH_MALT
-from beerpy.units.gravity import Gravity
+from beerpy.receipe import bitterness, hop_quantity, hop_quantities, \
+    hop_saturation, malt_composition, malt_compositions, PILSENER_MALT, \
+    MUNICH_MALT, CARAMALT
+from beerpy.units.gravity import Gravity, GravityArray
 
 
 def test_malt_composition():
@@ -17,3 +19,54 @@ def test_malt_composition():
 def test_hop_quantity():
     res = hop_quantity(40, 5.5, 22, 60, Gravity(20))
     assert "{:.2f}".format(res) == "82.84"
+
+
+def test_hop_saturation():
+    res = hop_saturation([9, 59, 60, 100], 20)
+    assert list(res[:2]) == [4.3, 19.2]
+    assert res[2] == pytest.approx(19.2 + 1.7 / 15)
+    assert res[3] == 23.5
+    assert list(hop_saturation(29, [12.5, 15])) == [15, 14.3]
+
+
+def test_hop_quantities():
+    res = hop_quantities([40, 10], [5.5, 4.0], 22, [60, 10], Gravity(20))
+    assert "{:.2f}".format(res[0]) == "82.84"
+    assert res[1] == pytest.approx(hop_quantity(10, 4.0, 22, 10, Gravity(20)))
+
+
+def test_hop_quantities_broadcast():
+    res = hop_quantities([40, 10], [5.5, 4.0], [[22], [30]], [60, 10],
+                         [[20], [12]])
+    assert res.shape == (2, 2)
+    assert res[1, 0] == pytest.approx(
+        hop_quantity(40, 5.5, 30, 60, Gravity(12)))
+
+
+def test_bitterness():
+    amounts = hop_quantities([40, 10], [5.5, 4.0], 22, [60, 10], Gravity(20))
+    assert bitterness(amounts, [5.5, 4.0], 22, [60, 10], Gravity(20)) == \
+        pytest.approx(50)
+
+
+def test_malt_compositions():
+    malts = [PILSENER_MALT, MUNICH_MALT, CARAMALT]
+    shares = [[0.8, 0.2, 0.0], [0.7, 0.2, 0.1]]
+    res = malt_compositions([22, 30], [14, 12], malts, shares,
+                            efficiency=[0.75, 0.7])
+    for i, (volume, plato, efficiency) in enumerate(
+            [(22, 14, 0.75), (30, 12, 0.7)]):
+        total, weights = malt_composition(
+            volume, Gravity(plato), list(zip(malts, shares[i])), efficiency
+        )
+        assert res.total_weight[i] == total
+        assert list(res.weights[i]) == [w for _, w in weights]
+
+
+def test_malt_compositions_broadcast():
+    res = malt_compositions([20, 22], GravityArray([14, 14]),
+                            [PILSENER_MALT, MUNICH_MALT], [0.8, 0.2],
+                            decimals=None)
+    assert res.weights.shape == (2, 2)
+    assert np.allclose(res.weights.sum(axis=1), res.total_weight)
+    assert round(res.total_weight[1], 2) == 5.44
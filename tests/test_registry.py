@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from beerpy.units import registry, Concentration, Gravity, GravityArray, \
+    Temperature, BRIX, CELSIUS, FAHRENHEIT, GRAMS_PER_LITER, GRAVITY_POINTS, \
+    KELVIN, MILLIGRAMS_PER_LITER, PLATO, SPECIFIC_GRAVITY
+from beerpy.units.gravity import FCT_POLY, _pl_to_sg
+
+
+def test_path():
+    assert registry.path(CELSIUS, CELSIUS) == (CELSIUS,)
+    assert registry.path(FAHRENHEIT, KELVIN) == (FAHRENHEIT, CELSIUS, KELVIN)
+    assert registry.path(BRIX, GRAVITY_POINTS) == \
+        (BRIX, PLATO, SPECIFIC_GRAVITY, GRAVITY_POINTS)
+    with pytest.raises(ValueError):
+        registry.path(CELSIUS, PLATO)
+    with pytest.raises(ValueError):
+        registry.path("°R", CELSIUS)
+
+
+def test_converter_compiled_once():
+    fct = registry.converter(FAHRENHEIT, KELVIN)
+    assert registry.converter(FAHRENHEIT, KELVIN) is fct
+    assert fct(68.0, None) == pytest.approx(293.15)
+    # single edges keep their own function
+    assert registry.converter(FAHRENHEIT, CELSIUS)(68.0, None) == 20.0
+
+
+def test_backend():
+    sg = registry.convert(12.0, BRIX, SPECIFIC_GRAVITY, FCT_POLY)
+    assert sg == _pl_to_sg(12.0, FCT_POLY)
+    points = registry.converter(PLATO, GRAVITY_POINTS, vectorized=True)
+    np.testing.assert_allclose(points(np.array([12.0, 13.75]), None),
+                               [48.0, 56.0])
+
+
+def test_register_unit():
+    registry.define("°R", "temperature")
+    try:
+        registry.register_linear(KELVIN, "°R", 1.8)
+        assert Temperature(491.67, "°R").celsius == pytest.approx(0.0)
+        assert Temperature(20).to("°R") == pytest.approx(527.67)
+        with pytest.raises(ValueError):
+            registry.define("°R", "gravity")
+        with pytest.raises(ValueError):
+            registry.register("°R", PLATO, lambda value, backend: value)
+    finally:
+        registry._edges[KELVIN].pop("°R", None)
+        del registry._edges["°R"], registry._dimensions["°R"]
+        registry._compiled.clear()
+
+
+def test_units():
+    assert Gravity(48, GRAVITY_POINTS).plato == 12.0
+    assert Gravity(12, BRIX).specific_gravity == 1.048
+    assert Gravity(12).to(GRAVITY_POINTS) == pytest.approx(48.0)
+    np.testing.assert_allclose(GravityArray([48, 56], GRAVITY_POINTS).plato,
+                               [12.0, 13.75])
+    assert Temperature(300, KELVIN).celsius == pytest.approx(26.85)
+    assert Temperature(68, FAHRENHEIT).kelvin == pytest.approx(293.15)
+    assert Concentration(5).to(MILLIGRAMS_PER_LITER) == 5000.0
+    assert Concentration(500, MILLIGRAMS_PER_LITER).to(GRAMS_PER_LITER) == 0.5
+    with pytest.raises(AssertionError):
+        Temperature(20, PLATO)
@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import pytest
+
+from beerpy.service import Batcher, Service
+
+
+def test_batcher():
+    batches = []
+
+    def double(items):
+        batches.append(items)
+        return [2 * x for x in items]
+
+    async def run():
+        batcher = Batcher(double, max_batch_size=4, max_latency=0.01)
+        return await asyncio.gather(*(batcher(i) for i in range(10)))
+
+    assert asyncio.run(run()) == [2 * i for i in range(10)]
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_batcher_error():
+    def invert(items):
+        return [1 / x for x in items]
+
+    async def run():
+        batcher = Batcher(invert, max_latency=0.01)
+        return await asyncio.gather(*(batcher(x) for x in (1, 0, 4)),
+                                    return_exceptions=True)
+
+    res = asyncio.run(run())
+    assert res[0] == 1.0 and res[2] == 0.25
+    assert isinstance(res[1], ZeroDivisionError)
+
+
+def test_service():
+    requests = [
+        {"id": 1, "calculation": "gravity", "gravity": 1.048, "unit": "sg"},
+        {"id": 2, "calculation": "gravity", "gravity": 12},
+        {"id": 3, "calculation": "abv", "og": 12, "fg": 6},
+        {"id": 4, "calculation": "abv", "og": 12},
+        {"id": 5, "calculation": "carbonation", "carbonate": 5,
+         "temperature": 30},
+        {"id": 6, "calculation": "malt", "volume": 22, "gravity": 14,
+         "malts": [["pilsener_malt", 0.8], ["munich_malt", 0.2]]},
+        {"id": 7, "calculation": "hops", "ibu": 40, "alpha": 5.5,
+         "volume": 22, "cooktime": 60, "gravity": 12},
+        {"id": 8, "calculation": "boil"},
+    ]
+
+    async def run():
+        service = Service(max_latency=0.01)
+        return await asyncio.gather(*(service.handle(r) for r in requests))
+
+    res = asyncio.run(run())
+    assert res[0]["plato"] == pytest.approx(12.0)
+    assert res[1]["sg"] == pytest.approx(1.048)
+    assert res[2]["abv"] == pytest.approx(3.0, abs=0.05)
+    assert "abv" in res[3] and res[3]["attenuation"] is None
+    assert res[4]["id"] == 5 and "range" in res[4]["error"]
+    assert res[5]["total"] == pytest.approx(5.44, abs=0.01)
+    assert res[6]["hops"] > 0
+    assert res[7] == {"id": 8, "error": "unknown calculation 'boil'"}
+
+
+def test_connection():
+    lines = [{"id": i, "calculation": "gravity", "gravity": 10 + i}
+             for i in range(20)]
+
+    async def run():
+        server = await asyncio.start_server(Service().connection,
+                                            "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for line in lines:
+                writer.write((json.dumps(line) + "\n").encode())
+            writer.write(b"no json\n")
+            writer.write_eof()
+            res = [json.loads(line) async for line in reader]
+            writer.close()
+        return res
+
+    res = asyncio.run(run())
+    assert [r["id"] for r in res] == list(range(20)) + [None]
+    assert "invalid request" in res[-1]["error"]
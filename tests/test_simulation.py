@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from beerpy.carbonate import saturation
+from beerpy.simulation import simulate
+from beerpy.units import GravityArray, SPECIFIC_GRAVITY
+
+
+def test_simulate():
+    res = simulate(og=[12.0, 14.0, 16.0], fg=2.5, volume=1000,
+                   setpoint=12.0, days=21, dt=600.0, cooling=2000.0,
+                   record_every=6)
+    assert res.plato.shape == (505, 3)
+    assert res.time[-1] == 21 * 86400
+    assert res.plato[0] == pytest.approx([11.905, 13.885, 15.865])
+    assert res.plato[-1] == pytest.approx(2.5, abs=0.1)
+    assert np.all(np.diff(res.plato, axis=0) <= 0)
+    # the cooling keeps the temperature around the setpoint
+    assert np.all(np.abs(res.temperature - 12.0) < 1.0)
+    assert res.cooling.max() == 2000.0
+    # the CO2 is dissolved up to the saturation
+    assert np.all(res.co2 <= saturation(res.temperature) + 1e-9)
+    assert res.co2[-1] == pytest.approx(saturation(res.temperature[-1]),
+                                        rel=0.05)
+
+
+def test_solvers():
+    kwargs = dict(og=GravityArray([1.048, 1.056], SPECIFIC_GRAVITY), fg=2.5,
+                  volume=500, setpoint=18.0, days=7, cooling=0.0,
+                  ambient=18.0)
+    rk4 = simulate(dt=600.0, **kwargs)
+    euler = simulate(dt=60.0, solver="euler", **kwargs)
+    assert rk4.plato[-1] == pytest.approx(euler.plato[-1], abs=0.05)
+    # without cooling the fermentation heats the tank
+    assert rk4.temperature.max() > 18.5
+    with pytest.raises(ValueError):
+        simulate(dt=60.0, solver="rk45", **kwargs)
+    with pytest.raises(ValueError, match="range"):
+        simulate(og=12.0, fg=-0.5, volume=500, setpoint=18.0, days=7)
+
+
+def test_clipped_co2_temperature():
+    res = simulate(og=12.0, fg=2.5, volume=100, setpoint=30.0, days=5,
+                   dt=600.0, ambient=30.0)
+    assert res.co2.max() == pytest.approx(float(saturation(22.0)))
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from beerpy import receipe
+from beerpy.receipe import PILSENER_MALT, MUNICH_MALT
+from beerpy.sweep import Receipe, Scenario, grid, sweep
+from beerpy.units import Gravity
+
+
+RECEIPE = Receipe([(PILSENER_MALT, 0.8), (MUNICH_MALT, 0.2)],
+                  [(30, 5.5, 60), (10, 4.0, 10)])
+
+
+def test_grid():
+    scenarios = grid([20, 100], [11, 12, 13], cooktime=[None, (70, 15)])
+    assert len(scenarios) == 12
+    assert scenarios[0] == Scenario(20, 11, 0.75, None)
+    assert scenarios[-1] == Scenario(100, 13, 0.75, (70, 15))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sweep(jobs):
+    scenarios = grid([20, 100], np.arange(10, 16), [0.7, 0.75],
+                     [None, (70, 15)])
+    progress = []
+    res = sweep(RECEIPE, scenarios, jobs=jobs, chunksize=5,
+                progress=lambda done, total: progress.append((done, total)))
+
+    assert res.scenarios == scenarios
+    assert res.malt_weights.shape == (48, 2)
+    assert res.hop_amounts.shape == (48, 2)
+    assert progress[-1] == (48, 48)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    for i, s in enumerate(scenarios):
+        total, weights = receipe.malt_composition(
+            s.volume, Gravity(s.gravity), RECEIPE.composition, s.efficiency)
+        assert res.total_weight[i] == pytest.approx(total, abs=0.01)
+        assert res.malt_weights[i] == pytest.approx([w for _, w in weights],
+                                                    abs=0.01)
+        cooktimes = s.cooktime or (60, 10)
+        for j, (ibu, alpha, _) in enumerate(RECEIPE.hops):
+            assert res.hop_amounts[i, j] == pytest.approx(receipe.hop_quantity(
+                ibu, alpha, s.volume, cooktimes[j], Gravity(s.gravity)))
+
+
+def test_sweep_empty():
+    res = sweep(RECEIPE, [], jobs=1)
+    assert res.malt_weights.shape == (0, 2)
+    assert res.hop_amounts.shape == (0, 2)
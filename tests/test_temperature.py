@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 import beerpy.units as units
 
@@ -17,3 +20,23 @@ def test_conversion():
     t = units.Temperature(68, units.FAHRENHEIT)
     assert t.fahrenheit == 68.0
     assert t.celsius == 20.0
+
+
+def test_immutable_and_hashable():
+    t = units.Temperature(20)
+    with pytest.raises(AttributeError):
+        t.celsius = 25
+    assert t == units.Temperature(20)
+    assert t != units.Temperature(20, units.FAHRENHEIT)
+    assert len({t, units.Temperature(20), units.Temperature(25)}) == 2
+
+
+def test_lazy_import():
+    code = ("import sys\n"
+            "from beerpy.units import Temperature, Concentration\n"
+            "assert Temperature(20).fahrenheit == 68.0\n"
+            "print(' '.join(m for m in ('numpy', 'scipy', 'pandas', "
+            "'beerpy.units.gravity') if m in sys.modules))\n")
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True)
+    assert out.stdout.strip() == ""
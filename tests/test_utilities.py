@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from beerpy import utilities
+from beerpy.utilities import load_table, read_table
+
+
+def test_load_table():
+    table = load_table("gravity.csv")
+    assert table.header == ("Plato", "SG")
+    assert len(table) == 80
+    assert table["Plato"][0] == 0.5
+    assert table["SG"][-1] == 1.179
+    assert load_table("gravity.csv") is table
+
+
+def test_read_table(tmpdir):
+    f = tmpdir.join("table.csv")
+    f.write("minutes,12.5,15\n9,5,4.8\n19,12,11.4\n")
+    table = read_table(str(f))
+    assert table.header == ("minutes", "12.5", "15")
+    assert list(table["15"]) == [4.8, 11.4]
+    with pytest.raises(ValueError):
+        table["20"]
+
+
+@pytest.fixture
+def data(tmpdir, monkeypatch):
+    tmpdir.join("table.csv").write("a,b\n1,2\n3,4\n")
+    monkeypatch.setattr(utilities, "datadir", lambda: str(tmpdir))
+    utilities.load_table.cache_clear()
+    utilities._manifest.cache_clear()
+    yield tmpdir
+    utilities.load_table.cache_clear()
+    utilities._manifest.cache_clear()
+
+
+def test_compile_tables(data):
+    utilities.compile_tables()
+    assert data.join("table.npy").check()
+    assert data.join("tables.json").check()
+
+    table = load_table("table.csv")
+    assert table.header == ("a", "b")
+    assert list(table["b"]) == [2, 4]
+    assert not table.data.flags.writeable
+
+
+def test_outdated_binary(data):
+    utilities.compile_tables()
+    # same size, the modification time is bumped explicitly as the clock
+    # may not advance between the writes
+    mtime = os.stat(str(data.join("table.csv"))).st_mtime_ns
+    data.join("table.csv").write("a,b\n1,2\n3,5\n")
+    os.utime(str(data.join("table.csv")), ns=(mtime, mtime + 10 ** 9))
+    with pytest.warns(UserWarning):
+        table = load_table("table.csv")
+    assert list(table["b"]) == [2, 5]
+
+
+def test_current_binary(data, monkeypatch):
+    os.utime(str(data.join("table.csv")), ns=(0, 10 ** 9))
+    utilities.compile_tables()
+    # the source is not read if its size and modification time match
+    with monkeypatch.context() as m:
+        m.setattr(utilities, "checksum", None)
+        assert list(load_table("table.csv")["b"]) == [2, 4]
+
+    # a new modification time alone falls back to the checksum
+    utilities.load_table.cache_clear()
+    data.join("table.csv").setmtime(0)
+    table = load_table("table.csv")
+    assert table.data.base is not None  # memory-mapped, not parsed
+
+
+def test_derived_binary(data):
+    data.join("derived.npy").write("")
+    assert not utilities.is_binary_current("derived.npy")
+    utilities.record_binary("derived.npy", "table.csv")
+    assert utilities.is_binary_current("derived.npy")
+
+    # compiling the tables keeps the entry
+    utilities.compile_tables()
+    assert utilities.is_binary_current("derived.npy")
+    data.join("table.csv").write("a,b\n1,2\n3,4\n5,6\n")
+    assert not utilities.is_binary_current("derived.npy")
+
+
+def test_recently_modified_source(data, monkeypatch):
+    # a source modified just before it was compiled is checked by checksum
+    utilities.compile_tables()
+    calls = []
+    checksum = utilities.checksum
+    monkeypatch.setattr(utilities, "checksum",
+                        lambda f: calls.append(f) or checksum(f))
+    assert list(load_table("table.csv")["b"]) == [2, 4]
+    assert len(calls) == 1
+
+
+def test_data_checksum(data):
+    before = utilities.data_checksum()
+    data.join("table.csv").write("a,b\n1,2\n3,5\n")
+    assert utilities.data_checksum() != before
+
+
+def test_chunked():
+    assert list(utilities.chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(utilities.chunked([], 2)) == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_ordered_map(jobs):
+    assert list(utilities.ordered_map(abs, range(0, -20, -1), jobs)) == \
+        list(range(20))